@@ -11,11 +11,15 @@ Currently 009 fields live only on Agent (sex_transit_config). ReplayConfig is fr
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any
 
-from hnh.identity.schema import NUM_PARAMETERS
+import orjson
+import xxhash
+
+from hnh.identity.layout import NUM_PARAMETERS
 from hnh.identity.sensitivity import compute_sensitivity
 from hnh.lifecycle.fatigue import global_sensitivity, resilience_from_base_vector
 from hnh.config.replay_config import ReplayConfig
@@ -23,6 +27,16 @@ from hnh.config.replay_config import ReplayConfig
 # Default ReplayConfig when config=None
 _DEFAULT_CONFIG = ReplayConfig(global_max_delta=0.08, shock_threshold=0.5, shock_multiplier=1.0)
 
+# Checkpoint layout (little-endian): magic | binding xxh3_128 | flags | current_vector (32 f64)
+# | [lifecycle: F, W, sum_v, sum_burn (f64), count_days (i64), state code (u8)] | xxh3_64 of all preceding bytes
+_CHECKPOINT_MAGIC = b"HNHAGCK1"
+_CHECKPOINT_HEAD = struct.Struct(f"<8s16sB{NUM_PARAMETERS}d")
+_CHECKPOINT_LIFECYCLE = struct.Struct("<4dqB")
+_CHECKPOINT_TAIL = struct.Struct("<Q")
+_CKPT_LIFECYCLE = 1
+_CKPT_STEPPED = 2
+_LIFECYCLE_STATE_CODES = ("ALIVE", "DISABLED", "TRANSCENDED")
+
 
 def _build_identity_config_from_natal(
     natal: Any, birth_data: dict[str, Any], config: Any, identity_hash_digest: bytes | None = None
@@ -194,6 +208,90 @@ class Agent:
         self._last_step_result = result
         return result
 
+    def _checkpoint_binding(self) -> bytes:
+        """xxh3_128 of what a checkpoint is valid for: base/sensitivity vectors, config, 009 config."""
+        from hnh.config.replay_config import compute_configuration_hash
+
+        stc = self._sex_transit_config
+        blob = orjson.dumps(
+            {
+                "base_vector": self.behavior.base_vector,
+                "sensitivity_vector": tuple(self._identity_config.sensitivity_vector),
+                "configuration_hash": compute_configuration_hash(self._config),
+                "sex_transit": None if stc is None else [
+                    getattr(stc, "sex_transit_mode", "off"),
+                    getattr(stc, "sex_transit_beta", 0.05),
+                    getattr(stc, "sex_transit_mcap", 0.10),
+                    getattr(stc, "sex_transit_Wdyn_profile", "v1"),
+                ],
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return xxhash.xxh3_128(blob, seed=0).digest()
+
+    def checkpoint(self) -> bytes:
+        """
+        Compact snapshot of the evolving state: behavior.current_vector and (if enabled) lifecycle
+        F, W, state, sum_v, sum_burn, count_days. Floats stored as raw f64, so restore() continues
+        bit-identically. Ends with an xxh3_64 integrity hash; bound to this agent's identity and config.
+        """
+        flags = (_CKPT_LIFECYCLE if self.lifecycle is not None else 0) | (
+            _CKPT_STEPPED if self._last_step_result is not None else 0
+        )
+        out = _CHECKPOINT_HEAD.pack(
+            _CHECKPOINT_MAGIC, self._checkpoint_binding(), flags, *self.behavior.current_vector
+        )
+        if self.lifecycle is not None:
+            st = self.lifecycle.step_state()
+            out += _CHECKPOINT_LIFECYCLE.pack(
+                st.F, st.W, st.sum_v, st.sum_burn, st.count_days, _LIFECYCLE_STATE_CODES.index(st.state.value)
+            )
+        return out + _CHECKPOINT_TAIL.pack(xxhash.xxh3_64_intdigest(out, seed=0))
+
+    def restore(self, checkpoint: bytes) -> None:
+        """
+        Restore state from checkpoint() output. The agent must be built with the same birth_data
+        (identity), config, sex_transit_config and lifecycle flag. Raises ValueError on a corrupt,
+        truncated or foreign checkpoint; the agent is unchanged in that case.
+        """
+        head, tail = _CHECKPOINT_HEAD.size, _CHECKPOINT_TAIL.size
+        if len(checkpoint) < head + tail:
+            raise ValueError("Agent checkpoint truncated")
+        body = checkpoint[:-tail]
+        (digest,) = _CHECKPOINT_TAIL.unpack(checkpoint[-tail:])
+        if xxhash.xxh3_64_intdigest(body, seed=0) != digest:
+            raise ValueError("Agent checkpoint integrity hash mismatch")
+        magic, binding, flags, *current = _CHECKPOINT_HEAD.unpack_from(body)
+        if magic != _CHECKPOINT_MAGIC:
+            raise ValueError("Not an Agent checkpoint")
+        if binding != self._checkpoint_binding():
+            raise ValueError("Agent checkpoint belongs to a different identity or configuration")
+        has_lifecycle = bool(flags & _CKPT_LIFECYCLE)
+        if has_lifecycle != (self.lifecycle is not None):
+            raise ValueError("Agent checkpoint lifecycle mode does not match this agent")
+        expected = head + (_CHECKPOINT_LIFECYCLE.size if has_lifecycle else 0)
+        if len(body) != expected:
+            raise ValueError("Agent checkpoint has unexpected length")
+        lifecycle_state = None
+        if has_lifecycle:
+            from hnh.lifecycle.engine import LifecycleState, LifecycleStepState
+
+            F, W, sum_v, sum_burn, count_days, code = _CHECKPOINT_LIFECYCLE.unpack_from(body, head)
+            if code >= len(_LIFECYCLE_STATE_CODES):
+                raise ValueError(f"Agent checkpoint has unknown lifecycle state code {code}")
+            lifecycle_state = LifecycleStepState(
+                F=F, W=W, state=LifecycleState(_LIFECYCLE_STATE_CODES[code]),
+                sum_v=sum_v, sum_burn=sum_burn, count_days=count_days,
+            )
+        self.behavior.restore_current_vector(tuple(current))
+        if lifecycle_state is not None:
+            assert self.lifecycle is not None  # has_lifecycle matched self.lifecycle above
+            self.lifecycle.restore_step_state(lifecycle_state)
+        self._last_step_result = StepResult(
+            sex=getattr(self._identity_config, "sex", None),
+            sex_polarity_E=getattr(self._identity_config, "sex_polarity_E", 0.0),
+        ) if flags & _CKPT_STEPPED else None
+
     def zodiac_expression(self) -> Any:
         """Lazy ZodiacExpression (read-only view over natal)."""
         if self._zodiac is None:
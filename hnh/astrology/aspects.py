@@ -6,8 +6,12 @@ Config-driven orbs; no hardcoded magic constants.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 # Major aspects: (name, angle_degrees)
 MAJOR_ASPECTS = [
     ("Conjunction", 0.0),
@@ -73,6 +77,121 @@ def angular_separation(lon1: float, lon2: float) -> float:
     return diff
 
 
+def angular_separation_array(lon_a: np.ndarray, lon_b: np.ndarray) -> np.ndarray:
+    """Векторный angular_separation: broadcast lon_a и lon_b, результат в диапазоне 0–180."""
+    diff = np.abs(np.mod(lon_a, 360.0) - np.mod(lon_b, 360.0))
+    separation: np.ndarray = np.where(diff > 180.0, 360.0 - diff, diff)
+    return separation
+
+
+def _longitudes_array(lons: npt.ArrayLike) -> np.ndarray:
+    """
+    Долготы как float-массив. Нечисловые значения (None, строки) — TypeError, как в скалярном
+    angular_separation, а не молчаливое NaN / преобразование строки в число.
+    """
+    arr = np.asarray(lons)
+    if arr.dtype.kind not in "biuf":
+        raise TypeError(f"Longitudes must be numeric, got dtype {arr.dtype}")
+    return arr.astype(float, copy=False)
+
+
+# Точные углы MAJOR_ASPECTS (в том же порядке) и код аспекта = индекс в MAJOR_ASPECTS
+_ASPECT_ANGLES: np.ndarray = np.array([angle for _, angle in MAJOR_ASPECTS], dtype=float)
+ASPECT_CODES: dict[str, int] = {name: idx for idx, (name, _) in enumerate(MAJOR_ASPECTS)}
+
+# Компактная запись найденного аспекта: индексы планет в наборах A/B, код аспекта, сепарация (без округления)
+ASPECT_HIT_DTYPE = np.dtype([
+    ("planet1", np.int16),
+    ("planet2", np.int16),
+    ("aspect", np.int8),
+    ("separation", np.float64),
+])
+
+
+@lru_cache(maxsize=32)
+def _orbs_array(orb_config: OrbConfig) -> np.ndarray:
+    """Орбы в порядке MAJOR_ASPECTS как массив (кэш по замороженному OrbConfig)."""
+    return np.array(orb_config.orbs_tuple(), dtype=float)
+
+
+def aspect_masks(separation: np.ndarray, orb_config: OrbConfig | None = None) -> np.ndarray:
+    """
+    Маски попадания в орб для всех MAJOR_ASPECTS: форма separation.shape + (5,), порядок MAJOR_ASPECTS.
+    Те же правила, что в detect_aspects / aspects_between.
+    """
+    orbs = _orbs_array(orb_config or OrbConfig())
+    masks: np.ndarray = np.abs(separation[..., None] - _ASPECT_ANGLES) <= orbs
+    masks[..., 0] |= (360.0 - separation) <= orbs[0]  # Соединение: близко к 0° или к 360°
+    return masks
+
+
+def aspect_deviation(separation: np.ndarray) -> np.ndarray:
+    """
+    Отклонение от точного угла для всех MAJOR_ASPECTS: форма separation.shape + (5,).
+    Соединение: min(sep, 360 - sep); остальные: |sep - angle|.
+    """
+    dev: np.ndarray = np.abs(separation[..., None] - _ASPECT_ANGLES)
+    dev[..., 0] = np.minimum(separation, 360.0 - separation)
+    return dev
+
+
+def _hits_from_masks(separation: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Структурированный массив ASPECT_HIT_DTYPE из масок (A, B, 5); порядок строк — как во вложенных циклах."""
+    i, j, k = np.nonzero(masks)
+    hits = np.empty(len(i), dtype=ASPECT_HIT_DTYPE)
+    hits["planet1"] = i
+    hits["planet2"] = j
+    hits["aspect"] = k
+    hits["separation"] = separation[i, j]
+    return hits
+
+
+def aspects_between_array(
+    lons_a: npt.ArrayLike,
+    lons_b: npt.ArrayLike,
+    orb_config: OrbConfig | None = None,
+) -> np.ndarray:
+    """
+    Векторный поиск аспектов между наборами долгот A и B: матрица сепараций A×B и пять орб-тестов
+    как операции над массивами. Возвращает массив ASPECT_HIT_DTYPE (индексы в A/B, код, сепарация).
+    """
+    arr_a = _longitudes_array(lons_a)
+    arr_b = _longitudes_array(lons_b)
+    separation = angular_separation_array(arr_a[:, None], arr_b[None, :])
+    return _hits_from_masks(separation, aspect_masks(separation, orb_config))
+
+
+def detect_aspects_array(lons: npt.ArrayLike, orb_config: OrbConfig | None = None) -> np.ndarray:
+    """Как aspects_between_array(lons, lons), но только уникальные пары i < j (натальная карта)."""
+    arr = _longitudes_array(lons)
+    separation = angular_separation_array(arr[:, None], arr[None, :])
+    masks = aspect_masks(separation, orb_config)
+    masks &= np.triu(np.ones(separation.shape, dtype=bool), k=1)[..., None]
+    return _hits_from_masks(separation, masks)
+
+
+def aspect_hits_to_dicts(
+    hits: np.ndarray,
+    planets_a: list[str],
+    planets_b: list[str],
+) -> list[dict[str, Any]]:
+    """
+    Адаптер: массив ASPECT_HIT_DTYPE → прежний список словарей
+    (planet1, planet2, aspect, angle, separation округлена до 6 знаков, within_orb).
+    """
+    return [
+        {
+            "planet1": planets_a[i],
+            "planet2": planets_b[j],
+            "aspect": MAJOR_ASPECTS[k][0],
+            "angle": MAJOR_ASPECTS[k][1],
+            "separation": round(sep, 6),
+            "within_orb": True,
+        }
+        for i, j, k, sep in hits.tolist()
+    ]
+
+
 def detect_aspects(
     positions: list[dict[str, Any]],
     orb_config: OrbConfig | None = None,
@@ -81,31 +200,11 @@ def detect_aspects(
     Находит мажорные аспекты между всеми парами позиций (например, натальная карта).
     Каждая позиция — dict с ключами "planet" и "longitude".
     Возвращает список словарей: planet1, planet2, aspect, angle, separation, within_orb.
+    Считается через detect_aspects_array; словари строятся только для найденных аспектов.
     """
-    orb_config = orb_config or OrbConfig()
-    orbs = orb_config.orbs_tuple()  # один раз на весь вызов, доступ по индексу
-    aspects_found: list[dict[str, Any]] = []
-    for i, p1 in enumerate(positions):
-        lon1 = p1["longitude"]
-        planet1 = p1["planet"]
-        for p2 in positions[i + 1 :]:  # noqa: E203  # только уникальные пары
-            sep = angular_separation(lon1, p2["longitude"])
-            for idx, (aspect_name, angle_deg) in enumerate(MAJOR_ASPECTS):
-                orb = orbs[idx]
-                if angle_deg == 0:  # Соединение: близко к 0° или к 360°
-                    within = sep <= orb or (360.0 - sep) <= orb
-                else:
-                    within = abs(sep - angle_deg) <= orb
-                if within:
-                    aspects_found.append({
-                        "planet1": planet1,
-                        "planet2": p2["planet"],
-                        "aspect": aspect_name,
-                        "angle": angle_deg,
-                        "separation": round(sep, 6),
-                        "within_orb": True,
-                    })
-    return aspects_found
+    names = [p["planet"] for p in positions]
+    hits = detect_aspects_array([p["longitude"] for p in positions], orb_config)
+    return aspect_hits_to_dicts(hits, names, names)
 
 
 def aspects_between(
@@ -116,28 +215,14 @@ def aspects_between(
     """
     Находит мажорные аспекты между двумя наборами позиций (например, транзиты и натал).
     Перебирает все пары (p из A, q из B). Формат позиций и результат — как у detect_aspects.
+    Считается через aspects_between_array (матрица A×B, без вложенного цикла по аспектам).
     """
-    orb_config = orb_config or OrbConfig()
-    orbs = orb_config.orbs_tuple()
-    result: list[dict[str, Any]] = []
-    for p1 in positions_a:
-        lon1 = p1["longitude"]
-        planet1 = p1["planet"]
-        for p2 in positions_b:
-            sep = angular_separation(lon1, p2["longitude"])
-            for idx, (aspect_name, angle_deg) in enumerate(MAJOR_ASPECTS):
-                orb = orbs[idx]
-                if angle_deg == 0:  # Соединение
-                    within = sep <= orb or (360.0 - sep) <= orb
-                else:
-                    within = abs(sep - angle_deg) <= orb
-                if within:
-                    result.append({
-                        "planet1": planet1,
-                        "planet2": p2["planet"],
-                        "aspect": aspect_name,
-                        "angle": angle_deg,
-                        "separation": round(sep, 6),
-                        "within_orb": True,
-                    })
-    return result
+    hits = aspects_between_array(
+        [p["longitude"] for p in positions_a],
+        [p["longitude"] for p in positions_b],
+        orb_config,
+    )
+    # Missing planet name → "" (as NatalChart.from_birth_data reads positions)
+    return aspect_hits_to_dicts(
+        hits, [p.get("planet", "") for p in positions_a], [p.get("planet", "") for p in positions_b]
+    )
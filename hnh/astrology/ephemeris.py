@@ -8,6 +8,9 @@ All times in UTC; datetime normalization and location validation.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any
@@ -22,6 +25,29 @@ try:
 except ImportError:
     swe = None  # type: ignore[assignment]
 
+# swe входит в публичный API: houses / core.natal используют этот же, уже настроенный модуль
+__all__ = [
+    "swe",
+    "PLANETS_NATAL",
+    "LAT_MIN",
+    "LAT_MAX",
+    "LON_MIN",
+    "LON_MAX",
+    "TRANSIT_CACHE_MAXSIZE",
+    "TRANSIT_CACHE_JD_DECIMALS",
+    "get_ephe_path",
+    "reopen_ephemeris",
+    "check_ephe_available",
+    "normalize_birth_datetime_utc",
+    "validate_location",
+    "datetime_to_julian_utc",
+    "compute_positions",
+    "TransitCacheInfo",
+    "TransitPositionCache",
+    "get_transit_cache",
+    "compute_transit_positions",
+]
+
 # Standard planet IDs for natal (Spec 004: 10 planets)
 # Swiss Ephemeris: 0=Sun .. 6=Saturn, 7=Uranus, 8=Neptune, 9=Pluto
 PLANETS_NATAL = [
@@ -41,12 +67,27 @@ PLANETS_NATAL = [
 LAT_MIN, LAT_MAX = -90.0, 90.0
 LON_MIN, LON_MAX = -180.0, 180.0
 
+# Транзитный кэш: максимум записей (LRU) и точность ключа JD (знаков после запятой).
+# 1e-9 суток ≈ 86 мкс — ниже точности datetime_to_julian_utc для типичных слотов (06:00/12:00/18:00).
+TRANSIT_CACHE_MAXSIZE: int = 4096
+TRANSIT_CACHE_JD_DECIMALS: int = 9
+
 
 def get_ephe_path() -> Path:
     """Возвращает путь к каталогу эфемерид (ephe в корне репозитория)."""
     return _EPHE_DIR
 
 
+def reopen_ephemeris() -> None:
+    """
+    Закрывает и заново открывает файлы эфемерид в текущем процессе. Нужен в дочерних процессах
+    после fork: открытые родителем дескрипторы .se1 разделяют смещение, и Swiss Ephemeris читает мусор.
+    """
+    if swe is not None:
+        swe.close()
+        swe.set_ephe_path(_EPHE_PATH)
+
+
 def check_ephe_available() -> tuple[bool, bool]:
     """
     Проверяет наличие каталога эфемерид и файлов расширения (.se1).
@@ -107,3 +148,131 @@ def compute_positions(jd_ut: float) -> list[dict[str, Any]]:
         xx, _ = swe.calc_ut(jd_ut, pid)
         result[i] = {"planet": name, "longitude": float(xx[0])}
     return result
+
+
+def _calc_longitudes(jd_ut: float) -> tuple[float, ...]:
+    """Долготы 10 планет (порядок PLANETS_NATAL) на юлианский день UT."""
+    if swe is None:
+        raise RuntimeError("pyswisseph is not installed; install with pip install hnh[astrology]")
+    return tuple(float(swe.calc_ut(jd_ut, pid)[0][0]) for _, pid in PLANETS_NATAL)
+
+
+@dataclass(frozen=True)
+class TransitCacheInfo:
+    """Статистика транзитного кэша: попадания, промахи, текущий и максимальный размер, попадания в таблицы."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    table_hits: int = 0
+
+
+class TransitPositionCache:
+    """
+    Ограниченный LRU-кэш транзитных долгот, ключ — JD, округлённый до TRANSIT_CACHE_JD_DECIMALS.
+    Транзитные позиции зависят только от момента времени, поэтому один кэш общий для всех
+    TransitEngine процесса. Позиции считаются в точке ключа, так что результат не зависит от
+    порядка обращений (детерминизм replay). Потокобезопасен.
+    Предрасчитанные таблицы (hnh.astrology.ephemeris_table) проверяются до LRU.
+    """
+
+    __slots__ = ("_maxsize", "_data", "_lock", "_hits", "_misses", "_tables", "_table_hits")
+
+    def __init__(self, maxsize: int = TRANSIT_CACHE_MAXSIZE) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[float, tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._tables: tuple[Any, ...] = ()
+        self._table_hits = 0
+
+    @staticmethod
+    def key(jd_ut: float) -> float:
+        """Ключ кэша для юлианского дня (округление до TRANSIT_CACHE_JD_DECIMALS)."""
+        return round(jd_ut, TRANSIT_CACHE_JD_DECIMALS)
+
+    def longitudes(self, jd_ut: float) -> tuple[float, ...]:
+        """Долготы 10 планет на jd_ut (из кэша или через Swiss Ephemeris)."""
+        k = self.key(jd_ut)
+        for table in self._tables:
+            table_lons: tuple[float, ...] | None = table.lookup(k)
+            if table_lons is not None:
+                with self._lock:
+                    self._table_hits += 1
+                return table_lons
+        with self._lock:
+            cached = self._data.get(k)
+            if cached is not None:
+                self._data.move_to_end(k)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        lons = _calc_longitudes(k)
+        if self._maxsize > 0:
+            with self._lock:
+                self._data[k] = lons
+                self._data.move_to_end(k)
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+        return lons
+
+    def positions(self, jd_ut: float) -> list[dict[str, Any]]:
+        """Как compute_positions, но через кэш. Каждый вызов возвращает новые dict (кэш не мутируется)."""
+        lons = self.longitudes(jd_ut)
+        return [{"planet": name, "longitude": lons[i]} for i, (name, _) in enumerate(PLANETS_NATAL)]
+
+    def info(self) -> TransitCacheInfo:
+        """Снимок счётчиков (hits, misses, maxsize, currsize)."""
+        with self._lock:
+            return TransitCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._data), self._table_hits
+            )
+
+    def clear(self) -> None:
+        """Очищает записи и сбрасывает счётчики (подключённые таблицы остаются)."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._table_hits = 0
+
+    def attach_table(self, table: Any) -> None:
+        """Подключает таблицу (объект с lookup(jd) -> tuple | None). Повторное подключение — no-op."""
+        with self._lock:
+            if table not in self._tables:
+                self._tables = self._tables + (table,)
+
+    def detach_table(self, table: Any) -> None:
+        """Отключает таблицу; если не подключена — no-op."""
+        with self._lock:
+            self._tables = tuple(t for t in self._tables if t is not table)
+
+    def resize(self, maxsize: int) -> None:
+        """Меняет максимальный размер; лишние (самые старые) записи вытесняются."""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+
+# Общий для процесса кэш транзитов (все TransitEngine / compute_transit_signature)
+_TRANSIT_CACHE = TransitPositionCache()
+
+
+def get_transit_cache() -> TransitPositionCache:
+    """Возвращает общий для процесса транзитный кэш (для статистики, clear, resize)."""
+    return _TRANSIT_CACHE
+
+
+def compute_transit_positions(jd_ut: float) -> list[dict[str, Any]]:
+    """
+    Транзитные позиции 10 планет через общий кэш процесса.
+    Формат как у compute_positions; N агентов на одну дату платят за одно вычисление эфемерид.
+    """
+    return _TRANSIT_CACHE.positions(jd_ut)
@@ -0,0 +1,183 @@
+"""
+Precomputed transit ephemeris tables: 10 planet longitudes on a fixed time grid, stored as float64.
+File: 64-byte header + rows [jd_key, lon_Sun .. lon_Pluto] (little-endian float64), read via numpy.memmap.
+install_table() attaches a table to the shared transit cache, so compute_transit_signature reads
+covered instants from the table (no ephemeris call). Values are identical to the live path
+(computed at TransitPositionCache.key(jd)), so replay output does not depend on whether a table is used.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import xxhash
+
+from hnh.astrology import ephemeris as eph
+
+TABLE_MAGIC: bytes = b"HNHEPHT\x00"
+TABLE_VERSION: int = 1
+# magic, version, n_planets, start_jd, step_days, n_rows, data xxh3_64; padded to HEADER_SIZE
+_HEADER_STRUCT = struct.Struct("<8sIIddQQ")
+HEADER_SIZE: int = 64
+N_PLANETS: int = len(eph.PLANETS_NATAL)
+ROW_WIDTH: int = 1 + N_PLANETS  # jd_key + longitudes
+
+# Default cadence: two slots per day (06:00 and 18:00 UTC), as in the 102-year life simulations
+DEFAULT_STEP_HOURS: float = 12.0
+_BUILD_CHUNK_ROWS: int = 4096
+
+
+def _to_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def build_ephemeris_table(
+    path: str | Path,
+    start: datetime,
+    end: datetime,
+    step_hours: float = DEFAULT_STEP_HOURS,
+) -> EphemerisTable:
+    """
+    Precompute longitudes for every instant start + k*step_hours ≤ end and write the table file.
+    Instants are converted with datetime_to_julian_utc (same path as transits). Atomic write (tmp + rename).
+    Returns the opened table.
+    """
+    if step_hours <= 0:
+        raise ValueError(f"step_hours must be > 0, got {step_hours}")
+    start_utc = _to_utc(start)
+    end_utc = _to_utc(end)
+    if end_utc < start_utc:
+        raise ValueError("end must not be earlier than start")
+    step = timedelta(hours=step_hours)
+    n_rows = int((end_utc - start_utc) / step) + 1
+    start_jd = eph.TransitPositionCache.key(eph.datetime_to_julian_utc(start_utc))
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    digest = xxhash.xxh3_64(seed=0)
+    with open(tmp, "wb") as f:
+        f.write(b"\x00" * HEADER_SIZE)
+        chunk = np.empty((_BUILD_CHUNK_ROWS, ROW_WIDTH), dtype="<f8")
+        for lo in range(0, n_rows, _BUILD_CHUNK_ROWS):
+            hi = min(n_rows, lo + _BUILD_CHUNK_ROWS)
+            for i in range(lo, hi):
+                key = eph.TransitPositionCache.key(eph.datetime_to_julian_utc(start_utc + i * step))
+                row = chunk[i - lo]
+                row[0] = key
+                row[1:] = eph._calc_longitudes(key)
+            blob = chunk[: hi - lo].tobytes()
+            digest.update(blob)
+            f.write(blob)
+        header = _HEADER_STRUCT.pack(
+            TABLE_MAGIC, TABLE_VERSION, N_PLANETS, start_jd, step_hours / 24.0, n_rows, digest.intdigest()
+        )
+        f.seek(0)
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+    os.replace(tmp, path)
+    return EphemerisTable.open(path)
+
+
+class EphemerisTable:
+    """
+    Read-only, memory-mapped ephemeris table. lookup(jd) → 10 longitudes or None when jd is not a
+    grid instant of this table. Rows are paged in by the OS on demand; many processes share the pages.
+    """
+
+    __slots__ = ("path", "start_jd", "step_days", "n_rows", "_digest", "_data")
+
+    def __init__(
+        self,
+        path: Path,
+        start_jd: float,
+        step_days: float,
+        n_rows: int,
+        digest: int,
+        data: np.ndarray,
+    ) -> None:
+        self.path = path
+        self.start_jd = start_jd
+        self.step_days = step_days
+        self.n_rows = n_rows
+        self._digest = digest
+        self._data = data
+
+    @classmethod
+    def open(cls, path: str | Path) -> EphemerisTable:
+        """Open a table file. Raises ValueError on bad magic/version/planet count or truncated data."""
+        path = Path(path)
+        with open(path, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+        if len(raw) < HEADER_SIZE:
+            raise ValueError(f"Ephemeris table header truncated: {path}")
+        magic, version, n_planets, start_jd, step_days, n_rows, digest = _HEADER_STRUCT.unpack_from(raw)
+        if magic != TABLE_MAGIC:
+            raise ValueError(f"Not an ephemeris table: {path}")
+        if version != TABLE_VERSION:
+            raise ValueError(f"Unsupported ephemeris table version {version}, expected {TABLE_VERSION}")
+        if n_planets != N_PLANETS:
+            raise ValueError(f"Ephemeris table has {n_planets} planets, expected {N_PLANETS}")
+        expected_size = HEADER_SIZE + n_rows * ROW_WIDTH * 8
+        if path.stat().st_size != expected_size:
+            raise ValueError(f"Ephemeris table size mismatch: {path}")
+        data = np.memmap(path, dtype="<f8", mode="r", offset=HEADER_SIZE, shape=(n_rows, ROW_WIDTH))
+        return cls(path, start_jd, step_days, n_rows, digest, data)
+
+    @property
+    def end_jd(self) -> float:
+        """JD key of the last row."""
+        return float(self._data[-1, 0]) if self.n_rows else self.start_jd
+
+    def covers(self, jd_ut: float) -> bool:
+        """True if jd_ut is a grid instant stored in this table."""
+        return self._row_index(eph.TransitPositionCache.key(jd_ut)) is not None
+
+    def _row_index(self, key: float) -> int | None:
+        idx = round((key - self.start_jd) / self.step_days)
+        if 0 <= idx < self.n_rows and self._data[idx, 0] == key:
+            return idx
+        return None
+
+    def lookup(self, jd_ut: float) -> tuple[float, ...] | None:
+        """Longitudes (PLANETS_NATAL order) for jd_ut, or None if not covered."""
+        idx = self._row_index(eph.TransitPositionCache.key(jd_ut))
+        if idx is None:
+            return None
+        return tuple(self._data[idx, 1:].tolist())
+
+    def longitudes_block(self) -> np.ndarray:
+        """Whole table as (n_rows, 10) read-only view of longitudes (for batch consumers)."""
+        return self._data[:, 1:]
+
+    def jd_keys(self) -> np.ndarray:
+        """JD keys of all rows (n_rows,)."""
+        return self._data[:, 0]
+
+    def verify(self) -> bool:
+        """Recompute xxh3_64 of the data section and compare with the header digest."""
+        digest = xxhash.xxh3_64(seed=0)
+        for lo in range(0, self.n_rows, _BUILD_CHUNK_ROWS):
+            digest.update(self._data[lo : lo + _BUILD_CHUNK_ROWS].tobytes())
+        return digest.intdigest() == self._digest
+
+
+def install_table(table: EphemerisTable, cache: eph.TransitPositionCache | None = None) -> None:
+    """Attach table to the transit cache (default: shared process cache). Idempotent."""
+    (cache or eph.get_transit_cache()).attach_table(table)
+
+
+def uninstall_table(table: EphemerisTable, cache: eph.TransitPositionCache | None = None) -> None:
+    """Detach table from the transit cache. No-op if not attached."""
+    (cache or eph.get_transit_cache()).detach_table(table)
+
+
+def load_ephemeris_table(path: str | Path, install: bool = True) -> EphemerisTable:
+    """Open a table file and (by default) install it into the shared transit cache."""
+    table = EphemerisTable.open(path)
+    if install:
+        install_table(table)
+    return table
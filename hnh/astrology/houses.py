@@ -5,16 +5,10 @@ Default system Placidus; angular strength from house only (contract angular-stre
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any
 
-_EPHE_PATH = str(Path(__file__).resolve().parent.parent.parent / "ephe")
-
-try:
-    import swisseph as swe
-    swe.set_ephe_path(_EPHE_PATH)
-except ImportError:
-    swe = None  # type: ignore[assignment]
+# Swiss Ephemeris is imported and pointed at the ephe directory once, in hnh.astrology.ephemeris
+from hnh.astrology.ephemeris import swe
 
 # Contract 004 angular-strength: house 1..12 → [0, 1]
 # Angular (1,4,7,10)=1.0, Succedent (2,5,8,11)=0.6, Cadent (3,6,9,12)=0.3
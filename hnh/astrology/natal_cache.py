@@ -0,0 +1,212 @@
+"""
+Кэш натальных карт (Spec 006): ключ — xxh3_128 канонических данных рождения.
+Канонический вид содержит только поля, от которых зависит NatalChart (вариант A: момент в UTC, lat, lon;
+вариант B: positions, aspects), поэтому sex / sex_mode и прочие поля не дают промаха: агенты male/female
+для одних данных рождения делят одну карту. Ограниченный LRU в памяти, опционально — каталог на диске
+(один файл orjson на карту), чтобы повторные запуски не пересчитывали эфемериды, дома и аспекты.
+Карты неизменяемы; to_natal_data() общих карт только читается.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import orjson
+import xxhash
+
+from hnh.astrology.aspect_model import aspect_from_dict
+from hnh.astrology.natal_chart import NatalChart
+from hnh.astrology.planet import Planet
+
+NATAL_CACHE_MAXSIZE: int = 1024
+_DISK_FORMAT_VERSION = 1
+
+
+def canonical_birth_data(birth_data: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Поля birth_data, определяющие NatalChart, в нормализованном виде (как их читает _parse_birth_data).
+    None — данные некорректны для варианта A (ошибку выдаст построение карты, не кэш).
+    """
+    if "positions" in birth_data:
+        positions = birth_data["positions"]
+        if isinstance(positions, dict) or not hasattr(positions, "__iter__"):
+            positions = []
+        return {
+            "positions": [
+                [p.get("planet", ""), float(p.get("longitude", 0)), p.get("house")] for p in positions
+            ],
+            "aspects": birth_data.get("aspects") or [],
+        }
+    try:
+        dt = birth_data.get("datetime_utc")
+        if isinstance(dt, str):
+            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+        if not isinstance(dt, datetime):
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return {
+            "datetime_utc": dt.astimezone(timezone.utc).isoformat(),
+            "lat": float(birth_data["lat"]),
+            "lon": float(birth_data["lon"]),
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def birth_data_digest(birth_data: dict[str, Any]) -> bytes | None:
+    """xxh3_128 канонических данных рождения (orjson, sort keys); None — карту не кэшировать."""
+    canonical = canonical_birth_data(birth_data)
+    if canonical is None:
+        return None
+    try:
+        blob = orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    return xxhash.xxh3_128(blob).digest()
+
+
+@dataclass(frozen=True)
+class NatalCacheInfo:
+    """Статистика кэша натальных карт: попадания в памяти и на диске, промахи, размеры."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class NatalChartCache:
+    """
+    Ограниченный LRU-кэш NatalChart по birth_data_digest. Потокобезопасен; карта строится вне блокировки.
+    directory: каталог для сохранения карт между процессами (None — только память).
+    Повреждённый или чужой файл считается промахом и перезаписывается.
+    """
+
+    __slots__ = ("_maxsize", "_data", "_lock", "_hits", "_disk_hits", "_misses", "_directory")
+
+    def __init__(self, maxsize: int = NATAL_CACHE_MAXSIZE, directory: str | Path | None = None) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[bytes, NatalChart] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._directory = Path(directory) if directory is not None else None
+
+    @property
+    def directory(self) -> Path | None:
+        return self._directory
+
+    def set_directory(self, directory: str | Path | None) -> None:
+        """Включает (каталог) или выключает (None) сохранение на диск."""
+        with self._lock:
+            self._directory = Path(directory) if directory is not None else None
+
+    def get_or_build(
+        self, birth_data: dict[str, Any], build: Callable[[dict[str, Any]], NatalChart]
+    ) -> NatalChart:
+        """Карта из памяти, с диска или build(birth_data) (результат кэшируется)."""
+        digest = birth_data_digest(birth_data)
+        if digest is None:
+            return build(birth_data)
+        with self._lock:
+            chart = self._data.get(digest)
+            if chart is not None:
+                self._data.move_to_end(digest)
+                self._hits += 1
+                return chart
+            directory = self._directory
+        chart = self._load(directory, digest) if directory is not None else None
+        if chart is not None:
+            with self._lock:
+                self._disk_hits += 1
+        else:
+            chart = build(birth_data)
+            with self._lock:
+                self._misses += 1
+            if directory is not None:
+                self._save(directory, digest, chart)
+        if self._maxsize > 0:
+            with self._lock:
+                self._data[digest] = chart
+                self._data.move_to_end(digest)
+                while len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+        return chart
+
+    @staticmethod
+    def _path(directory: Path, digest: bytes) -> Path:
+        return directory / f"{digest.hex()}.json"
+
+    @classmethod
+    def _load(cls, directory: Path, digest: bytes) -> NatalChart | None:
+        try:
+            payload = orjson.loads(cls._path(directory, digest).read_bytes())
+            if payload["version"] != _DISK_FORMAT_VERSION or payload["digest"] != digest.hex():
+                return None
+            natal_data = payload["natal_data"]
+            planets = tuple(Planet(name=name, longitude=lon, house=house) for name, lon, house in payload["planets"])
+            aspects = tuple(aspect_from_dict(a) for a in natal_data.get("aspects", []))
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+        return NatalChart(planets=planets, aspects=aspects, _natal_data=(natal_data,))
+
+    @classmethod
+    def _save(cls, directory: Path, digest: bytes, chart: NatalChart) -> None:
+        """Атомарная запись (tmp + os.replace); несериализуемые карты (вариант B) не сохраняются."""
+        try:
+            blob = orjson.dumps({
+                "version": _DISK_FORMAT_VERSION,
+                "digest": digest.hex(),
+                "planets": [[p.name, p.longitude, p.house] for p in chart.planets],
+                "natal_data": chart.to_natal_data(),
+            })
+        except TypeError:
+            return
+        path = cls._path(directory, digest)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+
+    def info(self) -> NatalCacheInfo:
+        """Снимок счётчиков."""
+        with self._lock:
+            return NatalCacheInfo(self._hits, self._disk_hits, self._misses, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Очищает память и счётчики (файлы на диске остаются)."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Меняет максимальный размер; лишние (самые старые) записи вытесняются."""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+
+_NATAL_CACHE = NatalChartCache()
+
+
+def get_natal_cache() -> NatalChartCache:
+    """Общий кэш натальных карт процесса (используется NatalChart.from_birth_data и Agent)."""
+    return _NATAL_CACHE
@@ -133,8 +133,20 @@ class NatalChart:
         return {"positions": positions, "aspects": aspects}
 
     @classmethod
-    def from_birth_data(cls, birth_data: dict[str, Any]) -> NatalChart:
-        """Build NatalChart from birth_data (variant A or B). Deterministic."""
+    def from_birth_data(cls, birth_data: dict[str, Any], *, use_cache: bool = True) -> NatalChart:
+        """
+        Build NatalChart from birth_data (variant A or B). Deterministic.
+        use_cache: look up / store in the process-wide natal cache (hnh.astrology.natal_cache),
+        keyed by the digest of the chart-relevant birth data.
+        """
+        if use_cache and cls is NatalChart:
+            from hnh.astrology.natal_cache import get_natal_cache
+
+            return get_natal_cache().get_or_build(birth_data, cls._build)
+        return cls._build(birth_data)
+
+    @classmethod
+    def _build(cls, birth_data: dict[str, Any]) -> NatalChart:
         planets, aspects, natal_data = _parse_birth_data(birth_data)
         return cls(planets=planets, aspects=aspects, _natal_data=(natal_data,))
 
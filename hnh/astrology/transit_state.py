@@ -1,13 +1,16 @@
 """
 TransitState: structured output of TransitEngine (Spec 006, contract transit-engine.md).
 Single return type per date: stress, raw_delta, bounded_delta.
+TransitStateBatch: stacked arrays for TransitEngine.states(dates).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
-from hnh.identity.schema import NUM_PARAMETERS
+import numpy as np
+
+from hnh.identity.layout import NUM_PARAMETERS
 
 # Vector32 = tuple[float, ...] length 32
 Vector32 = tuple[float, ...]
@@ -27,3 +30,30 @@ class TransitState:
     def __post_init__(self) -> None:
         if len(self.raw_delta) != NUM_PARAMETERS or len(self.bounded_delta) != NUM_PARAMETERS:
             raise ValueError(f"raw_delta and bounded_delta must have length {NUM_PARAMETERS}")
+
+
+@dataclass(frozen=True, eq=False)
+class TransitStateBatch:
+    """
+    Output of TransitEngine.states(dates, config): T instants as arrays.
+    stress: (T,); raw_delta, bounded_delta: (T, 32). batch[t] → TransitState for instant t.
+    """
+
+    stress: np.ndarray
+    raw_delta: np.ndarray
+    bounded_delta: np.ndarray
+
+    def __post_init__(self) -> None:
+        n = self.stress.shape[0]
+        if self.raw_delta.shape != (n, NUM_PARAMETERS) or self.bounded_delta.shape != (n, NUM_PARAMETERS):
+            raise ValueError(f"raw_delta and bounded_delta must have shape ({n}, {NUM_PARAMETERS})")
+
+    def __len__(self) -> int:
+        return int(self.stress.shape[0])
+
+    def __getitem__(self, t: int) -> TransitState:
+        return TransitState(
+            stress=float(self.stress[t]),
+            raw_delta=tuple(self.raw_delta[t].tolist()),
+            bounded_delta=tuple(self.bounded_delta[t].tolist()),
+        )
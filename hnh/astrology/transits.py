@@ -5,17 +5,26 @@ TransitEngine: state(date, config) -> TransitState (Spec 006). Stateless; determ
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from hnh.astrology import aspects as asp
 from hnh.astrology import ephemeris as eph
-from hnh.astrology.transit_state import TransitState
+from hnh.astrology.transit_state import TransitState, TransitStateBatch
 
 from hnh.config.replay_config import ReplayConfig
-from hnh.lifecycle.stress import compute_transit_stress
-from hnh.modulation.boundaries import apply_bounds
-from hnh.modulation.delta import compute_raw_delta_32
+from hnh.identity.layout import NUM_PARAMETERS
+from hnh.lifecycle.constants import C_T_DEFAULT
+from hnh.lifecycle.stress import compute_transit_stress, compute_transit_stress_batch
+from hnh.modulation.boundaries import apply_bounds, apply_bounds_batch
+from hnh.modulation.delta import compute_raw_delta_32, compute_raw_delta_32_batch
+
+_TRANSIT_PLANETS: list[str] = [name for name, _ in eph.PLANETS_NATAL]
+# Instants per vectorized chunk in TransitEngine.states()
+_STATES_CHUNK: int = 2048
 
 
 def _date_to_datetime_utc(d: date | datetime) -> datetime:
@@ -29,7 +38,7 @@ def _date_to_datetime_utc(d: date | datetime) -> datetime:
 
 class TransitEngine:
     """
-    Stateless transit layer: state(date, config) -> TransitState.
+    Stateless transit layer: state(date, config) -> TransitState; states(dates, config) -> TransitStateBatch.
     Takes NatalChart; does not store behavioral state. Contract: contracts/transit-engine.md.
     """
 
@@ -55,6 +64,48 @@ class TransitEngine:
         bounded_delta, _ = apply_bounds(raw_delta, config, shock_active)
         return TransitState(stress=stress, raw_delta=raw_delta, bounded_delta=bounded_delta)
 
+    def states(self, dates: Iterable[date | datetime], config: ReplayConfig) -> TransitStateBatch:
+        """
+        Batch state() over a date range: one array pass instead of T Python steps.
+        Positions via the shared transit cache (and installed ephemeris tables); aspects, stress,
+        raw_delta and bounds as NumPy ops. batch[t] equals state(dates[t]) within REPLAY_TOLERANCE.
+        """
+        intensity, raw_delta = self.intensity_series(dates)
+        stress = np.clip(intensity / C_T_DEFAULT, 0.0, 1.0)
+        shock_active = np.abs(raw_delta).max(axis=1, initial=0.0) > config.shock_threshold
+        bounded_delta, _ = apply_bounds_batch(raw_delta, config, shock_active)
+        return TransitStateBatch(stress=stress, raw_delta=raw_delta, bounded_delta=bounded_delta)
+
+    def intensity_series(self, dates: Iterable[date | datetime]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Config-independent part of states(): raw transit intensity I_T (T,) and raw_delta (T, 32).
+        stress = clip(I_T / c_t, 0, 1); bounds depend on ReplayConfig. Used by parameter sweeps.
+        """
+        cache = eph.get_transit_cache()
+        jds = [eph.datetime_to_julian_utc(_date_to_datetime_utc(d)) for d in dates]
+        transit_lons = np.array([cache.longitudes(jd) for jd in jds], dtype=float).reshape(
+            len(jds), len(_TRANSIT_PLANETS)
+        )
+        natal_data = self._natal.to_natal_data() if hasattr(self._natal, "to_natal_data") else self._natal
+        natal_pos_list = natal_data.get("positions", [])
+        natal_lons = np.array([float(p["longitude"]) for p in natal_pos_list], dtype=float)
+        natal_names = [p.get("planet") for p in natal_pos_list]
+        n = len(jds)
+        intensity = np.empty(n, dtype=float)
+        raw_delta = np.empty((n, NUM_PARAMETERS), dtype=float)
+        # Chunks bound the (T, 10, N, 5) temporaries for long ranges (e.g. 102-year lives)
+        for lo in range(0, n, _STATES_CHUNK):
+            hi = min(n, lo + _STATES_CHUNK)
+            # separation transit × natal; orb test on raw separation, intensity on 6-digit rounding
+            separation = asp.angular_separation_array(
+                transit_lons[lo:hi, :, None], natal_lons[None, None, :]
+            )
+            masks = asp.aspect_masks(separation)
+            deviation = asp.aspect_deviation(np.round(separation, 6))
+            intensity[lo:hi], _ = compute_transit_stress_batch(deviation, masks)
+            raw_delta[lo:hi] = compute_raw_delta_32_batch(deviation, masks, _TRANSIT_PLANETS, natal_names)
+        return intensity, raw_delta
+
 
 def compute_transit_signature(
     injected_time_utc: datetime,
@@ -71,7 +122,7 @@ def compute_transit_signature(
     elif injected_time_utc.tzinfo != timezone.utc:
         injected_time_utc = injected_time_utc.astimezone(timezone.utc)
     jd_ut = eph.datetime_to_julian_utc(injected_time_utc)
-    transit_positions = eph.compute_positions(jd_ut)
+    transit_positions = eph.compute_transit_positions(jd_ut)  # общий кэш процесса
     n_pos = len(transit_positions)
     transit_rounded: list[dict[str, Any]] = [None] * n_pos  # один раз по размеру, без роста списка
     for i in range(n_pos):
@@ -1,24 +1,33 @@
 """
 CLI: subcommands for simulating agent state.
-run (001, 7 params), run-v2 (002, 32 params), agent step (006 — canonical Agent.step()).
+run (001, 7 params), run-v2 (002, 32 params), agent step (006 — canonical Agent.step()),
+replay verify (002 — re-derive a state log and check determinism).
 Time is always injected from CLI args — no datetime.now() in core.
+Subcommand dependencies are imported inside the handlers: start-up cost is argparse + orjson,
+the rest is paid only by the command that needs it (see hnh --profile-import).
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 import orjson
-from datetime import datetime, timezone
 
-from hnh.core.identity import IdentityCore as CoreIdentity001
-from hnh.core.parameters import BehavioralVector
-from hnh.state.replay import run_step
+from hnh.state.tolerance import REPLAY_TOLERANCE
+
+if TYPE_CHECKING:
+    from hnh.core.identity import IdentityCore as CoreIdentity001
+    from hnh.identity.schema import IdentityCore
 
 
 def _default_identity_001() -> CoreIdentity001:
     """Default identity for CLI run (001: fixed 7-param base vector)."""
+    from hnh.core.identity import IdentityCore as CoreIdentity001
+    from hnh.core.parameters import BehavioralVector
+
     base = BehavioralVector(
         warmth=0.5,
         strictness=0.4,
@@ -50,6 +59,8 @@ def _cmd_run(args: argparse.Namespace) -> None:
         sys.exit(1)
         return  # unreachable when exit runs; needed when exit is mocked
 
+    from hnh.state.replay import run_step
+
     identity = _default_identity_001()
     state = run_step(identity, injected, seed=args.seed, relational_snapshot=None)
 
@@ -158,34 +169,33 @@ def _cmd_run_v2(args: argparse.Namespace) -> None:
         return  # unreachable when exit runs; needed when exit is mocked
 
     from hnh.config.replay_config import ReplayConfig
-    from hnh.identity import IdentityCore
-    from hnh.identity.schema import NUM_PARAMETERS, _registry
+    from hnh.identity import IdentityCore, registry_scope
+    from hnh.identity.schema import NUM_PARAMETERS
     from hnh.state.replay_v2 import run_step_v2
 
     natal_positions = _default_natal_positions_for_transits()
-
-    _registry.discard("cli-default-v2")
-    identity = IdentityCore(
-        identity_id="cli-default-v2",
-        base_vector=(0.5,) * NUM_PARAMETERS,
-        sensitivity_vector=(0.5,) * NUM_PARAMETERS,
-    )
     config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
-    result = run_step_v2(identity, config, injected, natal_positions=natal_positions)
 
-    if args.replay:
-        _registry.discard("cli-default-v2-replay")
-        identity2 = IdentityCore(
-            identity_id="cli-default-v2-replay",
+    with registry_scope():
+        identity = IdentityCore(
+            identity_id="cli-default-v2",
             base_vector=(0.5,) * NUM_PARAMETERS,
             sensitivity_vector=(0.5,) * NUM_PARAMETERS,
         )
-        result2 = run_step_v2(identity2, config, injected, natal_positions=natal_positions)
-        if result.params_final != result2.params_final or result.axis_final != result2.axis_final:
-            print("Replay mismatch: outputs differ.", file=sys.stderr)
-            sys.exit(1)
-        if not args.json:
-            print("Replay OK: identical output.")
+        result = run_step_v2(identity, config, injected, natal_positions=natal_positions)
+
+        if args.replay:
+            identity2 = IdentityCore(
+                identity_id="cli-default-v2-replay",
+                base_vector=(0.5,) * NUM_PARAMETERS,
+                sensitivity_vector=(0.5,) * NUM_PARAMETERS,
+            )
+            result2 = run_step_v2(identity2, config, injected, natal_positions=natal_positions)
+            if result.params_final != result2.params_final or result.axis_final != result2.axis_final:
+                print("Replay mismatch: outputs differ.", file=sys.stderr)
+                sys.exit(1)
+            if not args.json:
+                print("Replay OK: identical output.")
 
     if args.json:
         out = {
@@ -218,11 +228,162 @@ def _cmd_run_v2(args: argparse.Namespace) -> None:
         print("configuration_hash:", result.configuration_hash)
 
 
+def _load_verify_identities(path: str | None) -> list[tuple[IdentityCore, Any]]:
+    """
+    Identities for replay verify: JSON Lines of {identity_id, base_vector, sensitivity_vector, natal_positions}.
+    Without a file: the run-v2 default identity and natal chart.
+    """
+    from hnh.identity import IdentityCore
+    from hnh.identity.schema import NUM_PARAMETERS
+
+    if path is None:
+        identity = IdentityCore(
+            identity_id="cli-default-v2",
+            base_vector=(0.5,) * NUM_PARAMETERS,
+            sensitivity_vector=(0.5,) * NUM_PARAMETERS,
+        )
+        return [(identity, _default_natal_positions_for_transits())]
+    out = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            identity = IdentityCore(
+                identity_id=row["identity_id"],
+                base_vector=tuple(row["base_vector"]),
+                sensitivity_vector=tuple(row["sensitivity_vector"]),
+            )
+            out.append((identity, row["natal_positions"]))
+    return out
+
+
+def _cmd_replay_verify(args: argparse.Namespace) -> None:
+    """Execute replay verify: recompute every log record and report the first divergence per identity."""
+    from hnh.config.loader import extract_replay_config, load_config
+    from hnh.config.replay_config import ReplayConfig
+    from hnh.identity import registry_scope
+    from hnh.state.replay_verify import verify_log
+
+    try:
+        if args.config:
+            configs = [extract_replay_config(load_config(p)) for p in args.config]
+        else:
+            configs = [ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)]
+        with registry_scope():
+            identities = _load_verify_identities(args.identities)
+            report = verify_log(args.log, identities, configs, workers=args.workers, tolerance=args.tolerance)
+    except (OSError, ValueError, KeyError, RuntimeError) as e:
+        print(f"replay verify failed: {e}", file=sys.stderr)
+        sys.exit(2)
+        return
+
+    if args.json:
+        out = {
+            "ok": report.ok,
+            "records": report.records,
+            "groups": [
+                {
+                    "identity_hash": g.identity_hash,
+                    "configuration_hash": g.configuration_hash,
+                    "records": g.records,
+                    "checked": g.checked,
+                    "resolved": g.resolved,
+                    "divergence": None if g.divergence is None else {
+                        "line": g.divergence.line,
+                        "injected_time_utc": g.divergence.injected_time_utc,
+                        "field": g.divergence.field,
+                        "detail": g.divergence.detail,
+                    },
+                }
+                for g in report.groups
+            ],
+        }
+        print(orjson.dumps(out, option=orjson.OPT_SORT_KEYS).decode("utf-8"))
+    else:
+        print(f"records: {report.records}, groups: {len(report.groups)}")
+        for g in report.unresolved:
+            print(f"UNRESOLVED identity_hash={g.identity_hash} configuration_hash={g.configuration_hash} ({g.records} records)")
+        for g in report.divergent:
+            d = g.divergence
+            assert d is not None  # divergent groups always carry a divergence
+            print(f"DIVERGED identity_hash={g.identity_hash} line {d.line} ({d.injected_time_utc}): {d.field}: {d.detail}")
+        if report.ok:
+            print("Replay OK: all records reproduced.")
+    if not report.ok:
+        sys.exit(1)
+
+
+_PROFILE_IMPORT_TOP = 30
+
+# Child for --profile-import: the real CLI under -X importtime (argv after -c = the command)
+_PROFILE_CHILD = "import sys; sys.argv[0] = 'hnh'; from hnh.cli import main; main()"
+
+
+def _parse_importtime(stderr: str) -> tuple[list[tuple[str, int, int, int]], list[str]]:
+    """
+    Split -X importtime stderr into [(module, self_us, cumulative_us, depth)] in import order
+    and the remaining stderr lines (the command's own messages).
+    """
+    rows: list[tuple[str, int, int, int]] = []
+    other: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header: "self [us] | cumulative | imported package"
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return rows, other
+
+
+def _cmd_profile_import(argv: list[str]) -> None:
+    """
+    hnh --profile-import [COMMAND ...]: run the CLI (or just import hnh.cli) in a child interpreter
+    with -X importtime; forward its output and print per-module import cost to stderr.
+    """
+    import os
+    import subprocess
+    from pathlib import Path
+
+    code = _PROFILE_CHILD if argv else "import hnh.cli"
+    env = dict(os.environ)
+    root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *argv],
+        capture_output=True, text=True, env=env,
+    )
+    sys.stdout.write(proc.stdout)
+    rows, other = _parse_importtime(proc.stderr)
+    for line in other:
+        print(line, file=sys.stderr)
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    hnh_self_us = sum(self_us for name, self_us, _, _ in rows if name == "hnh" or name.startswith("hnh."))
+    top = sorted(rows, key=lambda r: r[2], reverse=True)[:_PROFILE_IMPORT_TOP]
+    print(f"import cost (-X importtime): {len(rows)} modules, top {len(top)} by cumulative time", file=sys.stderr)
+    print(f"{'self ms':>9} {'cum ms':>9}  module", file=sys.stderr)
+    for name, self_us, cumulative, _ in top:
+        print(f"{self_us / 1000:9.2f} {cumulative / 1000:9.2f}  {name}", file=sys.stderr)
+    print(f"total: {total_us / 1000:.1f} ms (hnh modules self: {hnh_self_us / 1000:.1f} ms)", file=sys.stderr)
+    if proc.returncode:
+        sys.exit(proc.returncode)
+
+
 def main() -> None:
+    argv = sys.argv[1:]
+    if argv[:1] == ["--profile-import"]:
+        _cmd_profile_import(argv[1:])
+        return
     parser = argparse.ArgumentParser(
         prog="hnh",
         description="HnH — детерминированный движок личности. Симуляция на заданную дату (время только из аргументов).",
-        epilog="Команды: run (001), run-v2 (002), agent step (006 — канонический Agent.step()).",
+        epilog="Команды: run (001), run-v2 (002), agent step (006 — канонический Agent.step()), replay verify (002). "
+        "Профилирование импорта: hnh --profile-import [COMMAND ...] (только первым аргументом) — выполнить команду "
+        "(или только импорт CLI) под -X importtime и вывести в stderr стоимость импорта по модулям.",
     )
     subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
 
@@ -319,6 +480,49 @@ def main() -> None:
     )
     step_parser.set_defaults(func=_cmd_agent_step)
 
+    # ----- replay verify (002) -----
+    replay_parser = subparsers.add_parser(
+        "replay",
+        help="Проверка детерминизма по state log (002).",
+        description="Инструменты replay для журналов состояния v2.",
+    )
+    replay_sub = replay_parser.add_subparsers(dest="replay_command", metavar="SUBCOMMAND", required=True)
+    verify_parser = replay_sub.add_parser(
+        "verify",
+        help="Пересчитать каждую запись журнала и сравнить (допуск replay_match).",
+        description="Записи группируются по identity_hash и configuration_hash, пересчитываются (общий кэш транзитов) "
+        "и сравниваются; для каждой группы выводится первое расхождение. Код выхода 1 при расхождении.",
+    )
+    verify_parser.add_argument("log", type=str, help="Журнал v2: JSON Lines или бинарный колоночный формат.")
+    verify_parser.add_argument(
+        "--identities",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="JSON Lines: identity_id, base_vector, sensitivity_vector, natal_positions (по умолчанию — identity run-v2).",
+    )
+    verify_parser.add_argument(
+        "--config",
+        type=str,
+        action="append",
+        default=None,
+        metavar="FILE",
+        help="Конфиг YAML/TOML (можно несколько; по умолчанию — конфиг run-v2).",
+    )
+    verify_parser.add_argument("--workers", type=int, default=1, help="Число процессов (по умолчанию 1).")
+    verify_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=REPLAY_TOLERANCE,
+        help=f"Допуск (по умолчанию {REPLAY_TOLERANCE:g}).",
+    )
+    verify_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Вывод одной строкой JSON.",
+    )
+    verify_parser.set_defaults(func=_cmd_replay_verify)
+
     args = parser.parse_args()
     args.func(args)
 
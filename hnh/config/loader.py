@@ -12,7 +12,7 @@ from hnh.config.replay_config import (
     ENGINE_SHOCK_MULTIPLIER_HARD_CAP,
     ReplayConfig,
 )
-from hnh.identity.schema import AXES, PARAMETERS
+from hnh.identity.layout import AXES, PARAMETERS
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
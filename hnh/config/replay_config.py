@@ -6,11 +6,13 @@ xxhash of canonical serialization (orjson); replay-relevant fields only. Spec 00
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
+import numpy as np
 import orjson
 import xxhash
 
-from hnh.identity.schema import AXES, PARAMETERS
+from hnh.identity.layout import AXES, NUM_PARAMETERS, PARAMETERS, get_parameter_axis_index
 
 # Hard cap from spec: shock_multiplier ≤ 2.0
 ENGINE_SHOCK_MULTIPLIER_HARD_CAP: float = 2.0
@@ -50,12 +52,61 @@ class ReplayConfig:
     def parameter_max_delta_dict(self) -> dict[str, float]:
         return dict(self.parameter_max_delta)
 
+    @cached_property
+    def configuration_hash(self) -> str:
+        """compute_configuration_hash(self), computed once per frozen config."""
+        return _configuration_hash(self)
+
+    @cached_property
+    def compiled_bounds(self) -> CompiledBounds:
+        """Effective max_delta vectors (normal and shock), resolved once per frozen config."""
+        return compile_bounds(self)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledBounds:
+    """
+    Per-config bounds for apply_bounds: hierarchy parameter > axis > global resolved for all 32 params.
+    normal = max_delta; shock = max_delta × shock_multiplier. Tuples for the per-step path,
+    read-only arrays (32,) for batch clipping.
+    """
+
+    normal: tuple[float, ...]
+    shock: tuple[float, ...]
+    normal_array: np.ndarray
+    shock_array: np.ndarray
+
+    def effective(self, shock_active: bool) -> tuple[float, ...]:
+        """Effective max_delta vector (32) for the given shock state."""
+        return self.shock if shock_active else self.normal
+
+
+def compile_bounds(config: ReplayConfig) -> CompiledBounds:
+    """Resolve effective max_delta for all 32 params (no shock and with shock). Prefer config.compiled_bounds."""
+    normal = tuple(
+        float(resolve_max_delta(p_ix, config, AXES[get_parameter_axis_index(p_ix)]))
+        for p_ix in range(NUM_PARAMETERS)
+    )
+    shock = tuple(max_d * config.shock_multiplier for max_d in normal)
+    normal_array = np.array(normal, dtype=float)
+    shock_array = np.array(shock, dtype=float)
+    normal_array.setflags(write=False)
+    shock_array.setflags(write=False)
+    return CompiledBounds(normal=normal, shock=shock, normal_array=normal_array, shock_array=shock_array)
+
 
 def compute_configuration_hash(config: ReplayConfig) -> str:
     """
     xxhash of replay-relevant fields only (canonical orjson). Spec 003.
     When lifecycle_enabled (005), includes mode, initial_f, initial_w. Deterministic.
+    Memoized per ReplayConfig instance (config.configuration_hash).
     """
+    if isinstance(config, ReplayConfig):
+        return config.configuration_hash
+    return _configuration_hash(config)
+
+
+def _configuration_hash(config: ReplayConfig) -> str:
     payload = {
         "global_max_delta": config.global_max_delta,
         "shock_threshold": config.shock_threshold,
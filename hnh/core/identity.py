@@ -13,9 +13,10 @@ import xxhash
 from pydantic import BaseModel, model_validator
 
 from hnh.core.parameters import BehavioralVector
+from hnh.identity.registry import KIND_CORE, IdentityRegistry, active_registry
 
-# Registry for duplicate identity_id check (in-memory, process scope)
-_registry: set[str] = set()
+# Registry for duplicate identity_id check (process default; registry_scope() for weak, isolated scopes)
+_registry: IdentityRegistry = IdentityRegistry(KIND_CORE, weak=False)
 
 
 class IdentityCore(BaseModel):
@@ -34,10 +35,7 @@ class IdentityCore(BaseModel):
 
     @model_validator(mode="after")
     def _register_and_reject_duplicate(self) -> IdentityCore:
-        if self.identity_id in _registry:
-            msg = f"Identity Core with identity_id={self.identity_id!r} already exists"
-            raise ValueError(msg)
-        _registry.add(self.identity_id)
+        active_registry(KIND_CORE, _registry).register(self.identity_id, self)
         return self
 
     @property
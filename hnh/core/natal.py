@@ -2,16 +2,23 @@
 Natal chart: birth datetime (UTC), location validation, deterministic natal_positions.
 Orchestrates ephemeris + houses + aspects → stable structure for Identity Core symbolic_input.
 Spec 004: 10 planets, house (1–12), sign (0–11), angular_strength per planet.
+Cohorts: build_natal_positions_many → columnar NatalTable (same values as build_natal_positions per row).
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from hnh.astrology import aspects as asp
 from hnh.astrology import ephemeris as eph
 from hnh.astrology import houses as hou
+from hnh.astrology.aspects import ASPECT_HIT_DTYPE
 
 
 def build_natal_positions(
@@ -51,3 +58,229 @@ def build_natal_positions(
         "aspects": aspects_list,
         "houses": {"cusps": list(cusps), "ascendant": ascmc[0] if ascmc else None, "mc": ascmc[1] if len(ascmc) > 1 else None},
     }
+
+
+# Sparse natal aspects of a cohort: row index + ASPECT_HIT_DTYPE fields, sorted by row
+_HIT_FIELDS: list[str] = ["planet1", "planet2", "aspect", "separation"]  # ASPECT_HIT_DTYPE field order
+_NATAL_ASPECT_FIELDS: list[tuple[str, Any]] = [("row", np.int64)]
+NATAL_ASPECT_DTYPE = np.dtype(_NATAL_ASPECT_FIELDS + [(name, ASPECT_HIT_DTYPE[name]) for name in _HIT_FIELDS])
+
+DEFAULT_NATAL_CHUNK = 2048
+
+
+@dataclass(frozen=True, eq=False)
+class NatalTable:
+    """
+    Columnar natal charts for N births (planet order PLANETS_NATAL).
+    longitudes (N, 10) unrounded, houses (N, 10) int8 1..12, cusps (N, 12), ascendant / mc (N,);
+    aspects: NATAL_ASPECT_DTYPE, rows of person i are aspects[aspect_offsets[i]:aspect_offsets[i + 1]].
+    """
+
+    birth_datetime_utc: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    jd_ut: np.ndarray
+    longitudes: np.ndarray
+    houses: np.ndarray
+    cusps: np.ndarray
+    ascendant: np.ndarray
+    mc: np.ndarray
+    aspects: np.ndarray
+    aspect_offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.jd_ut)
+
+    def row_aspects(self, i: int) -> np.ndarray:
+        """Aspects of person i as ASPECT_HIT_DTYPE (planet indices into PLANETS_NATAL)."""
+        return self.aspects[self.aspect_offsets[i]:self.aspect_offsets[i + 1]][_HIT_FIELDS]
+
+    def natal_positions(self, i: int) -> dict[str, Any]:
+        """Person i in the build_natal_positions format (identical output)."""
+        names = [name for name, _ in eph.PLANETS_NATAL]
+        positions = []
+        for name, lon, house in zip(names, self.longitudes[i].tolist(), self.houses[i].tolist()):
+            lon_r = round(lon, 6)
+            positions.append({
+                "planet": name,
+                "longitude": lon_r,
+                "sign": hou.longitude_to_sign_index(lon_r),
+                "house": house,
+                "angular_strength": round(hou.angular_strength_for_house(house), 6),
+            })
+        dt = self.birth_datetime_utc[i].astype(datetime).replace(tzinfo=timezone.utc)
+        return {
+            "birth_datetime_utc": dt.isoformat(),
+            "latitude": float(self.latitude[i]),
+            "longitude": float(self.longitude[i]),
+            "jd_ut": round(float(self.jd_ut[i]), 6),
+            "positions": positions,
+            "aspects": asp.aspect_hits_to_dicts(self.row_aspects(i), names, names),
+            "houses": {
+                "cusps": self.cusps[i].tolist(),
+                "ascendant": float(self.ascendant[i]),
+                "mc": float(self.mc[i]),
+            },
+        }
+
+
+def _to_datetime64_utc(birth_datetimes_utc: Sequence[datetime] | np.ndarray) -> np.ndarray:
+    """datetime (naive = UTC, aware → UTC) or datetime64 → datetime64[us] (UTC)."""
+    if isinstance(birth_datetimes_utc, np.ndarray) and np.issubdtype(birth_datetimes_utc.dtype, np.datetime64):
+        return birth_datetimes_utc.astype("datetime64[us]").reshape(-1)
+    naive = [
+        dt if dt.tzinfo is None else dt.astimezone(timezone.utc).replace(tzinfo=None)
+        for dt in birth_datetimes_utc
+    ]
+    return np.array(naive, dtype="datetime64[us]").reshape(-1)
+
+
+def julian_days_utc(birth_datetimes_utc: Sequence[datetime] | np.ndarray) -> np.ndarray:
+    """
+    Vectorized eph.datetime_to_julian_utc: the swe.julday Gregorian formula as array operations,
+    in the same operation order (bit-identical JD for every row).
+    """
+    t = _to_datetime64_utc(birth_datetimes_utc)
+    days = t.astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (days - months).astype(np.int64) + 1
+    us = (t - days).astype(np.int64)
+    hour, us = np.divmod(us, 3_600_000_000)
+    minute, us = np.divmod(us, 60_000_000)
+    second, micro = np.divmod(us, 1_000_000)
+    ut = hour + minute / 60.0 + second / 3600.0 + micro / 3600e6
+    u = np.where(month < 3, year - 1, year).astype(float)
+    u1 = month + 1.0
+    u1 = np.where(u1 < 4, u1 + 12.0, u1)
+    jd = np.floor((u + 4712.0) * 365.25) + np.floor(30.6 * u1 + 0.000001) + day + ut / 24.0 - 63.5
+    # datetime years are >= 1, so u >= 0: the negative-year branches of swe.julday never apply
+    jd_greg: np.ndarray = jd - (np.floor(u / 100) - np.floor(u / 400)) + 2
+    return jd_greg
+
+
+def _ephemeris_chunk(
+    jd_ut: np.ndarray, latitude: np.ndarray, longitude: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Swiss Ephemeris calls for a chunk: longitudes (n, 10), cusps (n, 12), ascmc[:2] (n, 2)."""
+    n = len(jd_ut)
+    lons = np.empty((n, len(eph.PLANETS_NATAL)), dtype=float)
+    cusps = np.empty((n, 12), dtype=float)
+    ascmc = np.empty((n, 2), dtype=float)
+    for r, (jd, lat, lon) in enumerate(zip(jd_ut.tolist(), latitude.tolist(), longitude.tolist())):
+        lons[r] = eph._calc_longitudes(jd)
+        c, a = hou.compute_houses(jd, lat, lon)
+        cusps[r] = c
+        ascmc[r] = a[:2]
+    return lons, cusps, ascmc
+
+
+def _houses_array(lons: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """Vectorized hou.longitude_to_house_number for (N, P) longitudes and (N, 12) cusps."""
+    lon_n = np.mod(lons, 360.0)[:, :, None]
+    c1 = np.mod(cusps, 360.0)[:, None, :]
+    c2 = np.roll(c1, -1, axis=2)
+    inside = np.where(c1 <= c2, (c1 <= lon_n) & (lon_n < c2), (lon_n >= c1) | (lon_n < c2))
+    first = np.argmax(inside, axis=2) + 1
+    return np.where(inside.any(axis=2), first, 12).astype(np.int8)
+
+
+def _natal_houses(lons: np.ndarray, cusps: np.ndarray, chunk_size: int) -> np.ndarray:
+    """Houses (N, 10) from longitudes rounded to 6 places, as in build_natal_positions; row chunks."""
+    houses = np.empty(lons.shape, dtype=np.int8)
+    for lo in range(0, len(lons), chunk_size):
+        hi = lo + chunk_size
+        chunk = lons[lo:hi]
+        rounded = np.array([round(x, 6) for x in chunk.ravel().tolist()], dtype=float).reshape(chunk.shape)
+        houses[lo:hi] = _houses_array(rounded, cusps[lo:hi])
+    return houses
+
+
+def _natal_aspects_array(
+    lons: np.ndarray, orb_config: asp.OrbConfig | None, chunk_size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    asp.detect_aspects_array for every row: (NATAL_ASPECT_DTYPE hits, offsets (N + 1,)).
+    Row chunks bound the (n, 10, 10) separation and (n, 10, 10, 5) mask temporaries for large cohorts.
+    """
+    p = lons.shape[1]
+    upper = np.triu(np.ones((p, p), dtype=bool), k=1)[None, :, :, None]
+    parts = []
+    for lo in range(0, len(lons), chunk_size):
+        chunk = lons[lo:lo + chunk_size]
+        separation = asp.angular_separation_array(chunk[:, :, None], chunk[:, None, :])
+        masks = asp.aspect_masks(separation, orb_config)
+        masks &= upper
+        row, i, j, k = np.nonzero(masks)
+        hits = np.empty(len(row), dtype=NATAL_ASPECT_DTYPE)
+        hits["row"] = row + lo
+        hits["planet1"] = i
+        hits["planet2"] = j
+        hits["aspect"] = k
+        hits["separation"] = separation[row, i, j]
+        parts.append(hits)
+    hits = np.concatenate(parts) if parts else np.empty(0, dtype=NATAL_ASPECT_DTYPE)
+    offsets = np.zeros(len(lons) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(hits["row"], minlength=len(lons)), out=offsets[1:])
+    return hits, offsets
+
+
+def build_natal_positions_many(
+    birth_datetimes_utc: Sequence[datetime] | np.ndarray,
+    latitudes: Sequence[float] | np.ndarray,
+    longitudes: Sequence[float] | np.ndarray,
+    orb_config: asp.OrbConfig | None = None,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_NATAL_CHUNK,
+) -> NatalTable:
+    """
+    Batch build_natal_positions for a cohort. Julian days, houses and aspects are array operations;
+    Swiss Ephemeris calls (10 planets + houses per person) run in chunks of chunk_size on a process
+    pool when workers > 1; houses and aspects are computed over the same row chunks. Row i of the result equals build_natal_positions(dt[i], lat[i], lon[i]).
+    """
+    lat = np.asarray(latitudes, dtype=float).reshape(-1)
+    lon = np.asarray(longitudes, dtype=float).reshape(-1)
+    t = _to_datetime64_utc(birth_datetimes_utc)
+    if not len(t) == len(lat) == len(lon):
+        raise ValueError(f"Length mismatch: {len(t)} datetimes, {len(lat)} latitudes, {len(lon)} longitudes")
+    bad = np.flatnonzero(
+        ~((lat >= eph.LAT_MIN) & (lat <= eph.LAT_MAX) & (lon >= eph.LON_MIN) & (lon <= eph.LON_MAX))
+    )
+    if len(bad):
+        try:
+            eph.validate_location(float(lat[bad[0]]), float(lon[bad[0]]))
+        except ValueError as e:
+            raise ValueError(f"row {int(bad[0])}: {e}") from None
+    if eph.swe is None:
+        raise RuntimeError("pyswisseph is not installed; install with pip install hnh[astrology]")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    jd = julian_days_utc(t)
+    bounds = range(0, len(jd), chunk_size)
+    tasks = [(jd[b:b + chunk_size], lat[b:b + chunk_size], lon[b:b + chunk_size]) for b in bounds]
+    if workers <= 1 or len(tasks) <= 1:
+        chunks = [_ephemeris_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=eph.reopen_ephemeris) as pool:
+            chunks = list(pool.map(_ephemeris_chunk, *zip(*tasks)))
+    n_planets = len(eph.PLANETS_NATAL)
+    planet_lons = np.concatenate([c[0] for c in chunks]) if chunks else np.empty((0, n_planets))
+    cusps = np.concatenate([c[1] for c in chunks]) if chunks else np.empty((0, 12))
+    ascmc = np.concatenate([c[2] for c in chunks]) if chunks else np.empty((0, 2))
+    houses = _natal_houses(planet_lons, cusps, chunk_size)
+    aspects, offsets = _natal_aspects_array(planet_lons, orb_config, chunk_size)
+    return NatalTable(
+        birth_datetime_utc=t,
+        latitude=lat,
+        longitude=lon,
+        jd_ut=jd,
+        longitudes=planet_lons,
+        houses=houses,
+        cusps=cusps,
+        ascendant=ascmc[:, 0],
+        mc=ascmc[:, 1],
+        aspects=aspects,
+        aspect_offsets=offsets,
+    )
@@ -1,26 +1,43 @@
-"""HnH v0.2 — hierarchical 8×4 personality schema and Identity Core."""
-
-from hnh.identity.schema import (
-    AXES,
-    PARAMETERS,
-    IdentityCore,
-    PersonalityAxis,
-    PersonalityParameter,
-    get_axis_index,
-    get_parameter_index,
-    get_parameter_axis_index,
-)
-from hnh.identity.sensitivity import compute_sensitivity, sensitivity_histogram
-
-__all__ = [
-    "AXES",
-    "PARAMETERS",
-    "IdentityCore",
-    "PersonalityAxis",
-    "PersonalityParameter",
-    "compute_sensitivity",
-    "sensitivity_histogram",
-    "get_axis_index",
-    "get_parameter_index",
-    "get_parameter_axis_index",
-]
+"""
+HnH v0.2 — hierarchical 8×4 personality schema and Identity Core.
+Exports are resolved on first access, so importing hnh.identity.layout (or any submodule)
+does not build the pydantic schema models.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, str] = {
+    "AXES": "hnh.identity.layout",
+    "PARAMETERS": "hnh.identity.layout",
+    "get_axis_index": "hnh.identity.layout",
+    "get_parameter_index": "hnh.identity.layout",
+    "get_parameter_axis_index": "hnh.identity.layout",
+    "IdentityCore": "hnh.identity.schema",
+    "PersonalityAxis": "hnh.identity.schema",
+    "PersonalityParameter": "hnh.identity.schema",
+    "load_identities": "hnh.identity.schema",
+    "IdentityRegistry": "hnh.identity.registry",
+    "RegistryScope": "hnh.identity.registry",
+    "evict_identity": "hnh.identity.registry",
+    "registry_scope": "hnh.identity.registry",
+    "compute_sensitivity": "hnh.identity.sensitivity",
+    "sensitivity_histogram": "hnh.identity.sensitivity",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
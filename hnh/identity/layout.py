@@ -0,0 +1,84 @@
+"""
+Canonical 8×4 layout of the personality schema (Spec 002): axis and parameter names, indices.
+Plain tuples and functions, no pydantic — imported by the hot paths (Agent, replay, transits)
+without building the schema models. hnh.identity.schema re-exports everything here.
+"""
+
+from __future__ import annotations
+
+# --- T1.1 Axis & Parameter Registry ----------------------------------------------------------
+# Spec §7: 8 axes, 32 sub-parameters. Order is canonical and stable.
+
+AXES: tuple[str, ...] = (
+    "emotional_tone",           # 0
+    "stability_regulation",     # 1
+    "cognitive_style",         # 2
+    "structure_discipline",     # 3
+    "communication_style",     # 4
+    "teaching_style",           # 5
+    "power_boundaries",        # 6
+    "motivation_drive",        # 7
+)
+
+# 32 parameters: (axis_index, param_name). Global index = axis * 4 + sub.
+_PARAMETER_LIST: list[tuple[int, str]] = [
+    (0, "warmth"),
+    (0, "empathy"),
+    (0, "patience"),
+    (0, "emotional_intensity"),
+    (1, "stability"),
+    (1, "reactivity"),
+    (1, "resilience"),
+    (1, "stress_response"),
+    (2, "analytical_depth"),
+    (2, "abstraction_level"),
+    (2, "detail_orientation"),
+    (2, "big_picture_focus"),
+    (3, "structure_preference"),
+    (3, "consistency"),
+    (3, "rule_adherence"),
+    (3, "planning_bias"),
+    (4, "verbosity"),
+    (4, "directness"),
+    (4, "questioning_frequency"),
+    (4, "explanation_bias"),
+    (5, "correction_intensity"),
+    (5, "challenge_level"),
+    (5, "encouragement_level"),
+    (5, "pacing"),
+    (6, "authority_presence"),
+    (6, "dominance"),
+    (6, "tolerance_for_errors"),
+    (6, "conflict_tolerance"),
+    (7, "ambition"),
+    (7, "curiosity"),
+    (7, "initiative"),
+    (7, "persistence"),
+]
+
+PARAMETERS: tuple[str, ...] = tuple(p[1] for p in _PARAMETER_LIST)
+NUM_AXES: int = 8
+NUM_PARAMETERS: int = 32
+
+
+def get_axis_index(axis_name: str) -> int:
+    """Return canonical axis index 0..7. Raises ValueError if unknown."""
+    try:
+        return AXES.index(axis_name)
+    except ValueError:
+        raise ValueError(f"Unknown axis: {axis_name!r}") from None
+
+
+def get_parameter_index(param_name: str) -> int:
+    """Return canonical parameter index 0..31. Raises ValueError if unknown."""
+    try:
+        return PARAMETERS.index(param_name)
+    except ValueError:
+        raise ValueError(f"Unknown parameter: {param_name!r}") from None
+
+
+def get_parameter_axis_index(param_index: int) -> int:
+    """Return axis index (0..7) for the given parameter index (0..31)."""
+    if not 0 <= param_index < NUM_PARAMETERS:
+        raise ValueError(f"Parameter index must be 0..{NUM_PARAMETERS - 1}, got {param_index}")
+    return _PARAMETER_LIST[param_index][0]
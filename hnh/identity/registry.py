@@ -0,0 +1,160 @@
+"""
+Identity registries: one live Identity Core per identity_id within a registry scope.
+Process default registries (hnh.identity.schema, hnh.core.identity) keep the historical
+semantics: an id stays reserved until explicitly evicted, so every identity created outside a
+scope holds its id for the life of the process (call evict() or use a scope).
+registry_scope() / RegistryScope give isolated, weak registries (per request, tenant or engine):
+an entry disappears when its identity is garbage-collected, so identities can be created and
+dropped at high churn without growth.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+# Registry kinds (namespaces): v0.2 IdentityCore (identity.schema) and 001 IdentityCore (core.identity)
+KIND_IDENTITY = "identity"
+KIND_CORE = "core"
+
+_STRONG = object()  # entry held without a weak reference (default registries, add())
+
+
+class IdentityRegistry:
+    """
+    identity_id → live identity. weak=True: entries hold weak references and are removed when the
+    identity is collected; weak=False: entries are kept until evict()/discard()/clear().
+    Set-like read API (in, len, iter) and discard/clear for compatibility with the former set.
+    """
+
+    __slots__ = ("kind", "weak", "_entries", "_lock", "__weakref__")
+
+    def __init__(self, kind: str, weak: bool = True) -> None:
+        self.kind = kind
+        self.weak = weak
+        self._entries: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, entry: Any) -> bool:
+        return entry is _STRONG or entry() is not None
+
+    def register(self, identity_id: str, identity: Any) -> None:
+        """Register identity under identity_id; ValueError if a live identity already holds it."""
+        with self._lock:
+            entry = self._entries.get(identity_id)
+            if entry is not None and self._live(entry):
+                raise ValueError(f"Identity Core with identity_id={identity_id!r} already exists")
+            if self.weak:
+                self._entries[identity_id] = weakref.ref(identity, self._make_cleanup(identity_id))
+            else:
+                self._entries[identity_id] = _STRONG
+
+    def _make_cleanup(self, identity_id: str) -> Any:
+        registry_ref = weakref.ref(self)
+
+        def _cleanup(ref: weakref.ref[Any]) -> None:
+            registry = registry_ref()
+            if registry is None:
+                return
+            with registry._lock:
+                if registry._entries.get(identity_id) is ref:
+                    del registry._entries[identity_id]
+
+        return _cleanup
+
+    def add(self, identity_id: str) -> None:
+        """Reserve identity_id without an identity object (kept until evicted)."""
+        with self._lock:
+            self._entries[identity_id] = _STRONG
+
+    def evict(self, identity_id: str) -> bool:
+        """Release identity_id (the identity object itself is unaffected). True if it was registered."""
+        with self._lock:
+            entry = self._entries.pop(identity_id, None)
+        return entry is not None and self._live(entry)
+
+    def discard(self, identity_id: str) -> None:
+        """Set-compatible alias of evict()."""
+        self.evict(identity_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, identity_id: object) -> bool:
+        entry = self._entries.get(identity_id)  # type: ignore[call-overload]
+        return entry is not None and self._live(entry)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._entries.items())
+        return iter([identity_id for identity_id, entry in items if self._live(entry)])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class RegistryScope:
+    """
+    Isolated set of registries (one per kind). Activate with `with scope.activate():` or use
+    registry_scope(); identities built inside register here instead of the process defaults.
+    """
+
+    __slots__ = ("weak", "_registries")
+
+    def __init__(self, weak: bool = True) -> None:
+        self.weak = weak
+        self._registries: dict[str, IdentityRegistry] = {}
+
+    def registry(self, kind: str) -> IdentityRegistry:
+        reg = self._registries.get(kind)
+        if reg is None:
+            reg = self._registries.setdefault(kind, IdentityRegistry(kind, weak=self.weak))
+        return reg
+
+    def evict(self, identity_id: str) -> bool:
+        """Release identity_id in every registry of this scope. True if any held it."""
+        return any([reg.evict(identity_id) for reg in self._registries.values()])
+
+    def clear(self) -> None:
+        for reg in self._registries.values():
+            reg.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator[RegistryScope]:
+        token = _ACTIVE_SCOPE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_SCOPE.reset(token)
+
+
+_ACTIVE_SCOPE: ContextVar[RegistryScope | None] = ContextVar("hnh_identity_registry_scope", default=None)
+
+
+@contextmanager
+def registry_scope(weak: bool = True) -> Iterator[RegistryScope]:
+    """Run a block with a fresh RegistryScope (context-local: threads/asyncio tasks are isolated)."""
+    with RegistryScope(weak=weak).activate() as scope:
+        yield scope
+
+
+def active_registry(kind: str, default: IdentityRegistry) -> IdentityRegistry:
+    """Registry of the active scope for kind, or default outside any scope."""
+    scope = _ACTIVE_SCOPE.get()
+    return default if scope is None else scope.registry(kind)
+
+
+def evict_identity(identity_id: str) -> bool:
+    """Release identity_id in the active scope (or the process default registries). True if held."""
+    scope = _ACTIVE_SCOPE.get()
+    if scope is not None:
+        return scope.evict(identity_id)
+    from hnh.core.identity import _registry as core_registry
+    from hnh.identity.schema import _registry as identity_registry
+
+    return any([identity_registry.evict(identity_id), core_registry.evict(identity_id)])
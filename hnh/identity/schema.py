@@ -5,89 +5,27 @@ Canonical ordering, deterministic index mapping. Spec 002.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+import numpy as np
 import orjson
 import xxhash
 
-from pydantic import BaseModel, field_validator, model_validator
-
-# --- T1.1 Axis & Parameter Registry ----------------------------------------------------------
-# Spec §7: 8 axes, 32 sub-parameters. Order is canonical and stable.
-
-AXES: tuple[str, ...] = (
-    "emotional_tone",           # 0
-    "stability_regulation",     # 1
-    "cognitive_style",         # 2
-    "structure_discipline",     # 3
-    "communication_style",     # 4
-    "teaching_style",           # 5
-    "power_boundaries",        # 6
-    "motivation_drive",        # 7
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+
+# Re-exported: the canonical layout lives in hnh.identity.layout
+from hnh.identity.layout import (
+    AXES as AXES,
+    NUM_AXES as NUM_AXES,
+    NUM_PARAMETERS as NUM_PARAMETERS,
+    PARAMETERS as PARAMETERS,
+    _PARAMETER_LIST as _PARAMETER_LIST,
+    get_axis_index as get_axis_index,
+    get_parameter_axis_index as get_parameter_axis_index,
+    get_parameter_index as get_parameter_index,
 )
-
-# 32 parameters: (axis_index, param_name). Global index = axis * 4 + sub.
-_PARAMETER_LIST: list[tuple[int, str]] = [
-    (0, "warmth"),
-    (0, "empathy"),
-    (0, "patience"),
-    (0, "emotional_intensity"),
-    (1, "stability"),
-    (1, "reactivity"),
-    (1, "resilience"),
-    (1, "stress_response"),
-    (2, "analytical_depth"),
-    (2, "abstraction_level"),
-    (2, "detail_orientation"),
-    (2, "big_picture_focus"),
-    (3, "structure_preference"),
-    (3, "consistency"),
-    (3, "rule_adherence"),
-    (3, "planning_bias"),
-    (4, "verbosity"),
-    (4, "directness"),
-    (4, "questioning_frequency"),
-    (4, "explanation_bias"),
-    (5, "correction_intensity"),
-    (5, "challenge_level"),
-    (5, "encouragement_level"),
-    (5, "pacing"),
-    (6, "authority_presence"),
-    (6, "dominance"),
-    (6, "tolerance_for_errors"),
-    (6, "conflict_tolerance"),
-    (7, "ambition"),
-    (7, "curiosity"),
-    (7, "initiative"),
-    (7, "persistence"),
-]
-
-PARAMETERS: tuple[str, ...] = tuple(p[1] for p in _PARAMETER_LIST)
-NUM_AXES: int = 8
-NUM_PARAMETERS: int = 32
-
-
-def get_axis_index(axis_name: str) -> int:
-    """Return canonical axis index 0..7. Raises ValueError if unknown."""
-    try:
-        return AXES.index(axis_name)
-    except ValueError:
-        raise ValueError(f"Unknown axis: {axis_name!r}") from None
-
-
-def get_parameter_index(param_name: str) -> int:
-    """Return canonical parameter index 0..31. Raises ValueError if unknown."""
-    try:
-        return PARAMETERS.index(param_name)
-    except ValueError:
-        raise ValueError(f"Unknown parameter: {param_name!r}") from None
-
-
-def get_parameter_axis_index(param_index: int) -> int:
-    """Return axis index (0..7) for the given parameter index (0..31)."""
-    if not 0 <= param_index < NUM_PARAMETERS:
-        raise ValueError(f"Parameter index must be 0..{NUM_PARAMETERS - 1}, got {param_index}")
-    return _PARAMETER_LIST[param_index][0]
+from hnh.identity.registry import KIND_IDENTITY, IdentityRegistry, active_registry
 
 
 class PersonalityAxis(BaseModel):
@@ -159,7 +97,8 @@ class PersonalityParameter(BaseModel):
 # identity_id, natal_data (optional), base_vector[32], sensitivity_vector[32], identity_hash
 
 
-_registry: set[str] = set()
+# Process default registry (ids reserved until evicted); registry_scope() for weak, isolated scopes
+_registry: IdentityRegistry = IdentityRegistry(KIND_IDENTITY, weak=False)
 
 
 class IdentityCore(BaseModel):
@@ -177,6 +116,9 @@ class IdentityCore(BaseModel):
 
     model_config = {"frozen": True}
 
+    # identity_hash считается один раз (модель заморожена); сбрасывается в model_copy(update=...)
+    _identity_hash: str | None = PrivateAttr(default=None)
+
     @field_validator("base_vector", "sensitivity_vector")
     @classmethod
     def _length_32(cls, v: tuple[float, ...]) -> tuple[float, ...]:
@@ -194,23 +136,94 @@ class IdentityCore(BaseModel):
 
     @model_validator(mode="after")
     def _register_and_reject_duplicate(self) -> IdentityCore:
-        if self.identity_id in _registry:
-            raise ValueError(
-                f"Identity Core with identity_id={self.identity_id!r} already exists"
-            )
-        _registry.add(self.identity_id)
+        active_registry(KIND_IDENTITY, _registry).register(self.identity_id, self)
         return self
 
+    @classmethod
+    def from_trusted(
+        cls,
+        identity_id: str,
+        base_vector: Sequence[float] | np.ndarray,
+        sensitivity_vector: Sequence[float] | np.ndarray,
+        natal_data: dict[str, Any] | None = None,
+    ) -> IdentityCore:
+        """
+        Fast path for pre-validated data (e.g. hydrated from our own store): no per-element
+        field validation. Still frozen and registered (duplicate identity_id raises).
+        Only vector lengths are checked; elements are coerced to float (as validation would),
+        so ndarray rows and int vectors give the same identity_hash as IdentityCore(...).
+        """
+        if len(base_vector) != NUM_PARAMETERS or len(sensitivity_vector) != NUM_PARAMETERS:
+            raise ValueError(f"Vector length must be {NUM_PARAMETERS}")
+        core = cls.model_construct(
+            identity_id=identity_id,
+            natal_data=natal_data,
+            base_vector=tuple(map(float, base_vector)),
+            sensitivity_vector=tuple(map(float, sensitivity_vector)),
+        )
+        active_registry(KIND_IDENTITY, _registry).register(identity_id, core)
+        return core
+
     @property
     def identity_hash(self) -> str:
-        """Deterministic hash: identity_id + base_vector + sensitivity_vector."""
-        payload = {
-            "identity_id": self.identity_id,
-            "base_vector": list(self.base_vector),
-            "sensitivity_vector": list(self.sensitivity_vector),
-        }
-        blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
-        return xxhash.xxh3_128(blob, seed=0).hexdigest()
+        """Deterministic hash: identity_id + base_vector + sensitivity_vector. Memoized on first access."""
+        cached = self._identity_hash
+        if cached is None:
+            payload = {
+                "identity_id": self.identity_id,
+                "base_vector": list(self.base_vector),
+                "sensitivity_vector": list(self.sensitivity_vector),
+            }
+            blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+            cached = xxhash.xxh3_128(blob, seed=0).hexdigest()
+            self._identity_hash = cached
+        return cached
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> IdentityCore:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._identity_hash = None
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        # Сравнение только по полям: кэш _identity_hash не часть значения модели
+        if not isinstance(other, IdentityCore):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
 
     def __hash__(self) -> int:
         return hash((self.identity_id, self.identity_hash))
+
+
+def load_identities(
+    identity_ids: Sequence[str],
+    base_vectors: np.ndarray,
+    sensitivity_vectors: np.ndarray,
+    natal_data: Sequence[dict[str, Any] | None] | None = None,
+    check_range: bool = True,
+) -> list[IdentityCore]:
+    """
+    Bulk IdentityCore.from_trusted from N×32 float arrays. Shapes are checked once; with
+    check_range the [0, 1] bound is checked as one array test (not per element in Python).
+    """
+    base = np.asarray(base_vectors, dtype=float)
+    sens = np.asarray(sensitivity_vectors, dtype=float)
+    n = len(identity_ids)
+    if base.shape != (n, NUM_PARAMETERS) or sens.shape != (n, NUM_PARAMETERS):
+        raise ValueError(
+            f"base_vectors and sensitivity_vectors must have shape ({n}, {NUM_PARAMETERS}), "
+            f"got {base.shape} and {sens.shape}"
+        )
+    if natal_data is not None and len(natal_data) != n:
+        raise ValueError(f"natal_data length must be {n}, got {len(natal_data)}")
+    if check_range:
+        for name, arr in (("base_vectors", base), ("sensitivity_vectors", sens)):
+            bad = ~((arr >= 0.0) & (arr <= 1.0))
+            if bad.any():
+                row, col = np.argwhere(bad)[0]
+                raise ValueError(f"{name}[{row}][{col}] must be in [0, 1], got {arr[row, col]}")
+    natal = natal_data if natal_data is not None else [None] * n
+    return [
+        IdentityCore.from_trusted(uid, b, s, nd)
+        for uid, b, s, nd in zip(identity_ids, base.tolist(), sens.tolist(), natal)
+    ]
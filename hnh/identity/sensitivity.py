@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from hnh.identity.schema import (
+from hnh.identity.layout import (
     AXES,
     NUM_PARAMETERS,
     PARAMETERS,
@@ -31,6 +31,7 @@ from hnh.lifecycle.stress import (
     compute_raw_transit_intensity,
     compute_transit_stress,
 )
+from hnh.lifecycle.trajectory import LifecycleTrajectory, simulate_lifecycle
 
 __all__ = [
     "LifecycleConstants",
@@ -53,4 +54,6 @@ __all__ = [
     "update_fatigue",
     "compute_raw_transit_intensity",
     "compute_transit_stress",
+    "LifecycleTrajectory",
+    "simulate_lifecycle",
 ]
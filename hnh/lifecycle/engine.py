@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from hnh.identity.schema import NUM_PARAMETERS, NUM_AXES, PARAMETERS, _PARAMETER_LIST
+from hnh.identity.layout import NUM_PARAMETERS, NUM_AXES, PARAMETERS, _PARAMETER_LIST
 from hnh.state.assembler import assemble_state
 
 from hnh.lifecycle.constants import (
@@ -302,6 +302,24 @@ class LifecycleEngine:
     def state(self) -> LifecycleState:
         return self._state.state
 
+    def step_state(self) -> LifecycleStepState:
+        """Copy of the running state (F, W, state, sum_v, sum_burn, count_days) for checkpoints."""
+        st = self._state
+        return LifecycleStepState(
+            F=st.F, W=st.W, state=st.state, sum_v=st.sum_v, sum_burn=st.sum_burn, count_days=st.count_days
+        )
+
+    def restore_step_state(self, state: LifecycleStepState) -> None:
+        """Replace the running state (from step_state() / a checkpoint). Constants unchanged."""
+        self._state = LifecycleStepState(
+            F=state.F,
+            W=state.W,
+            state=LifecycleState(state.state),
+            sum_v=state.sum_v,
+            sum_burn=state.sum_burn,
+            count_days=state.count_days,
+        )
+
     def update_lifecycle(
         self,
         stress: float,
@@ -5,7 +5,7 @@ Deterministic; R constant per identity (Stability axis from base_vector).
 
 from __future__ import annotations
 
-from hnh.identity.schema import NUM_PARAMETERS, _PARAMETER_LIST
+from hnh.identity.layout import NUM_PARAMETERS, _PARAMETER_LIST
 from hnh.lifecycle.constants import (
     ALPHA_SHOCK,
     BETA_R,
@@ -64,7 +64,7 @@ def run_step_with_lifecycle(
             )
             a_g = 0.0 if init_check == LifecycleState.DISABLED else 1.0
             from hnh.state.assembler import assemble_state
-            from hnh.identity.schema import NUM_PARAMETERS
+            from hnh.identity.layout import NUM_PARAMETERS
             effective_transit = tuple(x * a_g for x in daily_transit_effect)
             effective_memory = tuple(x * a_g for x in memory_delta)
             params_final, axis_final = assemble_state(
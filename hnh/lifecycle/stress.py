@@ -7,6 +7,9 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+from hnh.astrology.aspects import MAJOR_ASPECTS
 from hnh.lifecycle.constants import C_T_DEFAULT, HARD_ASPECTS, HARD_ASPECT_WEIGHT_DEFAULT
 
 # Default orbs (degrees) for orb_decay; align with astrology DEFAULT_ORBS
@@ -67,3 +70,33 @@ def compute_transit_stress(
     i_t = compute_raw_transit_intensity(aspects_to_natal, hard_aspect_weights, orbs)
     s_t = max(0.0, min(1.0, i_t / c_t))
     return (i_t, s_t)
+
+
+def compute_transit_stress_batch(
+    deviation: np.ndarray,
+    masks: np.ndarray,
+    c_t: float = C_T_DEFAULT,
+    hard_aspect_weights: dict[str, float] | None = None,
+    orbs: dict[str, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Batch I_T, S_T over the leading axis. deviation/masks: (T, ..., 5) in MAJOR_ASPECTS order
+    (from aspect_deviation / aspect_masks). Same formula as compute_transit_stress. Returns (I_T, S_T), shape (T,).
+    """
+    weights = hard_aspect_weights or {a: HARD_ASPECT_WEIGHT_DEFAULT for a in HARD_ASPECTS}
+    orbs_map = orbs or _DEFAULT_ORBS
+    n = deviation.shape[0]
+    i_t = np.zeros(n, dtype=float)
+    for idx, (name, _) in enumerate(MAJOR_ASPECTS):
+        if name not in HARD_ASPECTS:
+            continue
+        orb = orbs_map.get(name, 8.0)
+        if orb <= 0:
+            decay = np.ones_like(deviation[..., idx])
+        else:
+            decay = np.maximum(0.0, 1.0 - deviation[..., idx] / orb)
+        w = weights.get(name, HARD_ASPECT_WEIGHT_DEFAULT)
+        contrib = np.where(masks[..., idx], w * decay, 0.0)
+        i_t += contrib.sum(axis=tuple(range(1, contrib.ndim)))
+    s_t = np.clip(i_t / c_t, 0.0, 1.0)
+    return (i_t, s_t)
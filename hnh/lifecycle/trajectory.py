@@ -0,0 +1,115 @@
+"""
+Whole-trajectory lifecycle scan (Spec 005) for a precomputed stress series S_T(t).
+Same recurrence as LifecycleEngine.update_lifecycle / lifecycle_step, run as one pass:
+load, recovery and fatigue limit L are computed as arrays; only the clamped fatigue scan
+F(t+1) = max(0, F(t) + lambda_up*load - lambda_down*recovery) with the death test F(t) >= L(t)
+is a sequential loop over floats. F is bit-identical to day-by-day stepping; q, A_g, sum_v, sum_burn
+and W match within REPLAY_TOLERANCE.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from hnh.lifecycle.constants import DEFAULT_LIFECYCLE_CONSTANTS, LifecycleConstants
+from hnh.lifecycle.engine import LifecycleState, check_init_death_or_transcendence
+from hnh.lifecycle.fatigue import fatigue_limit
+
+
+@dataclass(frozen=True, eq=False)
+class LifecycleTrajectory:
+    """
+    Result of simulate_lifecycle. F, q, A_g: (days,) values after each normal (ALIVE) day.
+    terminal_day: index into stress_series of the day the agent became DISABLED/TRANSCENDED (None if alive).
+    W, sum_v, sum_burn, count_days: state after the scan (as LifecycleStepState).
+    """
+
+    F: np.ndarray
+    q: np.ndarray
+    A_g: np.ndarray
+    state: LifecycleState
+    terminal_day: int | None
+    W: float
+    sum_v: float
+    sum_burn: float
+
+    @property
+    def count_days(self) -> int:
+        return len(self.F)
+
+
+def simulate_lifecycle(
+    stress_series: Sequence[float] | np.ndarray,
+    R: float | Sequence[float] | np.ndarray,
+    S_g: float,
+    constants: LifecycleConstants | None = None,
+    initial_f: float = 0.0,
+    initial_w: float = 0.0,
+) -> LifecycleTrajectory:
+    """
+    Run the lifecycle over stress_series (S_T per day, already clipped to [0, 1]).
+    R: resilience, constant (lifecycle_step / run_step_with_lifecycle) or per day (Agent: from
+    current_vector before each step). Stops at death (F >= L: W updated from mean v and burn) or
+    transcendence (W >= w_transcend), as update_lifecycle. Initial F / W are checked first as in
+    LifecycleEngine.__init__: already dead or transcended → terminal on day 0, W unchanged.
+    """
+    c = constants or DEFAULT_LIFECYCLE_CONSTANTS
+    s = np.asarray(stress_series, dtype=float).reshape(-1)
+    n = len(s)
+    r = np.broadcast_to(np.asarray(R, dtype=float), (n,))
+    shock = np.where(s >= c.theta_shock, 1.0 + c.alpha_shock, 1.0)
+    load = shock * s * (1.0 + c.beta_s * S_g) * (1.0 - c.beta_r * r)
+    recovery = c.gamma_0 + c.gamma_r * r + c.gamma_c * (1.0 - s)
+    limit = np.maximum(1e-9, c.l0 * (1.0 + c.delta_r * r) * (1.0 - c.delta_s * S_g))
+    up = (c.lambda_up * load).tolist()
+    down = (c.lambda_down * recovery).tolist()
+    limits = limit.tolist()
+
+    f_values = [0.0] * n
+    f = initial_f
+    w = initial_w
+    w_transcend = c.w_transcend
+    state = LifecycleState.ALIVE
+    terminal_day: int | None = None
+    days = 0
+    # LifecycleEngine.__init__: placeholder R = S_g = 0.5 for the initial-state check
+    initial_state = check_init_death_or_transcendence(
+        initial_f, initial_w, fatigue_limit(0.5, 0.5, c), w_transcend
+    )
+    if initial_state is not None:
+        state = initial_state
+        terminal_day = 0 if n else None
+    else:
+        for t in range(n):
+            if f >= limits[t]:
+                state = LifecycleState.DISABLED
+                terminal_day = t
+                break
+            if w >= w_transcend:
+                state = LifecycleState.TRANSCENDED
+                terminal_day = t
+                break
+            f = max(0.0, f + up[t] - down[t])
+            f_values[t] = f
+            days += 1
+
+    F = np.array(f_values[:days], dtype=float)
+    L = limit[:days]
+    q = np.where(L <= 0, 1.0, np.clip(F / L, 0.0, 1.0))
+    a_g = np.clip(1.0 - q ** c.rho, 0.0, 1.0)
+    v = a_g * s[:days]
+    burn = np.maximum(0.0, q - c.q_crit)
+    # add.accumulate is a sequential sum, as the running sum_v / sum_burn in the engine
+    sum_v = float(np.add.accumulate(v)[-1]) if days else 0.0
+    sum_burn = float(np.add.accumulate(burn)[-1]) if days else 0.0
+    if state == LifecycleState.DISABLED and initial_state is None:
+        count = max(1, days)
+        delta_w = c.eta_w * (sum_v / count) - c.xi_w * (sum_burn / count)
+        delta_w = max(c.delta_w_min, min(c.delta_w_max, delta_w))
+        w = max(0.0, min(1.0, w + delta_w))
+    return LifecycleTrajectory(
+        F=F, q=q, A_g=a_g, state=state, terminal_day=terminal_day, W=w, sum_v=sum_v, sum_burn=sum_burn
+    )
@@ -0,0 +1,281 @@
+"""
+Binary columnar state log for Spec 002 records (alongside JSON Lines, state_logger_v2).
+File = header + chunks. Each chunk is self-contained: fixed-width float columns
+(params_final, axis_final, effective_max_delta_summary, optional debug vectors),
+dictionary-encoded string fields (uint32 indices into a per-chunk string table),
+shock_flag as uint8, and an xxh3_64 checksum of the stored payload.
+float64 round-trips records exactly; float32 halves the size but is lossy (~1e-7 > REPLAY_TOLERANCE),
+so use it for analytics logs only.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+import orjson
+import xxhash
+
+from hnh.identity.layout import NUM_AXES, NUM_PARAMETERS
+
+MAGIC = b"HNHSLOG2"
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_RECORDS = 4096
+
+_FILE_HEADER = struct.Struct("<8sHB5x")  # magic, version, float width (4 | 8)
+_CHUNK_HEADER = struct.Struct("<4sHHIIQ")  # tag, flags, optional-field mask, n_records, payload_len, xxh3_64
+_CHUNK_TAG = b"HCHK"
+_FLAG_ZLIB = 1
+
+# Column order within a chunk payload: float columns first (aligned), then uint32 string indices,
+# then uint8 shock_flag, then the orjson string table.
+_FLOAT_FIELDS: tuple[tuple[str, int], ...] = (
+    ("params_final", NUM_PARAMETERS),
+    ("axis_final", NUM_AXES),
+    ("effective_max_delta_summary", NUM_AXES),
+)
+_OPTIONAL_FIELDS: tuple[tuple[str, int], ...] = (
+    ("params_base", NUM_PARAMETERS),
+    ("sensitivities", NUM_PARAMETERS),
+    ("raw_delta", NUM_PARAMETERS),
+    ("bounded_delta", NUM_PARAMETERS),
+)
+_STRING_FIELDS: tuple[str, ...] = (
+    "identity_hash",
+    "configuration_hash",
+    "injected_time_utc",
+    "transit_signature",
+    "memory_signature",
+)
+_KNOWN_FIELDS = frozenset(
+    [name for name, _ in _FLOAT_FIELDS + _OPTIONAL_FIELDS] + list(_STRING_FIELDS) + ["shock_flag"]
+)
+
+
+def _optional_mask(record: dict[str, Any]) -> int:
+    mask = 0
+    for bit, (name, _) in enumerate(_OPTIONAL_FIELDS):
+        if name in record:
+            mask |= 1 << bit
+    return mask
+
+
+@dataclass(frozen=True, eq=False)
+class StateLogBlock:
+    """
+    One chunk as columns: float arrays (n, width), string columns as tuples, shock_flag (n,) bool.
+    optional holds the debug vectors present in this chunk (params_base, sensitivities, ...).
+    """
+
+    identity_hash: tuple[str, ...]
+    configuration_hash: tuple[str, ...]
+    injected_time_utc: tuple[str, ...]
+    transit_signature: tuple[str, ...]
+    memory_signature: tuple[str, ...]
+    shock_flag: np.ndarray
+    params_final: np.ndarray
+    axis_final: np.ndarray
+    effective_max_delta_summary: np.ndarray
+    optional: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.shock_flag)
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Records as dicts (same shape as build_record_v2)."""
+        floats = {name: getattr(self, name).tolist() for name, _ in _FLOAT_FIELDS}
+        floats.update({name: arr.tolist() for name, arr in self.optional.items()})
+        shock = self.shock_flag.tolist()
+        strings = {name: getattr(self, name) for name in _STRING_FIELDS}
+        for i in range(len(shock)):
+            record: dict[str, Any] = {name: col[i] for name, col in strings.items()}
+            record["shock_flag"] = shock[i]
+            for name, rows in floats.items():
+                record[name] = rows[i]
+            yield record
+
+
+class BinaryStateLogWriter:
+    """
+    Buffer records and write them as columnar chunks of up to chunk_records.
+    A chunk also ends when the set of optional debug fields changes. Records must carry exactly the
+    v2 fields (required + optional debug vectors); other keys raise ValueError.
+    """
+
+    def __init__(
+        self,
+        out: str | Path | BinaryIO,
+        *,
+        chunk_records: int = DEFAULT_CHUNK_RECORDS,
+        float_dtype: str = "float64",
+        compress: bool = False,
+    ) -> None:
+        if chunk_records < 1:
+            raise ValueError(f"chunk_records must be >= 1, got {chunk_records}")
+        if float_dtype not in ("float64", "float32"):
+            raise ValueError(f"float_dtype must be 'float64' or 'float32', got {float_dtype!r}")
+        self._owns_stream = isinstance(out, (str, Path))
+        self._stream: BinaryIO = open(out, "wb") if isinstance(out, (str, Path)) else out
+        self._chunk_records = chunk_records
+        self._dtype = np.dtype(float_dtype).newbyteorder("<")
+        self._compress = compress
+        self._pending: list[dict[str, Any]] = []
+        self._pending_mask = 0
+        self._closed = False
+        self._stream.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION, self._dtype.itemsize))
+
+    def __enter__(self) -> BinaryStateLogWriter:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Buffer one record (build_record_v2 dict)."""
+        unknown = record.keys() - _KNOWN_FIELDS
+        if unknown:
+            raise ValueError(f"Unsupported fields for binary state log: {sorted(unknown)}")
+        mask = _optional_mask(record)
+        if self._pending and mask != self._pending_mask:
+            self.flush()
+        self._pending_mask = mask
+        self._pending.append(record)
+        if len(self._pending) >= self._chunk_records:
+            self.flush()
+
+    def write_many(self, records: Iterable[dict[str, Any]]) -> None:
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Write buffered records as one chunk."""
+        if not self._pending:
+            return
+        self._stream.write(_encode_chunk(self._pending, self._pending_mask, self._dtype, self._compress))
+        self._pending = []
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+
+def _encode_chunk(records: list[dict[str, Any]], mask: int, dtype: np.dtype, compress: bool) -> bytes:
+    n = len(records)
+    parts: list[bytes] = []
+    for name, width in _FLOAT_FIELDS + tuple(
+        field for bit, field in enumerate(_OPTIONAL_FIELDS) if mask & (1 << bit)
+    ):
+        column = np.array([r[name] for r in records], dtype=dtype)
+        if column.shape != (n, width):
+            raise ValueError(f"{name} must have {width} values per record")
+        parts.append(column.tobytes())
+    table: dict[str, int] = {}
+    for name in _STRING_FIELDS:
+        indices = np.fromiter((table.setdefault(r[name], len(table)) for r in records), dtype="<u4", count=n)
+        parts.append(indices.tobytes())
+    parts.append(np.fromiter((bool(r["shock_flag"]) for r in records), dtype=np.uint8, count=n).tobytes())
+    parts.append(orjson.dumps(list(table)))
+    payload = b"".join(parts)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= _FLAG_ZLIB
+    checksum = xxhash.xxh3_64_intdigest(payload, seed=0)
+    return _CHUNK_HEADER.pack(_CHUNK_TAG, flags, mask, n, len(payload), checksum) + payload
+
+
+def _decode_chunk(flags: int, mask: int, n: int, payload: bytes, dtype: np.dtype) -> StateLogBlock:
+    if flags & _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    offset = 0
+    floats: dict[str, np.ndarray] = {}
+    optional_fields = tuple(field for bit, field in enumerate(_OPTIONAL_FIELDS) if mask & (1 << bit))
+    for name, width in _FLOAT_FIELDS + optional_fields:
+        floats[name] = np.frombuffer(payload, dtype=dtype, count=n * width, offset=offset).reshape(n, width)
+        offset += n * width * dtype.itemsize
+    index_columns: dict[str, np.ndarray] = {}
+    for name in _STRING_FIELDS:
+        index_columns[name] = np.frombuffer(payload, dtype="<u4", count=n, offset=offset)
+        offset += 4 * n
+    shock = np.frombuffer(payload, dtype=np.uint8, count=n, offset=offset).astype(bool)
+    offset += n
+    table = orjson.loads(payload[offset:])
+    strings = {name: tuple(table[i] for i in idx.tolist()) for name, idx in index_columns.items()}
+    return StateLogBlock(
+        shock_flag=shock,
+        params_final=floats["params_final"],
+        axis_final=floats["axis_final"],
+        effective_max_delta_summary=floats["effective_max_delta_summary"],
+        optional={name: floats[name] for name, _ in optional_fields},
+        **strings,
+    )
+
+
+def iter_blocks(source: str | Path | BinaryIO) -> Iterator[StateLogBlock]:
+    """
+    Yield chunks of a binary state log as StateLogBlock (arrays are read-only views of the chunk).
+    Raises ValueError on a bad header, truncated chunk or checksum mismatch.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from iter_blocks(f)
+        return
+    header = source.read(_FILE_HEADER.size)
+    if len(header) != _FILE_HEADER.size:
+        raise ValueError("Not a binary state log: truncated header")
+    magic, version, width = _FILE_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a binary state log: bad magic")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary state log version {version}")
+    if width not in (4, 8):
+        raise ValueError(f"Unsupported float width {width}")
+    dtype = np.dtype(f"<f{width}")
+    chunk_ix = 0
+    while True:
+        head = source.read(_CHUNK_HEADER.size)
+        if not head:
+            return
+        if len(head) != _CHUNK_HEADER.size:
+            raise ValueError(f"Chunk {chunk_ix}: truncated header")
+        tag, flags, mask, n, length, checksum = _CHUNK_HEADER.unpack(head)
+        if tag != _CHUNK_TAG:
+            raise ValueError(f"Chunk {chunk_ix}: bad chunk tag")
+        payload = source.read(length)
+        if len(payload) != length:
+            raise ValueError(f"Chunk {chunk_ix}: truncated payload")
+        if xxhash.xxh3_64_intdigest(payload, seed=0) != checksum:
+            raise ValueError(f"Chunk {chunk_ix}: checksum mismatch")
+        yield _decode_chunk(flags, mask, n, payload, dtype)
+        chunk_ix += 1
+
+
+def iter_records(source: str | Path | BinaryIO) -> Iterator[dict[str, Any]]:
+    """Yield records (build_record_v2 dicts) in write order."""
+    for block in iter_blocks(source):
+        yield from block.records()
+
+
+def write_records_binary(
+    out: str | Path | BinaryIO,
+    records: Iterable[dict[str, Any]],
+    **kwargs: Any,
+) -> int:
+    """Write records to a binary state log (kwargs as BinaryStateLogWriter). Returns the record count."""
+    count = 0
+    with BinaryStateLogWriter(out, **kwargs) as writer:
+        for record in records:
+            writer.write(record)
+            count += 1
+    return count
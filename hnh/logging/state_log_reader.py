@@ -0,0 +1,157 @@
+"""
+Streaming reader and parallel validator for large v2 JSON Lines state logs.
+The file is memory-mapped and split into byte ranges that end on newline boundaries; each range is
+parsed (parse_line_v2) and validated (validate_record_v2) independently, optionally on a process pool.
+Nothing holds more than one range of lines at a time; results are combined in file order.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from hnh.logging.state_logger_v2 import parse_line_v2, validate_record_v2
+
+DEFAULT_CHUNK_BYTES: int = 8 << 20
+MAX_REPORTED_ERRORS: int = 100
+
+
+@dataclass(frozen=True)
+class LogValidationStats:
+    """
+    Aggregate result of validate_log: record/invalid line counts, valid records per identity_hash,
+    and the first errors as (line_number (1-based), message), at most MAX_REPORTED_ERRORS.
+    """
+
+    records: int
+    invalid: int
+    per_identity: dict[str, int]
+    errors: tuple[tuple[int, str], ...]
+
+    @property
+    def lines(self) -> int:
+        return self.records + self.invalid
+
+    @property
+    def ok(self) -> bool:
+        return self.invalid == 0
+
+
+def split_ranges(path: str | Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> list[tuple[int, int]]:
+    """Byte ranges [start, end) covering the file, each ending just after a newline (or at EOF)."""
+    if chunk_bytes < 1:
+        raise ValueError(f"chunk_bytes must be >= 1, got {chunk_bytes}")
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges: list[tuple[int, int]] = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            target = min(start + chunk_bytes, size)
+            nl = mm.find(b"\n", target - 1) if target < size else -1
+            end = size if nl < 0 else nl + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _range_lines(path: str | Path, start: int, end: int) -> list[bytes]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[start:end].splitlines()
+
+
+def _validate(record: Any) -> None:
+    if not isinstance(record, dict):
+        raise ValueError("Record is not an object")
+    validate_record_v2(record)
+    if not isinstance(record["identity_hash"], str):
+        raise ValueError("identity_hash must be a string")
+
+
+def iter_log_records(
+    path: str | Path,
+    *,
+    validate: bool = False,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield records in file order, one range in memory at a time.
+    Raises ValueError (with 1-based line number) on the first unparsable or (validate=True) invalid line.
+    """
+    line_no = 0
+    for start, end in split_ranges(path, chunk_bytes):
+        for line in _range_lines(path, start, end):
+            line_no += 1
+            try:
+                record = parse_line_v2(line)
+                if validate:
+                    _validate(record)
+            except ValueError as e:
+                raise ValueError(f"line {line_no}: {e}") from e
+            yield record
+
+
+def _validate_range(path: str, start: int, end: int) -> tuple[int, int, Counter[str], list[tuple[int, str]]]:
+    """Validate one range: (lines, invalid, per-identity counts, errors with range-local 1-based line numbers)."""
+    per_identity: Counter[str] = Counter()
+    errors: list[tuple[int, str]] = []
+    invalid = 0
+    lines = _range_lines(path, start, end)
+    for i, line in enumerate(lines, start=1):
+        try:
+            record = parse_line_v2(line)
+            _validate(record)
+        except ValueError as e:  # orjson.JSONDecodeError is a ValueError
+            invalid += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append((i, str(e)))
+            continue
+        per_identity[record["identity_hash"]] += 1
+    return len(lines), invalid, per_identity, errors
+
+
+def validate_log(
+    path: str | Path,
+    *,
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> LogValidationStats:
+    """
+    Parse and validate every line; ranges run on a process pool when workers > 1.
+    Same stats for any worker count.
+    """
+    path = str(path)
+    ranges = split_ranges(path, chunk_bytes)
+    if workers <= 1 or len(ranges) <= 1:
+        results: Iterator[Any] = (_validate_range(path, s, e) for s, e in ranges)
+        return _combine(results)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        n = len(ranges)
+        return _combine(pool.map(_validate_range, [path] * n, [s for s, _ in ranges], [e for _, e in ranges]))
+
+
+def _combine(results: Iterator[tuple[int, int, Counter[str], list[tuple[int, str]]]]) -> LogValidationStats:
+    total_lines = 0
+    invalid = 0
+    per_identity: Counter[str] = Counter()
+    errors: list[tuple[int, str]] = []
+    for lines, bad, counts, range_errors in results:
+        for local_line, message in range_errors:
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append((total_lines + local_line, message))
+        total_lines += lines
+        invalid += bad
+        per_identity.update(counts)
+    return LogValidationStats(
+        records=total_lines - invalid,
+        invalid=invalid,
+        per_identity=dict(sorted(per_identity.items())),
+        errors=tuple(errors),
+    )
@@ -5,11 +5,15 @@ Uses orjson only in core path; no stdlib json. Replay signature and effective_ma
 
 from __future__ import annotations
 
-from typing import Any, TextIO
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
 
 import orjson
 
-from hnh.identity.schema import NUM_AXES, NUM_PARAMETERS, _PARAMETER_LIST
+from hnh.identity.layout import NUM_AXES, NUM_PARAMETERS, _PARAMETER_LIST
 
 # Required fields per spec §13 / FR-010
 STATE_LOG_V2_REQUIRED_FIELDS = (
@@ -95,6 +99,144 @@ def write_record_v2(record: dict[str, Any], stream: TextIO) -> None:
     stream.write(line_bytes.decode("utf-8") + "\n")
 
 
+def record_from_result_v2(result: Any, **debug: tuple[float, ...]) -> dict[str, Any]:
+    """
+    build_record_v2 from a ReplayResult (run_step_v2 output): effective_max_delta is summarized per axis.
+    debug: optional params_base / sensitivities / raw_delta / bounded_delta.
+    """
+    return build_record_v2(
+        identity_hash=result.identity_hash,
+        configuration_hash=result.configuration_hash,
+        injected_time_utc=result.injected_time_utc,
+        transit_signature=result.transit_signature,
+        shock_flag=result.shock_flag,
+        effective_max_delta_summary_8=effective_max_delta_summary(result.effective_max_delta),
+        axis_final=result.axis_final,
+        params_final=result.params_final,
+        memory_signature=result.memory_signature,
+        **debug,
+    )
+
+
+DEFAULT_FLUSH_BYTES = 1 << 20
+_WRITER_QUEUE_BLOCKS = 8
+
+
+class StateLogWriter:
+    """
+    Buffered JSON Lines writer for v2 records (bytes in, bytes out; no per-line decode).
+    write() accepts a record dict or a ReplayResult. Lines accumulate in a buffer that is written in
+    one block once it reaches flush_bytes, or on write() after flush_interval seconds since the last
+    flush, and on flush()/close(). background=True hands blocks to a writer thread (bounded queue of
+    blocks, so memory stays capped if the disk falls behind); write errors surface on the next
+    write/flush/close. Output is byte-identical to write_record_v2 per record.
+    """
+
+    def __init__(
+        self,
+        out: str | Path | BinaryIO,
+        *,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval: float | None = None,
+        background: bool = False,
+        append: bool = False,
+    ) -> None:
+        if flush_bytes < 1:
+            raise ValueError(f"flush_bytes must be >= 1, got {flush_bytes}")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError(f"flush_interval must be > 0, got {flush_interval}")
+        self._owns_stream = isinstance(out, (str, Path))
+        self._stream: BinaryIO = open(out, "ab" if append else "wb") if isinstance(out, (str, Path)) else out
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._error: BaseException | None = None
+        self._queue: queue.Queue[bytes | None] | None = None
+        self._thread: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue(maxsize=_WRITER_QUEUE_BLOCKS)
+            self._thread = threading.Thread(target=self._drain, name="hnh-state-log-writer", daemon=True)
+            self._thread.start()
+
+    def __enter__(self) -> StateLogWriter:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        assert self._queue is not None
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            if self._error is None:
+                try:
+                    self._stream.write(block)
+                except BaseException as e:  # surfaced to the producer
+                    self._error = e
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed StateLogWriter")
+
+    def write(self, item: dict[str, Any] | Any) -> None:
+        """Buffer one record (dict) or ReplayResult as one line."""
+        self._check_open()
+        record = item if isinstance(item, dict) else record_from_result_v2(item)
+        self._buffer += emit_line_v2(record)
+        self._buffer += b"\n"
+        if len(self._buffer) >= self._flush_bytes or (
+            self._flush_interval is not None and time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self._flush()
+
+    def write_many(self, items: Any) -> None:
+        for item in items:
+            self.write(item)
+
+    def flush(self) -> None:
+        """Hand the buffer to the stream (or writer thread). Does not wait for the thread."""
+        self._check_open()
+        self._flush()
+
+    def _flush(self) -> None:
+        self._raise_pending_error()
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        block = bytes(self._buffer)
+        self._buffer.clear()
+        if self._queue is not None:
+            self._queue.put(block)
+        else:
+            self._stream.write(block)
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and close (or flush) the stream."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._flush()
+        finally:
+            if self._queue is not None and self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+            if self._owns_stream:
+                self._stream.close()
+            else:
+                self._stream.flush()
+        self._raise_pending_error()
+
+
 def parse_line_v2(line: str | bytes) -> dict[str, Any]:
     """Parse one JSON Lines record. Uses orjson."""
     if isinstance(line, str):
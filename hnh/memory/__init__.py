@@ -1,6 +1,12 @@
-"""Memory: relational memory, update rules."""
+"""Memory: relational memory, update rules, persistent SQLite store."""
 
 from hnh.memory.relational import RelationalMemory
+from hnh.memory.sqlite_store import SQLiteRelationalMemoryStore
 from hnh.memory.update_rules import compute_behavioral_modifier, compute_derived
 
-__all__ = ["RelationalMemory", "compute_behavioral_modifier", "compute_derived"]
+__all__ = [
+    "RelationalMemory",
+    "SQLiteRelationalMemoryStore",
+    "compute_behavioral_modifier",
+    "compute_derived",
+]
@@ -2,77 +2,130 @@
 User-scoped Relational Memory: ordered events (sequence, type, payload).
 Deterministic update rules; serializable snapshot; no Identity Core mutation.
 Spec 002: memory_delta_32, memory_signature for replay.
+Running counters (interaction_count, error_count) and a chained xxh3 signature are updated in
+add_event, so derived metrics, memory_delta_32 and memory_signature are O(1) per call.
 """
 
 from __future__ import annotations
 
+import sys
+from array import array
+from copy import deepcopy
+from collections.abc import Iterator
 from typing import Any
 
 import orjson
 import xxhash
 
 from hnh.memory.update_rules import (
-    compute_behavioral_modifier,
-    compute_derived,
-    compute_memory_delta_32,
+    behavioral_modifier_from_derived,
+    derived_from_counts,
+    memory_delta_32_from_derived,
 )
 
 
+def signature_seed(user_id: str) -> bytes:
+    """Chain start for memory_signature: xxh3_128 digest of canonical {"user_id": ...}."""
+    blob = orjson.dumps({"user_id": user_id}, option=orjson.OPT_SORT_KEYS)
+    return xxhash.xxh3_128(blob, seed=0).digest()
+
+
+def chain_signature(prev_digest: bytes, event: dict[str, Any]) -> bytes:
+    """Next chain digest: xxh3_128(prev_digest ‖ canonical orjson of event {sequence, type, payload})."""
+    h = xxhash.xxh3_128(prev_digest, seed=0)
+    h.update(orjson.dumps(event, option=orjson.OPT_SORT_KEYS))
+    return h.digest()
+
+
+# Process-wide interned event types: code → name; per-memory storage keeps only the codes
+_TYPE_CODES: dict[str, int] = {}
+_TYPE_NAMES: list[str] = []
+
+
+def _type_code(event_type: str) -> int:
+    code = _TYPE_CODES.get(event_type)
+    if code is None:
+        code = len(_TYPE_NAMES)
+        _TYPE_NAMES.append(sys.intern(event_type))
+        _TYPE_CODES[_TYPE_NAMES[code]] = code
+    return code
+
+
 class RelationalMemory:
     """
     In-memory, user-scoped memory. One instance per user_id.
-    Ordered list of events; each event: sequence (step), type, payload.
+    Ordered events; each event: sequence (step), type, payload.
+    Compact storage: sequences in array('q'), interned type codes in array('I'),
+    non-empty payloads out-of-line (event index → payload). Event dicts are built only on read.
     """
 
-    __slots__ = ("user_id", "_events")
+    __slots__ = ("user_id", "_sequences", "_type_codes", "_payloads", "_error_count", "_signature")
 
     def __init__(self, user_id: str) -> None:
         self.user_id = user_id
-        self._events: list[dict[str, Any]] = []
+        self._sequences = array("q")
+        self._type_codes = array("I")
+        self._payloads: dict[int, dict[str, Any]] = {}
+        self._error_count = 0
+        self._signature = signature_seed(user_id)
 
     def add_event(self, sequence: int, event_type: str, payload: dict[str, Any] | None = None) -> None:
-        """Append one event. Deterministic order preserved."""
-        self._events.append({
+        """
+        Append one event. Deterministic order preserved. Counters and signature chain updated here.
+        The payload is copied: later changes to the caller's dict do not alter the stored event.
+        """
+        payload = deepcopy(payload) if payload else {}
+        event = {
             "sequence": sequence,
             "type": event_type,
-            "payload": payload or {},
-        })
+            "payload": payload,
+        }
+        self._signature = chain_signature(self._signature, event)
+        if payload:
+            self._payloads[len(self._sequences)] = payload
+        self._sequences.append(sequence)
+        self._type_codes.append(_type_code(event_type))
+        if event_type == "error":
+            self._error_count += 1
+
+    def __len__(self) -> int:
+        return len(self._sequences)
+
+    def iter_events(self) -> Iterator[dict[str, Any]]:
+        """Events in order as {sequence, type, payload} dicts, built lazily."""
+        payloads = self._payloads
+        for i, (sequence, code) in enumerate(zip(self._sequences, self._type_codes)):
+            yield {"sequence": sequence, "type": _TYPE_NAMES[code], "payload": payloads.get(i, {})}
 
     @property
     def events(self) -> list[dict[str, Any]]:
-        """Ordered list of events (read-only view)."""
-        return list(self._events)
+        """Ordered list of events (fresh list of dicts)."""
+        return list(self.iter_events())
 
     def derived_metrics(self) -> dict[str, Any]:
-        """Deterministic derived metrics from current event history."""
-        return compute_derived(self._events)
+        """Deterministic derived metrics from current event history (running counters)."""
+        return derived_from_counts(len(self._sequences), self._error_count)
 
     def get_behavioral_modifier(self) -> dict[str, float]:
         """
         Behavioral modifier (7 dims, [0,1]) for Dynamic State input.
         Same history → same modifier. Reject not applicable here (we clamp in update_rules).
         """
-        return compute_behavioral_modifier(self._events)
+        return behavioral_modifier_from_derived(self.derived_metrics())
 
     def get_memory_delta_32(self, global_max_delta: float) -> tuple[float, ...]:
         """
         Deterministic memory_delta vector (32 params) for Spec 002.
         |memory_delta[p]| ≤ 0.5 × global_max_delta. Same history → same vector.
         """
-        return compute_memory_delta_32(self._events, global_max_delta)
+        return memory_delta_32_from_derived(self.derived_metrics(), global_max_delta)
 
     def memory_signature(self) -> str:
         """
-        Hash of snapshot for replay signature. Deterministic: same snapshot → same hash.
+        Rolling hash for replay signature: chain over user_id and events (sequence, type, payload)
+        in append order. Deterministic: same user_id + same events → same hash. Payload captured at add_event.
         """
-        snap = self.snapshot()
-        # Canonical: user_id + events (sequence, type, payload)
-        payload = {
-            "user_id": snap["user_id"],
-            "events": snap["events"],
-        }
-        blob = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
-        return xxhash.xxh3_128(blob, seed=0).hexdigest()
+        return self._signature.hex()
 
     def snapshot(self) -> dict[str, Any]:
         """
@@ -85,3 +138,46 @@ class RelationalMemory:
             "derived": self.derived_metrics(),
             "behavioral_modifier": self.get_behavioral_modifier(),
         }
+
+    def snapshot_columns(self) -> dict[str, Any]:
+        """
+        Columnar export for bulk persistence (no per-event dicts):
+        user_id; types (names, first-appearance order); sequence array('q'); type_code array('I')
+        (indices into types); payload_index array('q') and payloads (non-empty payloads only);
+        signature (hex). Arrays are copies. Restore with from_columns().
+        """
+        local: dict[int, int] = {}
+        type_code = array("I", (local.setdefault(code, len(local)) for code in self._type_codes))
+        names = [""] * len(local)
+        for code, idx in local.items():
+            names[idx] = _TYPE_NAMES[code]
+        payload_index = array("q", sorted(self._payloads))
+        return {
+            "user_id": self.user_id,
+            "types": tuple(names),
+            "sequence": array("q", self._sequences),
+            "type_code": type_code,
+            "payload_index": payload_index,
+            "payloads": [self._payloads[i] for i in payload_index],
+            "signature": self.memory_signature(),
+        }
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, Any]) -> RelationalMemory:
+        """
+        Rebuild from snapshot_columns() output. Counters and signature chain are recomputed;
+        raises ValueError if columns are inconsistent or the stored signature does not match.
+        """
+        sequence = columns["sequence"]
+        type_code = columns["type_code"]
+        types = columns["types"]
+        if len(sequence) != len(type_code):
+            raise ValueError("sequence and type_code columns must have the same length")
+        payloads = dict(zip(columns.get("payload_index", ()), columns.get("payloads", ())))
+        mem = cls(columns["user_id"])
+        for i, (seq, code) in enumerate(zip(sequence, type_code)):
+            mem.add_event(int(seq), types[code], payloads.get(i))
+        expected = columns.get("signature")
+        if expected is not None and expected != mem.memory_signature():
+            raise ValueError("memory_signature mismatch after restoring columns")
+        return mem
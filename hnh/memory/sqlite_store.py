@@ -0,0 +1,220 @@
+"""
+Persistent relational memory: SQLite (WAL) store for many users.
+Append-only event log per user (one table, keyed by (user_id, idx)), batched inserts;
+derived counters and the chained memory_signature materialized per user, so derived metrics,
+memory_delta_32 and memory_signature need no history load. Full RelationalMemory is loaded lazily
+on get() and kept in an LRU of hot users.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from hnh.memory.relational import RelationalMemory, chain_signature, signature_seed
+from hnh.memory.update_rules import (
+    behavioral_modifier_from_derived,
+    derived_from_counts,
+    memory_delta_32_from_derived,
+)
+
+DEFAULT_BATCH_SIZE: int = 1000
+DEFAULT_HOT_USERS: int = 1024
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS memory_users (
+        user_id TEXT PRIMARY KEY,
+        interaction_count INTEGER NOT NULL,
+        error_count INTEGER NOT NULL,
+        signature BLOB NOT NULL
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS memory_events (
+        user_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        sequence INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        payload BLOB,
+        PRIMARY KEY (user_id, idx)
+    ) WITHOUT ROWID""",
+)
+
+
+class _UserState:
+    """Materialized counters + signature for one user; memory is the loaded history (or None)."""
+
+    __slots__ = ("interaction_count", "error_count", "signature", "memory", "dirty")
+
+    def __init__(self, interaction_count: int, error_count: int, signature: bytes) -> None:
+        self.interaction_count = interaction_count
+        self.error_count = error_count
+        self.signature = signature
+        self.memory: RelationalMemory | None = None
+        self.dirty = False
+
+
+class SQLiteRelationalMemoryStore:
+    """
+    Many users' RelationalMemory in one SQLite file.
+    add_event() is buffered (flush every batch_size events, on close, or explicitly via flush()).
+    Counters and signature are exact at any time (pending events included); get() flushes first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        hot_users: int = DEFAULT_HOT_USERS,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if hot_users < 1:
+            raise ValueError(f"hot_users must be >= 1, got {hot_users}")
+        self.path = Path(path)
+        self._batch_size = batch_size
+        self._hot_users = hot_users
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+        self._conn.commit()
+        self._hot: OrderedDict[str, _UserState] = OrderedDict()
+        self._pending: list[tuple[str, int, int, str, bytes | None]] = []
+
+    # --- context manager -------------------------------------------------------------------
+
+    def __enter__(self) -> SQLiteRelationalMemoryStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending events and close the connection."""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None  # type: ignore[assignment]
+
+    # --- per-user state --------------------------------------------------------------------
+
+    def _state(self, user_id: str) -> _UserState:
+        state = self._hot.get(user_id)
+        if state is not None:
+            self._hot.move_to_end(user_id)
+            return state
+        row = self._conn.execute(
+            "SELECT interaction_count, error_count, signature FROM memory_users WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+        if row is None:
+            state = _UserState(0, 0, signature_seed(user_id))
+        else:
+            state = _UserState(row[0], row[1], bytes(row[2]))
+        self._hot[user_id] = state
+        if len(self._hot) > self._hot_users:
+            _, evicted = next(iter(self._hot.items()))
+            if evicted.dirty:
+                self.flush()
+            self._hot.popitem(last=False)
+        return state
+
+    def add_event(
+        self,
+        user_id: str,
+        sequence: int,
+        event_type: str,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """Append one event for user_id (same semantics as RelationalMemory.add_event)."""
+        state = self._state(user_id)
+        payload = payload or {}
+        event = {"sequence": sequence, "type": event_type, "payload": payload}
+        state.signature = chain_signature(state.signature, event)
+        self._pending.append((
+            user_id,
+            state.interaction_count,
+            sequence,
+            event_type,
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS) if payload else None,
+        ))
+        state.interaction_count += 1
+        if event_type == "error":
+            state.error_count += 1
+        state.dirty = True
+        if state.memory is not None:
+            state.memory.add_event(sequence, event_type, payload)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending events and dirty counters in one transaction."""
+        dirty = [(uid, st) for uid, st in self._hot.items() if st.dirty]
+        if not self._pending and not dirty:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO memory_events (user_id, idx, sequence, type, payload) VALUES (?, ?, ?, ?, ?)",
+                self._pending,
+            )
+            self._conn.executemany(
+                "INSERT INTO memory_users (user_id, interaction_count, error_count, signature) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(user_id) DO UPDATE SET "
+                "interaction_count = excluded.interaction_count, error_count = excluded.error_count, "
+                "signature = excluded.signature",
+                [(uid, st.interaction_count, st.error_count, st.signature) for uid, st in dirty],
+            )
+        self._pending.clear()
+        for _, st in dirty:
+            st.dirty = False
+
+    # --- O(1) reads (no history load) ------------------------------------------------------
+
+    def derived_metrics(self, user_id: str) -> dict[str, Any]:
+        state = self._state(user_id)
+        return derived_from_counts(state.interaction_count, state.error_count)
+
+    def get_behavioral_modifier(self, user_id: str) -> dict[str, float]:
+        return behavioral_modifier_from_derived(self.derived_metrics(user_id))
+
+    def get_memory_delta_32(self, user_id: str, global_max_delta: float) -> tuple[float, ...]:
+        """Same as RelationalMemory.get_memory_delta_32, from materialized counters."""
+        return memory_delta_32_from_derived(self.derived_metrics(user_id), global_max_delta)
+
+    def memory_signature(self, user_id: str) -> str:
+        """Same as RelationalMemory.memory_signature, from the materialized chain digest."""
+        return self._state(user_id).signature.hex()
+
+    # --- full history ----------------------------------------------------------------------
+
+    def get(self, user_id: str) -> RelationalMemory:
+        """
+        Full RelationalMemory for user_id (loaded once, kept while the user is hot).
+        Raises ValueError if the stored history does not reproduce the stored signature.
+        """
+        state = self._state(user_id)
+        if state.memory is not None:
+            return state.memory
+        self.flush()
+        memory = RelationalMemory(user_id)
+        rows = self._conn.execute(
+            "SELECT sequence, type, payload FROM memory_events WHERE user_id = ? ORDER BY idx",
+            (user_id,),
+        )
+        for sequence, event_type, payload in rows:
+            memory.add_event(sequence, event_type, orjson.loads(payload) if payload is not None else None)
+        if memory.memory_signature() != state.signature.hex():
+            raise ValueError(f"Stored history of user_id={user_id!r} does not match its memory_signature")
+        state.memory = memory
+        return memory
+
+    def user_ids(self) -> list[str]:
+        """All user_ids with stored or pending events, sorted."""
+        self.flush()
+        return [row[0] for row in self._conn.execute("SELECT user_id FROM memory_users ORDER BY user_id")]
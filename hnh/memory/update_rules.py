@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from hnh.identity.schema import NUM_PARAMETERS, _PARAMETER_LIST
+from hnh.identity.layout import NUM_PARAMETERS, _PARAMETER_LIST
 
 DIMENSION_NAMES = (
     "warmth",
@@ -26,8 +26,11 @@ def compute_derived(events: list[dict[str, Any]]) -> dict[str, Any]:
     Deterministic derived metrics from ordered events.
     Returns: interaction_count, error_rate, responsiveness_metric (0–1), etc.
     """
-    n = len(events)
-    error_count = sum(1 for e in events if e.get("type") == "error")
+    return derived_from_counts(len(events), sum(1 for e in events if e.get("type") == "error"))
+
+
+def derived_from_counts(n: int, error_count: int) -> dict[str, Any]:
+    """Derived metrics from running counters (interaction_count, error_count); same as compute_derived."""
     error_rate = error_count / max(1, n)
     # Responsiveness: inverse of error rate, capped; or from payload if present
     responsiveness = 1.0 - min(1.0, error_rate * 1.5)
@@ -44,7 +47,11 @@ def compute_behavioral_modifier(events: list[dict[str, Any]]) -> dict[str, float
     Map event history to a behavioral modifier vector (7 dims, all in [0, 1]).
     Deterministic: same events → same modifier. For Dynamic State input.
     """
-    derived = compute_derived(events)
+    return behavioral_modifier_from_derived(compute_derived(events))
+
+
+def behavioral_modifier_from_derived(derived: dict[str, Any]) -> dict[str, float]:
+    """Behavioral modifier from derived metrics (as returned by compute_derived / derived_from_counts)."""
     n = derived["interaction_count"]
     err = derived["error_rate"]
     resp = derived["responsiveness_metric"]
@@ -77,7 +84,11 @@ def compute_memory_delta_32(
     |memory_delta[p]| ≤ 0.5 × global_max_delta. Does not mutate Identity Core.
     Same events + same global_max_delta → same vector.
     """
-    derived = compute_derived(events)
+    return memory_delta_32_from_derived(compute_derived(events), global_max_delta)
+
+
+def memory_delta_32_from_derived(derived: dict[str, Any], global_max_delta: float) -> tuple[float, ...]:
+    """memory_delta (32) from derived metrics; same as compute_memory_delta_32 on the same history."""
     n = derived["interaction_count"]
     err = derived["error_rate"]
     resp = derived["responsiveness_metric"]
@@ -6,13 +6,10 @@ Shock: effective_max_delta = max_delta × shock_multiplier (cap 2.0).
 
 from __future__ import annotations
 
-from hnh.config.replay_config import ReplayConfig, resolve_max_delta
-from hnh.identity.schema import AXES, NUM_PARAMETERS, get_parameter_axis_index
+import numpy as np
 
-# Имя оси для каждого параметра (0..31), один раз при загрузке — без вызовов get_parameter_axis_index в цикле
-_PARAM_AXIS_NAME: tuple[str, ...] = tuple(
-    AXES[get_parameter_axis_index(p_ix)] for p_ix in range(NUM_PARAMETERS)
-)
+from hnh.config.replay_config import ReplayConfig
+from hnh.identity.layout import NUM_PARAMETERS
 
 
 def apply_bounds(
@@ -23,17 +20,29 @@ def apply_bounds(
     """
     Apply hierarchy and optional shock to get effective_max_delta per param,
     then clamp raw_delta to bounded_delta.
+    effective_max_delta comes precompiled from config.compiled_bounds (resolved once per config).
     Returns (bounded_delta, effective_max_delta) both length 32.
     """
     if len(raw_delta) != NUM_PARAMETERS:
         raise ValueError(f"raw_delta length must be {NUM_PARAMETERS}, got {len(raw_delta)}")
-    multiplier = config.shock_multiplier if shock_active else 1.0
-    effective = [0.0] * NUM_PARAMETERS
-    bounded = [0.0] * NUM_PARAMETERS
-    for p_ix in range(NUM_PARAMETERS):
-        max_d = resolve_max_delta(p_ix, config, _PARAM_AXIS_NAME[p_ix])
-        eff = max_d * multiplier
-        effective[p_ix] = eff
-        raw_val = raw_delta[p_ix]
-        bounded[p_ix] = max(-eff, min(eff, raw_val))
-    return (tuple(bounded), tuple(effective))
+    effective = config.compiled_bounds.effective(shock_active)
+    bounded = tuple(max(-eff, min(eff, raw_val)) for eff, raw_val in zip(effective, raw_delta))
+    return (bounded, effective)
+
+
+def apply_bounds_batch(
+    raw_delta: np.ndarray,
+    config: ReplayConfig,
+    shock_active: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Batch apply_bounds: raw_delta (T, 32), shock_active (T,) bool.
+    One clip of the whole block against the compiled normal/shock vectors.
+    Returns (bounded_delta, effective_max_delta), both (T, 32).
+    """
+    if raw_delta.ndim != 2 or raw_delta.shape[1] != NUM_PARAMETERS:
+        raise ValueError(f"raw_delta must have shape (T, {NUM_PARAMETERS}), got {raw_delta.shape}")
+    compiled = config.compiled_bounds
+    effective = np.where(np.asarray(shock_active)[:, None], compiled.shock_array, compiled.normal_array)
+    bounded = np.clip(raw_delta, -effective, effective)
+    return (bounded, effective)
@@ -2,14 +2,19 @@
 Raw delta calculation for 32 parameters (Spec 002).
 raw_delta[p] = Σ(aspect_weight × mapping_weight × intensity_factor).
 Only parameters whose axis is in affected_axes (from planet1/planet2) receive delta.
+Static tables are compiled once into a (planet1, planet2, aspect) → 32 weight table (compile_aspect_weights).
 Deterministic; no system clock.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
-from hnh.identity.schema import (
+import numpy as np
+
+from hnh.astrology.aspects import MAJOR_ASPECTS
+from hnh.identity.layout import (
     AXES,
     NUM_PARAMETERS,
     PARAMETERS,
@@ -140,7 +145,111 @@ def _intensity_factor(aspect: dict[str, Any], orb_scale: float = 1.0) -> float:
     orb = 8.0 * orb_scale
     if orb <= 0:
         return 1.0
-    return max(0.0, 1.0 - dev / orb)
+    intensity: float = max(0.0, 1.0 - dev / orb)
+    return intensity
+
+
+# Planet slots of the compiled tensor: mapped planets, then any unmapped name, then "no planet info"
+_UNMAPPED_PLANET = "\x00unmapped"
+PLANET_SLOTS: tuple[str | None, ...] = (*PLANET_AXIS_MAP, _UNMAPPED_PLANET, None)
+_PLANET_SLOT_INDEX: dict[str | None, int] = {p: i for i, p in enumerate(PLANET_SLOTS)}
+
+
+def _outer_multiplier(planet: str | None) -> float:
+    """OUTER_PLANET_MULTIPLIER for a planet slot; 1.0 for unmapped / missing planets."""
+    return 1.0 if planet is None else OUTER_PLANET_MULTIPLIER.get(planet, 1.0)
+
+
+def _planet_category(planet: str | None) -> str:
+    """PLANET_CATEGORY for an aspect planet field; missing / unknown planets are personal."""
+    return "personal" if planet is None else PLANET_CATEGORY.get(planet, "personal")
+
+# Compiled custom aspect_weights are cached by identity (caller must not mutate them afterwards)
+_COMPILED_WEIGHTS_MAX = 16
+_compiled_weights: dict[int, tuple[dict[str, dict[str, float]], CompiledAspectWeights]] = {}
+
+
+def _planet_slot(planet: str | None) -> str | None:
+    """Slot key for a planet name: itself if mapped, None if absent, else the shared unmapped slot."""
+    if planet is None or planet in PLANET_AXIS_MAP:
+        return planet
+    return _UNMAPPED_PLANET
+
+
+def _affected_axes(planet1: str | None, planet2: str | None) -> set[str]:
+    """Union of axes mapped from planet1 and planet2 (PLANET_AXIS_MAP)."""
+    axes: set[str] = set()
+    for planet in (planet1, planet2):
+        ax = PLANET_AXIS_MAP.get(planet) if planet else None
+        if ax is None:
+            continue
+        if isinstance(ax, str):
+            axes.add(ax)
+        else:
+            axes.update(ax)
+    return axes
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledAspectWeights:
+    """
+    aspect_weights × PLANET_AXIS_MAP × OUTER_PLANET_MULTIPLIER compiled once.
+    entries: (planet1_slot, planet2_slot, aspect) → (outer_mul, ((param_index, weight), ...)); only
+    contributing combinations are present. tensor: dense (slot, slot, aspect, 32) of weight × outer_mul,
+    aspects in MAJOR_ASPECTS order followed by any extra aspect names from the weights.
+    """
+
+    aspects: tuple[str, ...]
+    entries: dict[tuple[str | None, str | None, str], tuple[float, tuple[tuple[int, float], ...]]]
+    tensor: np.ndarray
+
+
+def _compile_weights(weights: dict[str, dict[str, float]]) -> CompiledAspectWeights:
+    major = [name for name, _ in MAJOR_ASPECTS]
+    aspects = tuple(major + [name for name in weights if name not in major])
+    entries: dict[tuple[str | None, str | None, str], tuple[float, tuple[tuple[int, float], ...]]] = {}
+    tensor = np.zeros((len(PLANET_SLOTS), len(PLANET_SLOTS), len(aspects), NUM_PARAMETERS), dtype=float)
+    for i, planet1 in enumerate(PLANET_SLOTS):
+        for j, planet2 in enumerate(PLANET_SLOTS):
+            affected_axes = _affected_axes(planet1, planet2)
+            has_planet_info = planet1 is not None or planet2 is not None
+            if has_planet_info and not affected_axes:
+                # Planet fields exist but none are mapped → don't affect any axis
+                continue
+            outer_mul = max(_outer_multiplier(planet1), _outer_multiplier(planet2))
+            for k, aspect_name in enumerate(aspects):
+                params: list[tuple[int, float]] = []
+                for param_name, w in weights.get(aspect_name, {}).items():
+                    idx = _PARAM_NAME_TO_INDEX.get(param_name)
+                    if idx is None:
+                        continue
+                    # When aspect has planet1/planet2, only params of those axes get delta
+                    if affected_axes and _axis_of_param(param_name) not in affected_axes:
+                        continue
+                    params.append((idx, w))
+                    tensor[i, j, k, idx] += w * outer_mul
+                if params:
+                    entries[(planet1, planet2, aspect_name)] = (outer_mul, tuple(params))
+    tensor.setflags(write=False)
+    return CompiledAspectWeights(aspects=aspects, entries=entries, tensor=tensor)
+
+
+def compile_aspect_weights(
+    aspect_weights: dict[str, dict[str, float]] | None = None,
+) -> CompiledAspectWeights:
+    """
+    Compiled form of aspect_weights (default: _DEFAULT_ASPECT_WEIGHTS_32).
+    Cached by identity of the weights dict: the same dict object compiles once.
+    """
+    weights = aspect_weights or _DEFAULT_ASPECT_WEIGHTS_32
+    hit = _compiled_weights.get(id(weights))
+    if hit is not None and hit[0] is weights:
+        return hit[1]
+    compiled = _compile_weights(weights)
+    if len(_compiled_weights) >= _COMPILED_WEIGHTS_MAX:
+        _compiled_weights.pop(next(iter(_compiled_weights)))
+    _compiled_weights[id(weights)] = (weights, compiled)
+    return compiled
 
 
 def compute_raw_delta_32(
@@ -152,52 +261,111 @@ def compute_raw_delta_32(
     Map transit–natal aspects to raw_delta vector (32 params).
     Only parameters whose axis is in {axis(planet1), axis(planet2)} receive delta.
     Formula: raw_delta[p] = Σ(aspect_weight × mapping_weight × intensity_factor).
-    Deterministic; same aspects → same output.
+    Gather over the compiled (planet1, planet2, aspect) table; deterministic, same aspects → same output.
     """
-    weights = aspect_weights or _DEFAULT_ASPECT_WEIGHTS_32
+    entries = compile_aspect_weights(aspect_weights).entries
     raw = [0.0] * NUM_PARAMETERS
     for asp in aspects_to_natal:
-        aspect_name = asp.get("aspect", "")
-        if aspect_name not in weights:
-            continue
-        planet1 = asp.get("planet1")
-        planet2 = asp.get("planet2")
-        axis1 = PLANET_AXIS_MAP.get(planet1) if planet1 else None
-        axis2 = PLANET_AXIS_MAP.get(planet2) if planet2 else None
-        affected_axes: set[str] = set()
-        for ax in (axis1, axis2):
-            if ax is None:
-                continue
-            if isinstance(ax, str):
-                affected_axes.add(ax)
-            else:
-                affected_axes.update(ax)
-        has_planet_info = planet1 is not None or planet2 is not None
-        if has_planet_info and not affected_axes:
-            # Planet fields exist but none are mapped → don't affect any axis
+        entry = entries.get(
+            (_planet_slot(asp.get("planet1")), _planet_slot(asp.get("planet2")), asp.get("aspect", ""))
+        )
+        if entry is None:
             continue
         intensity = _intensity_factor(asp, orb_scale)
-        outer_mul = max(
-            OUTER_PLANET_MULTIPLIER.get(planet1, 1.0),
-            OUTER_PLANET_MULTIPLIER.get(planet2, 1.0),
-        )
-        for param_name, w in weights[aspect_name].items():
-            idx = _PARAM_NAME_TO_INDEX.get(param_name)
-            if idx is None:
-                continue
-            # When aspect has planet1/planet2, only params of those axes get delta
-            if affected_axes and _axis_of_param(param_name) not in affected_axes:
-                continue
+        outer_mul, params = entry
+        for idx, w in params:
             raw[idx] += w * intensity * outer_mul
     return tuple(raw)
 
 
+def aspect_param_tensor(
+    planets_a: list[str],
+    planets_b: list[str],
+    aspect_weights: dict[str, dict[str, float]] | None = None,
+) -> np.ndarray:
+    """
+    Dense (len(planets_a), len(planets_b), 5, 32) tensor: aspect_weight × outer_multiplier for every
+    (planet1, planet2, aspect in MAJOR_ASPECTS order), restricted to the axes of planet1/planet2.
+    Gathered from the compiled tensor. raw_delta = Σ intensity × tensor[i, j, k] over matched aspects.
+    """
+    tensor = compile_aspect_weights(aspect_weights).tensor
+    ia = [_PLANET_SLOT_INDEX[_planet_slot(p)] for p in planets_a]
+    ib = [_PLANET_SLOT_INDEX[_planet_slot(p)] for p in planets_b]
+    return tensor[np.ix_(ia, ib)][:, :, : len(MAJOR_ASPECTS), :]
+
+
+def compute_raw_delta_32_batch(
+    deviation: np.ndarray,
+    masks: np.ndarray,
+    planets_a: list[str],
+    planets_b: list[str],
+    aspect_weights: dict[str, dict[str, float]] | None = None,
+    orb_scale: float = 1.0,
+) -> np.ndarray:
+    """
+    Batch raw_delta for T instants. deviation/masks: (T, len(planets_a), len(planets_b), 5)
+    from aspect_deviation / aspect_masks. Returns (T, 32): one contraction of the masked intensities
+    with the compiled tensor. Matches compute_raw_delta_32 within replay tolerance.
+    """
+    orb = 8.0 * orb_scale
+    if orb <= 0:
+        intensity = np.ones_like(deviation)
+    else:
+        intensity = np.maximum(0.0, 1.0 - deviation / orb)
+    tensor = aspect_param_tensor(planets_a, planets_b, aspect_weights)
+    raw_delta: np.ndarray = np.einsum("tabk,abkp->tp", np.where(masks, intensity, 0.0), tensor)
+    return raw_delta
+
+
+def planet_slot_onehot(planets_rows: list[list[str | None]], width: int | None = None) -> np.ndarray:
+    """
+    One-hot planet slots (N, width, len(PLANET_SLOTS)) for N planet lists (rows shorter than width
+    are zero-padded). Built once per population of natal charts, reused every step.
+    """
+    width = max((len(row) for row in planets_rows), default=0) if width is None else width
+    onehot = np.zeros((len(planets_rows), width, len(PLANET_SLOTS)), dtype=float)
+    for n, planets in enumerate(planets_rows):
+        for m, planet in enumerate(planets):
+            onehot[n, m, _PLANET_SLOT_INDEX[_planet_slot(planet)]] = 1.0
+    return onehot
+
+
+def compute_raw_delta_32_population(
+    deviation: np.ndarray,
+    masks: np.ndarray,
+    planets_a: list[str],
+    slot_onehot_b: np.ndarray,
+    aspect_weights: dict[str, dict[str, float]] | None = None,
+    orb_scale: float = 1.0,
+) -> np.ndarray:
+    """
+    raw_delta for N rows with different B sets (e.g. one shared transit set × N natal charts).
+    deviation/masks: (N, len(planets_a), M, 5); slot_onehot_b: (N, M, slots) from planet_slot_onehot
+    (padded columns must be masked out). Masked intensities are summed per planet slot of B, then
+    contracted with the compiled tensor as one matrix product: memory O(N × slots), not O(N × M × 32).
+    Returns (N, 32); matches compute_raw_delta_32 per row within replay tolerance.
+    """
+    n_rows, n_a, _, n_aspects = deviation.shape
+    orb = 8.0 * orb_scale
+    if orb <= 0:
+        intensity = np.ones_like(deviation)
+    else:
+        intensity = np.maximum(0.0, 1.0 - deviation / orb)
+    # (N, A, 5, M) @ (N, 1, M, S) → (N, A, 5, S)
+    by_slot = np.where(masks, intensity, 0.0).transpose(0, 1, 3, 2) @ slot_onehot_b[:, None, :, :]
+    ia = [_PLANET_SLOT_INDEX[_planet_slot(p)] for p in planets_a]
+    tensor = compile_aspect_weights(aspect_weights).tensor[ia][:, :, :n_aspects, :]  # (A, S, 5, 32)
+    tensor = tensor.transpose(0, 2, 1, 3).reshape(-1, NUM_PARAMETERS)
+    raw_delta: np.ndarray = by_slot.reshape(n_rows, -1) @ tensor
+    return raw_delta
+
+
 def _aspect_category(asp: dict[str, Any]) -> str:
     """Assign aspect to one category: outer > social > personal (slowest planet wins)."""
     p1 = asp.get("planet1")
     p2 = asp.get("planet2")
-    c1 = PLANET_CATEGORY.get(p1, "personal")
-    c2 = PLANET_CATEGORY.get(p2, "personal")
+    c1 = _planet_category(p1)
+    c2 = _planet_category(p2)
     if c1 == "outer" or c2 == "outer":
         return "outer"
     if c1 == "social" or c2 == "social":
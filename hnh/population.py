@@ -0,0 +1,184 @@
+"""
+AgentPopulation: N agents stepped as one 2-D state (Spec 006 Agent semantics, product mode).
+base / sensitivity / current vectors are (N, 32) arrays; step(date) runs one vectorized pass:
+shared transit positions → per-natal aspect matching → raw_delta → bounds → (009 scale_delta) → assembly.
+Per-agent StepResult readable by index. Matches Agent.step() per agent within REPLAY_TOLERANCE.
+Lifecycle (Spec 005) is not part of the population engine; use Agent(lifecycle=True) for research runs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+
+from hnh.agent import _DEFAULT_CONFIG, StepResult, _build_identity_config_from_natal
+from hnh.config.replay_config import ReplayConfig
+from hnh.identity.layout import NUM_PARAMETERS
+from hnh.modulation.boundaries import apply_bounds_batch
+from hnh.modulation.delta import compute_raw_delta_32_population, planet_slot_onehot
+from hnh.state.assembler import aggregate_axis_batch, assemble_state_batch
+
+
+@dataclass(frozen=True, eq=False)
+class PopulationStepResult:
+    """One population step: stress (N,), shock_active (N,) and per-agent StepResult via [i]."""
+
+    stress: np.ndarray
+    shock_active: np.ndarray
+    sex: tuple[str | None, ...]
+    sex_polarity_E: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.sex)
+
+    def __getitem__(self, i: int) -> StepResult:
+        return StepResult(sex=self.sex[i], sex_polarity_E=float(self.sex_polarity_E[i]))
+
+
+class AgentPopulation:
+    """
+    N agents sharing one ReplayConfig (and optional 009 SexTransitConfig).
+    Natal charts are built once; natal longitudes padded to (N, M) with NaN (never within orb).
+    current_vectors (N, 32) is updated only by step(); base_vectors never mutated.
+    """
+
+    __slots__ = (
+        "natals", "_config", "_sex_transit_config", "_identity_configs",
+        "_natal_lons", "_natal_slots", "_base", "_sensitivity", "_current", "_multipliers",
+        "_sex", "_sex_polarity_E", "_last_step_result",
+    )
+
+    def __init__(
+        self,
+        birth_data: Sequence[dict[str, Any]],
+        config: ReplayConfig | None = None,
+        identity_configs: Sequence[Any] | None = None,
+        sex_transit_config: Any = None,
+    ) -> None:
+        """
+        birth_data: one dict per agent (as for Agent; may include sex, sex_mode).
+        identity_configs: optional per-agent protocol objects (base_vector, sensitivity_vector);
+        if None, each is built from natal + birth_data as in Agent.
+        sex_transit_config: optional 009 config, shared by all agents (scale_delta applied per agent E).
+        """
+        from hnh.astrology.natal_chart import NatalChart
+        from hnh.sex.identity_hash import identity_hash_for_tie_break
+
+        self._config = config if config is not None else _DEFAULT_CONFIG
+        self._sex_transit_config = sex_transit_config
+        if identity_configs is not None and len(identity_configs) != len(birth_data):
+            raise ValueError(
+                f"identity_configs length must match birth_data ({len(birth_data)}), got {len(identity_configs)}"
+            )
+        self.natals = tuple(NatalChart.from_birth_data(bd) for bd in birth_data)
+        if identity_configs is None:
+            identity_configs = [
+                _build_identity_config_from_natal(
+                    natal, bd, self._config, identity_hash_digest=identity_hash_for_tie_break(bd)
+                )
+                for natal, bd in zip(self.natals, birth_data)
+            ]
+        self._identity_configs = tuple(identity_configs)
+        n = len(self.natals)
+        self._base = np.array([ic.base_vector for ic in self._identity_configs], dtype=float).reshape(n, NUM_PARAMETERS)
+        self._sensitivity = np.array(
+            [ic.sensitivity_vector for ic in self._identity_configs], dtype=float
+        ).reshape(n, NUM_PARAMETERS)
+        self._current = self._base.copy()
+        self._sex = tuple(getattr(ic, "sex", None) for ic in self._identity_configs)
+        self._sex_polarity_E = np.array(
+            [getattr(ic, "sex_polarity_E", 0.0) for ic in self._identity_configs], dtype=float
+        )
+        positions = [natal.to_natal_data().get("positions", []) for natal in self.natals]
+        width = max((len(p) for p in positions), default=0)
+        self._natal_lons = np.full((n, width), np.nan, dtype=float)
+        for i, pos in enumerate(positions):
+            self._natal_lons[i, : len(pos)] = [float(p["longitude"]) for p in pos]
+        self._natal_slots = planet_slot_onehot([[p.get("planet") for p in pos] for pos in positions], width)
+        self._multipliers = self._build_multipliers()
+        self._last_step_result: PopulationStepResult | None = None
+
+    def _build_multipliers(self) -> np.ndarray | None:
+        """009 scale_delta: per-agent M (N, 32), rows of ones where E == 0 or sex is None; None when off."""
+        stc = self._sex_transit_config
+        if stc is None or getattr(stc, "sex_transit_mode", "off") != "scale_delta":
+            return None
+        from hnh.sex.transit_modulator import compute_multipliers, get_wdyn_profile
+
+        profile = getattr(stc, "sex_transit_Wdyn_profile", "v1")
+        get_wdyn_profile(profile)  # FR-012 fail-fast, as in Agent
+        beta = getattr(stc, "sex_transit_beta", 0.05)
+        mcap = getattr(stc, "sex_transit_mcap", 0.10)
+        rows = [
+            compute_multipliers(E, profile, beta=beta, mcap=mcap) if (E != 0.0 and sex is not None)
+            else (1.0,) * NUM_PARAMETERS
+            for E, sex in zip(self._sex_polarity_E.tolist(), self._sex)
+        ]
+        return np.array(rows, dtype=float).reshape(len(rows), NUM_PARAMETERS)
+
+    def __len__(self) -> int:
+        return len(self.natals)
+
+    @property
+    def base_vectors(self) -> np.ndarray:
+        """(N, 32) base vectors (read-only view)."""
+        view = self._base.view()
+        view.setflags(write=False)
+        return view
+
+    @property
+    def current_vectors(self) -> np.ndarray:
+        """(N, 32) current state (read-only view)."""
+        view = self._current.view()
+        view.setflags(write=False)
+        return view
+
+    def current_vector(self, i: int) -> tuple[float, ...]:
+        """Agent i current_vector as a 32-tuple (as BehavioralCore.current_vector)."""
+        return tuple(self._current[i].tolist())
+
+    def axis_vectors(self) -> np.ndarray:
+        """(N, 8) aggregate_axis of current vectors."""
+        return aggregate_axis_batch(self._current)
+
+    @property
+    def last_step_result(self) -> PopulationStepResult | None:
+        return self._last_step_result
+
+    def step(self, date_or_dt: date | datetime) -> PopulationStepResult:
+        """
+        One vectorized step for all agents: same order as Agent.step() (transit state, 009 scaling,
+        apply_transits). Transit positions computed once (shared transit cache / ephemeris tables).
+        """
+        from hnh.astrology import aspects as asp
+        from hnh.astrology import ephemeris as eph
+        from hnh.astrology.transits import _TRANSIT_PLANETS, _date_to_datetime_utc
+        from hnh.lifecycle.stress import compute_transit_stress_batch
+
+        config = self._config
+        jd = eph.datetime_to_julian_utc(_date_to_datetime_utc(date_or_dt))
+        transit_lons = np.array(eph.get_transit_cache().longitudes(jd), dtype=float)
+        # separation (N, 10, M): transit × natal per agent; orb test on raw, intensity on 6-digit rounding
+        separation = asp.angular_separation_array(transit_lons[None, :, None], self._natal_lons[:, None, :])
+        masks = asp.aspect_masks(separation)
+        deviation = asp.aspect_deviation(np.round(separation, 6))
+        _, s_t = compute_transit_stress_batch(deviation, masks)
+        stress = np.clip(s_t, 0.0, 1.0)
+        raw_delta = compute_raw_delta_32_population(deviation, masks, _TRANSIT_PLANETS, self._natal_slots)
+        shock_active = np.abs(raw_delta).max(axis=1, initial=0.0) > config.shock_threshold
+        bounded_delta, _ = apply_bounds_batch(raw_delta, config, shock_active)
+        if self._multipliers is not None:
+            bounded_delta = bounded_delta * self._multipliers
+        self._current, _ = assemble_state_batch(self._base, self._sensitivity, bounded_delta)
+        result = PopulationStepResult(
+            stress=stress,
+            shock_active=shock_active,
+            sex=self._sex,
+            sex_polarity_E=self._sex_polarity_E,
+        )
+        self._last_step_result = result
+        return result
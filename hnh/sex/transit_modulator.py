@@ -6,7 +6,7 @@ Wdyn registry: "v1" → W32_V1. Unknown profile → ValueError (FR-012).
 
 from __future__ import annotations
 
-from hnh.identity.schema import NUM_PARAMETERS
+from hnh.identity.layout import NUM_PARAMETERS
 from hnh.sex.delta_32 import W32_V1
 
 # Wdyn profile registry: profile_name → tuple of 32 weights (canonical order, spec 002).
@@ -0,0 +1,36 @@
+"""
+Simulation runners: many lives over a process pool, deterministic merged output;
+parameter sweeps over precomputed transit series.
+"""
+
+from hnh.sim.runner import (
+    DEFAULT_TIME_SLOTS,
+    LifeSpec,
+    run_lives,
+    simulate_life,
+    write_lives,
+)
+from hnh.sim.sweep import (
+    NatalSeries,
+    SweepResult,
+    SweepSettings,
+    grid_design,
+    precompute_series,
+    random_design,
+    run_sweep,
+)
+
+__all__ = [
+    "DEFAULT_TIME_SLOTS",
+    "LifeSpec",
+    "run_lives",
+    "simulate_life",
+    "write_lives",
+    "NatalSeries",
+    "SweepResult",
+    "SweepSettings",
+    "grid_design",
+    "precompute_series",
+    "random_design",
+    "run_sweep",
+]
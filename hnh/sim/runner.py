@@ -0,0 +1,248 @@
+"""
+Multi-process lifetime runner: lives sharded over a ProcessPoolExecutor, results as orjson lines.
+Shards are contiguous ranges of the spec list (fixed shard_size), independent of the worker count;
+results are emitted in spec order, so merged output is byte-identical for any number of workers.
+Each worker warms the ephemeris once (and optionally attaches a precomputed ephemeris table).
+With LifeSpec.checkpoint_dir a life checkpoints its Agent every checkpoint_every_days and resumes from
+the last checkpoint on rerun, continuing bit-identically.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import orjson
+
+from hnh.config.replay_config import ReplayConfig
+
+# Default cadence: two slots per day (06:00 and 18:00 UTC), as in scripts/00x/life_simulation_102y.py
+DEFAULT_TIME_SLOTS: tuple[tuple[int, int], ...] = ((6, 0), (18, 0))
+DEFAULT_SHARD_SIZE: int = 8
+_J2000_JD: float = 2451545.0
+
+LifeFn = Callable[["LifeSpec", ReplayConfig, Any], dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class LifeSpec:
+    """One life: birth_data (as for Agent), inclusive date range and daily time slots (UTC)."""
+
+    life_index: int
+    birth_data: dict[str, Any]
+    start: date
+    end: date
+    time_slots: tuple[tuple[int, int], ...] = DEFAULT_TIME_SLOTS
+    checkpoint_dir: str | None = None
+    checkpoint_every_days: int = 0
+
+    @property
+    def checkpoint_path(self) -> Path | None:
+        if self.checkpoint_dir is None or self.checkpoint_every_days <= 0:
+            return None
+        return Path(self.checkpoint_dir) / f"life_{self.life_index}.ckpt"
+
+    def instants(self) -> Iterator[datetime]:
+        """Step instants start..end inclusive, time_slots per day."""
+        current = self.start
+        while current <= self.end:
+            for hour, minute in self.time_slots:
+                yield datetime(current.year, current.month, current.day, hour, minute, tzinfo=timezone.utc)
+            current += timedelta(days=1)
+
+
+def simulate_life(
+    spec: LifeSpec,
+    config: ReplayConfig,
+    sex_transit_config: Any = None,
+) -> dict[str, Any] | None:
+    """
+    One life through Agent.step() (product mode). Returns start/end params and axes, their deltas,
+    sex and E; None if the range is empty. Deterministic: same spec/config → same dict.
+    """
+    from hnh.agent import Agent
+    from hnh.lifecycle.engine import aggregate_axis
+
+    agent = Agent(spec.birth_data, config=config, lifecycle=False, sex_transit_config=sex_transit_config)
+    start_params: tuple[float, ...] | None = None
+    end_params: tuple[float, ...] | None = None
+    sex: str | None = None
+    polarity_e = 0.0
+    steps = 0
+    ckpt_path = spec.checkpoint_path
+    if ckpt_path is not None and ckpt_path.exists():
+        steps, start_params, sex, polarity_e = _load_life_checkpoint(ckpt_path, agent)
+        if steps:
+            end_params = agent.behavior.current_vector
+    every = spec.checkpoint_every_days * len(spec.time_slots)
+    for i, dt_utc in enumerate(spec.instants()):
+        if i < steps:
+            continue
+        result = agent.step(dt_utc)
+        sex, polarity_e = result.sex, result.sex_polarity_E
+        end_params = agent.behavior.current_vector
+        if start_params is None:
+            start_params = end_params
+        steps += 1
+        if ckpt_path is not None and steps % every == 0:
+            _save_life_checkpoint(ckpt_path, steps, start_params, sex, polarity_e, agent)
+    if start_params is None or end_params is None:
+        return None
+    start_axis = aggregate_axis(start_params)
+    end_axis = aggregate_axis(end_params)
+    delta_axis = tuple(e - s for s, e in zip(start_axis, end_axis))
+    delta_params = tuple(e - s for s, e in zip(start_params, end_params))
+    return {
+        "life_index": spec.life_index,
+        "start": spec.start,
+        "end": spec.end,
+        "steps": steps,
+        "sex": sex,
+        "E": polarity_e,
+        "start_params": start_params,
+        "start_axis": start_axis,
+        "end_params": end_params,
+        "end_axis": end_axis,
+        "delta_axis": delta_axis,
+        "delta_params": delta_params,
+        "mean_abs_axis": sum(abs(d) for d in delta_axis) / len(delta_axis),
+        "max_abs_params": max(abs(d) for d in delta_params),
+    }
+
+
+def _save_life_checkpoint(
+    path: Path, steps: int, start_params: tuple[float, ...], sex: str | None, polarity_e: float, agent: Any
+) -> None:
+    """Write (steps done, start_params, last step's sex / E, Agent.checkpoint()) atomically."""
+    blob = orjson.dumps({
+        "steps": steps,
+        "start_params": start_params,
+        "sex": sex,
+        "E": polarity_e,
+        "agent": agent.checkpoint().hex(),
+    })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def _load_life_checkpoint(
+    path: Path, agent: Any
+) -> tuple[int, tuple[float, ...] | None, str | None, float]:
+    """Restore agent from a life checkpoint; returns (steps done, start_params, sex, E)."""
+    data = orjson.loads(path.read_bytes())
+    agent.restore(bytes.fromhex(data["agent"]))
+    start = data.get("start_params")
+    return (
+        int(data["steps"]),
+        tuple(start) if start is not None else None,
+        data.get("sex"),
+        float(data.get("E", 0.0)),
+    )
+
+
+def _warm_worker(ephemeris_table: str | None) -> None:
+    """
+    Process initializer: reopen the ephemeris files (a forked worker must not share the parent's
+    .se1 file offsets), load them once; attach the precomputed table if given.
+    """
+    from hnh.astrology import ephemeris as eph
+
+    eph.reopen_ephemeris()
+    try:
+        eph._calc_longitudes(_J2000_JD)
+    except RuntimeError:
+        pass  # pyswisseph not installed: lives fail the same way in every process
+    if ephemeris_table is not None:
+        from hnh.astrology import ephemeris_table as et
+
+        et.load_ephemeris_table(ephemeris_table)
+
+
+def _run_shard(
+    specs: Sequence[LifeSpec],
+    config: ReplayConfig,
+    sex_transit_config: Any,
+    life_fn: LifeFn,
+) -> list[bytes]:
+    """Run a shard of lives; one orjson line per life (lives returning None are skipped)."""
+    lines: list[bytes] = []
+    for spec in specs:
+        result = life_fn(spec, config, sex_transit_config)
+        if result is not None:
+            lines.append(orjson.dumps(result, option=orjson.OPT_SORT_KEYS) + b"\n")
+    return lines
+
+
+def _run_serial(
+    shards: Sequence[Sequence[LifeSpec]],
+    config: ReplayConfig,
+    sex_transit_config: Any,
+    life_fn: LifeFn,
+    ephemeris_table: str | None,
+) -> Iterator[bytes]:
+    """In-process run; the table (if any) is detached from the transit cache afterwards."""
+    table = None
+    if ephemeris_table is not None:
+        from hnh.astrology import ephemeris_table as et
+
+        table = et.load_ephemeris_table(ephemeris_table)
+    try:
+        for shard in shards:
+            yield from _run_shard(shard, config, sex_transit_config, life_fn)
+    finally:
+        if table is not None:
+            et.uninstall_table(table)
+
+
+def run_lives(
+    specs: Sequence[LifeSpec],
+    config: ReplayConfig,
+    *,
+    workers: int = 1,
+    sex_transit_config: Any = None,
+    ephemeris_table: str | Path | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    life_fn: LifeFn = simulate_life,
+) -> Iterator[bytes]:
+    """
+    Yield one orjson line per life, in specs order, streaming shard by shard.
+    workers <= 1 runs in-process (same bytes): the caller's ephemeris handle is left as is and
+    ephemeris_table is attached to the shared transit cache only while the lives run.
+    life_fn must be a module-level (picklable) function.
+    """
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be >= 1, got {shard_size}")
+    table = str(ephemeris_table) if ephemeris_table is not None else None
+    shards = [specs[lo : lo + shard_size] for lo in range(0, len(specs), shard_size)]
+    if workers <= 1:
+        yield from _run_serial(shards, config, sex_transit_config, life_fn, table)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(table,)) as pool:
+        n = len(shards)
+        for lines in pool.map(_run_shard, shards, [config] * n, [sex_transit_config] * n, [life_fn] * n):
+            yield from lines
+
+
+def write_lives(
+    out: str | Path | BinaryIO,
+    specs: Sequence[LifeSpec],
+    config: ReplayConfig,
+    **kwargs: Any,
+) -> int:
+    """run_lives() into a file path or binary stream. Returns the number of lines written."""
+    if isinstance(out, (str, Path)):
+        with open(out, "wb") as f:
+            return write_lives(f, specs, config, **kwargs)
+    count = 0
+    for line in run_lives(specs, config, **kwargs):
+        out.write(line)
+        count += 1
+    return count
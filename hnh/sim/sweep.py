@@ -0,0 +1,296 @@
+"""
+Parameter sweeps over LifecycleConstants / ReplayConfig / SexTransitConfig fields.
+Transit series are computed once per natal (precompute_series: raw intensity I_T and raw_delta over the
+dates, both config-independent); each sweep point then only re-applies bounds, 009 scaling, assembly and
+the lifecycle scan (simulate_lifecycle) as array ops. Points run on a process pool; the natal series are
+sent to each worker once (initializer), not per point. Results: one row per (point, natal), written as
+CSV or npz. Same rows for any worker count.
+Per-point semantics follow Agent.step() without memory (current_vector = assemble(base, sens, bounded)),
+lifecycle as LifecycleEngine with R from current_vector before each step.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+
+from hnh.config.replay_config import ReplayConfig
+from hnh.config.sex_transit_config import SexTransitConfig
+from hnh.identity.layout import NUM_AXES, NUM_PARAMETERS
+from hnh.lifecycle.constants import DEFAULT_LIFECYCLE_CONSTANTS, LifecycleConstants
+from hnh.lifecycle.fatigue import STABILITY_AXIS_INDEX, global_sensitivity
+from hnh.lifecycle.trajectory import simulate_lifecycle
+from hnh.modulation.boundaries import apply_bounds_batch
+from hnh.state.assembler import AXIS_PARAM_INDEX, assemble_state_batch
+
+_REPLAY_FIELDS = frozenset(f.name for f in fields(ReplayConfig))
+_LIFECYCLE_FIELDS = frozenset(f.name for f in fields(LifecycleConstants))
+_SEX_TRANSIT_FIELDS = frozenset(f.name for f in fields(SexTransitConfig))
+_LIFECYCLE_STATES = ("ALIVE", "DISABLED", "TRANSCENDED")
+
+METRIC_COLUMNS: tuple[str, ...] = (
+    ("mean_abs_axis", "max_abs_params", "shock_steps")
+    + tuple(f"delta_axis_{a}" for a in range(NUM_AXES))
+    + ("lifecycle_state", "terminal_step", "final_F", "final_W")
+)
+
+
+@dataclass(frozen=True, eq=False)
+class NatalSeries:
+    """Precomputed, config-independent input for one natal: I_T (T,), raw_delta (T, 32), identity vectors."""
+
+    intensity: np.ndarray
+    raw_delta: np.ndarray
+    base_vector: np.ndarray
+    sensitivity_vector: np.ndarray
+    sex: str | None
+    sex_polarity_E: float
+
+
+def precompute_series(
+    birth_data: Sequence[dict[str, Any]],
+    dates: Sequence[date | datetime],
+    config: ReplayConfig | None = None,
+) -> tuple[NatalSeries, ...]:
+    """
+    One TransitEngine.intensity_series per natal (shared transit cache: positions once per instant).
+    config: ReplayConfig used to build identities (sex resolution), as Agent(birth_data, config).
+    """
+    from hnh.agent import _DEFAULT_CONFIG, _build_identity_config_from_natal
+    from hnh.astrology.natal_chart import NatalChart
+    from hnh.astrology.transits import TransitEngine
+
+    config = config if config is not None else _DEFAULT_CONFIG
+    out = []
+    for bd in birth_data:
+        natal = NatalChart.from_birth_data(bd)
+        identity = _build_identity_config_from_natal(natal, bd, config)
+        intensity, raw_delta = TransitEngine(natal).intensity_series(dates)
+        out.append(NatalSeries(
+            intensity=intensity,
+            raw_delta=raw_delta,
+            base_vector=np.array(identity.base_vector, dtype=float),
+            sensitivity_vector=np.array(identity.sensitivity_vector, dtype=float),
+            sex=identity.sex,
+            sex_polarity_E=float(identity.sex_polarity_E),
+        ))
+    return tuple(out)
+
+
+def grid_design(axes: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Full factorial design: one point per combination, in axes order (last axis varies fastest)."""
+    names = list(axes)
+    for name in names:
+        _check_field(name)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[n] for n in names))]
+
+
+def random_design(
+    ranges: Mapping[str, tuple[float, float]],
+    n: int,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    """n points drawn uniformly from [lo, hi] per field (numpy default_rng(seed): reproducible)."""
+    for name in ranges:
+        _check_field(name)
+    rng = np.random.default_rng(seed)
+    columns = {name: rng.uniform(lo, hi, n).tolist() for name, (lo, hi) in ranges.items()}
+    return [{name: columns[name][i] for name in ranges} for i in range(n)]
+
+
+def _check_field(name: str) -> None:
+    if name not in _REPLAY_FIELDS and name not in _LIFECYCLE_FIELDS and name not in _SEX_TRANSIT_FIELDS:
+        raise ValueError(
+            f"Unknown sweep field {name!r}: not a ReplayConfig, LifecycleConstants or SexTransitConfig field"
+        )
+
+
+def resolve_point(
+    point: Mapping[str, Any],
+    config: ReplayConfig,
+    constants: LifecycleConstants,
+    sex_transit_config: SexTransitConfig | None,
+) -> tuple[ReplayConfig, LifecycleConstants, SexTransitConfig | None]:
+    """Apply point overrides to the base configs (dataclasses.replace; validation as in the constructors)."""
+    for name in point:
+        _check_field(name)
+    replay = {k: v for k, v in point.items() if k in _REPLAY_FIELDS}
+    lifecycle = {k: v for k, v in point.items() if k in _LIFECYCLE_FIELDS}
+    sex = {k: v for k, v in point.items() if k in _SEX_TRANSIT_FIELDS}
+    if sex:
+        sex_transit_config = replace(sex_transit_config or SexTransitConfig(), **sex)
+    return replace(config, **replay), replace(constants, **lifecycle), sex_transit_config
+
+
+def _resilience_batch(params: np.ndarray) -> np.ndarray:
+    """resilience_from_base_vector per row: Stability axis mean (same summation order), clipped."""
+    g = params[:, AXIS_PARAM_INDEX[STABILITY_AXIS_INDEX]]
+    resilience: np.ndarray = np.clip((((g[:, 0] + g[:, 1]) + g[:, 2]) + g[:, 3]) / 4, 0.0, 1.0)
+    return resilience
+
+
+def evaluate_natal(
+    series: NatalSeries,
+    config: ReplayConfig,
+    constants: LifecycleConstants,
+    sex_transit_config: SexTransitConfig | None = None,
+    lifecycle: bool = True,
+) -> dict[str, Any]:
+    """Metrics for one natal under one configuration (METRIC_COLUMNS)."""
+    raw = series.raw_delta
+    t = raw.shape[0]
+    if t == 0:
+        raise ValueError("Cannot evaluate an empty date series")
+    shock = np.abs(raw).max(axis=1, initial=0.0) > config.shock_threshold
+    bounded, _ = apply_bounds_batch(raw, config, shock)
+    stc = sex_transit_config
+    if (
+        stc is not None and stc.sex_transit_mode == "scale_delta"
+        and series.sex_polarity_E != 0.0 and series.sex is not None
+    ):
+        from hnh.sex.transit_modulator import compute_multipliers
+
+        bounded = bounded * np.array(compute_multipliers(
+            series.sex_polarity_E, stc.sex_transit_Wdyn_profile, beta=stc.sex_transit_beta, mcap=stc.sex_transit_mcap
+        ))
+    base = np.broadcast_to(series.base_vector, (t, NUM_PARAMETERS))
+    sens = np.broadcast_to(series.sensitivity_vector, (t, NUM_PARAMETERS))
+    params, axis = assemble_state_batch(base, sens, bounded)
+    delta_axis = axis[-1] - axis[0]
+    row: dict[str, Any] = {
+        "mean_abs_axis": float(np.abs(delta_axis).sum() / NUM_AXES),
+        "max_abs_params": float(np.abs(params[-1] - params[0]).max()),
+        "shock_steps": int(shock.sum()),
+    }
+    row.update({f"delta_axis_{a}": float(delta_axis[a]) for a in range(NUM_AXES)})
+    if lifecycle:
+        stress = np.clip(series.intensity / constants.c_t, 0.0, 1.0)
+        # Agent: R from current_vector before apply_transits (base on the first step)
+        resilience = _resilience_batch(np.vstack([series.base_vector[None, :], params[:-1]]))
+        traj = simulate_lifecycle(
+            stress,
+            resilience,
+            global_sensitivity(tuple(series.sensitivity_vector.tolist())),
+            constants,
+            initial_f=config.initial_f,
+            initial_w=config.initial_w,
+        )
+        row.update({
+            "lifecycle_state": traj.state.value,
+            "terminal_step": -1 if traj.terminal_day is None else traj.terminal_day,
+            "final_F": float(traj.F[-1]) if traj.count_days else config.initial_f,
+            "final_W": traj.W,
+        })
+    else:
+        row.update({"lifecycle_state": "", "terminal_step": -1, "final_F": float("nan"), "final_W": float("nan")})
+    return row
+
+
+@dataclass(frozen=True)
+class SweepSettings:
+    """Base configs that sweep points override."""
+
+    config: ReplayConfig
+    constants: LifecycleConstants = DEFAULT_LIFECYCLE_CONSTANTS
+    sex_transit_config: SexTransitConfig | None = None
+    lifecycle: bool = True
+
+
+_worker_series: tuple[NatalSeries, ...] = ()
+
+
+def _init_worker(series: tuple[NatalSeries, ...]) -> None:
+    global _worker_series
+    _worker_series = series
+
+
+def _evaluate_points(
+    indexed_points: Sequence[tuple[int, Mapping[str, Any]]],
+    settings: SweepSettings,
+) -> list[tuple[int, int, dict[str, Any]]]:
+    rows = []
+    for point_index, point in indexed_points:
+        config, constants, stc = resolve_point(point, settings.config, settings.constants, settings.sex_transit_config)
+        for natal_index, series in enumerate(_worker_series):
+            rows.append((point_index, natal_index, evaluate_natal(series, config, constants, stc, settings.lifecycle)))
+    return rows
+
+
+@dataclass(frozen=True, eq=False)
+class SweepResult:
+    """Rows (point_index, natal_index, point fields, METRIC_COLUMNS) in (point, natal) order."""
+
+    field_names: tuple[str, ...]
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.columns["point_index"])
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        return tuple(self.columns)
+
+    def write_csv(self, path: str | Path) -> None:
+        names = self.column_names
+        cols = [self.columns[n].tolist() for n in names]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows(zip(*cols))
+
+    def write_npz(self, path: str | Path) -> None:
+        np.savez_compressed(path, **cast(dict[str, Any], self.columns))
+
+
+def run_sweep(
+    series: Sequence[NatalSeries],
+    points: Sequence[Mapping[str, Any]],
+    settings: SweepSettings,
+    *,
+    workers: int = 1,
+    points_per_task: int = 8,
+) -> SweepResult:
+    """Evaluate every point on every natal series. Same result for any workers / points_per_task."""
+    if points_per_task < 1:
+        raise ValueError(f"points_per_task must be >= 1, got {points_per_task}")
+    series = tuple(series)
+    field_names = tuple(dict.fromkeys(name for point in points for name in point))
+    for name in field_names:
+        _check_field(name)
+    indexed = list(enumerate(points))
+    tasks = [indexed[lo : lo + points_per_task] for lo in range(0, len(indexed), points_per_task)]
+    if workers <= 1 or len(tasks) <= 1:
+        _init_worker(series)
+        chunks: Iterable[list[tuple[int, int, dict[str, Any]]]] = [_evaluate_points(t, settings) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(series,)) as pool:
+            chunks = list(pool.map(_evaluate_points, tasks, [settings] * len(tasks)))
+    rows = [row for chunk in chunks for row in chunk]
+    columns: dict[str, list[Any]] = {"point_index": [], "natal_index": []}
+    columns.update({name: [] for name in field_names})
+    columns.update({name: [] for name in METRIC_COLUMNS})
+    for point_index, natal_index, metrics in rows:
+        columns["point_index"].append(point_index)
+        columns["natal_index"].append(natal_index)
+        point = points[point_index]
+        for name in field_names:
+            columns[name].append(point.get(name, getattr(_base_value_holder(settings, name), name)))
+        for name in METRIC_COLUMNS:
+            columns[name].append(metrics[name])
+    return SweepResult(field_names=field_names, columns={k: np.asarray(v) for k, v in columns.items()})
+
+
+def _base_value_holder(settings: SweepSettings, name: str) -> Any:
+    if name in _REPLAY_FIELDS:
+        return settings.config
+    if name in _LIFECYCLE_FIELDS:
+        return settings.constants
+    return settings.sex_transit_config or SexTransitConfig()
@@ -1,18 +1,34 @@
-"""State: modulation, dynamic state, replay."""
-
-from hnh.state.dynamic_state import DynamicState, compute_dynamic_state
-from hnh.state.modulation import (
-    DIMENSION_NAMES,
-    aggregate_aspect_modifiers,
-    merge_vectors,
-)
-from hnh.state.replay import run_step
-
-__all__ = [
-    "DynamicState",
-    "compute_dynamic_state",
-    "DIMENSION_NAMES",
-    "aggregate_aspect_modifiers",
-    "merge_vectors",
-    "run_step",
-]
+"""
+State: modulation, dynamic state, replay.
+Exports are resolved on first access: importing a submodule (e.g. hnh.state.replay_v2) does not
+load the 001 pydantic models behind dynamic_state / replay.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, str] = {
+    "DynamicState": "hnh.state.dynamic_state",
+    "compute_dynamic_state": "hnh.state.dynamic_state",
+    "DIMENSION_NAMES": "hnh.state.modulation",
+    "aggregate_aspect_modifiers": "hnh.state.modulation",
+    "merge_vectors": "hnh.state.modulation",
+    "run_step": "hnh.state.replay",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
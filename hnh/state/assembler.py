@@ -8,11 +8,24 @@ Axis aggregation: axis_final = mean(final sub-parameters). Deterministic.
 
 from __future__ import annotations
 
-from hnh.identity.schema import NUM_PARAMETERS, NUM_AXES, _PARAMETER_LIST
+import numpy as np
+
+from hnh.identity.layout import NUM_PARAMETERS, NUM_AXES, _PARAMETER_LIST
 
 # Минимальный по модулю вклад транзита (0.0003–0.0007); детерминированный знак по индексу параметра
 NOISE_FLOOR = 0.0005
 
+# Для batch-версий: знаковый noise floor по индексу параметра
+_NOISE_FLOOR_SIGNED: np.ndarray = np.array(
+    [NOISE_FLOOR if (p % 2 == 0) else -NOISE_FLOOR for p in range(NUM_PARAMETERS)], dtype=float
+)
+# (8, 4): индексы 4 параметров каждой оси (в порядке p_ix), только для чтения; params[:, AXIS_PARAM_INDEX[a]]
+AXIS_PARAM_INDEX: np.ndarray = np.array(
+    [[p_ix for p_ix, (axis_ix, _) in enumerate(_PARAMETER_LIST) if axis_ix == a] for a in range(NUM_AXES)],
+    dtype=np.intp,
+)
+AXIS_PARAM_INDEX.setflags(write=False)
+
 
 def clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
@@ -56,3 +69,25 @@ def assemble_state(
     for a in range(NUM_AXES):
         axis_final[a] /= 4.0
     return (tuple(params_final), tuple(axis_final))
+
+
+def aggregate_axis_batch(params: np.ndarray) -> np.ndarray:
+    """Axis aggregation for (N, 32) → (N, 8): mean of 4 params per axis, same summation order as assemble_state."""
+    groups = params[:, AXIS_PARAM_INDEX]
+    axis: np.ndarray = (groups[..., 0] + groups[..., 1] + groups[..., 2] + groups[..., 3]) / 4.0
+    return axis
+
+
+def assemble_state_batch(
+    base_vectors: np.ndarray,
+    sensitivity_vectors: np.ndarray,
+    bounded_delta: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Batch assemble_state for N rows (memory_delta = zeros): all inputs (N, 32).
+    Same formula and noise floor as assemble_state. Returns (params_final (N, 32), axis_final (N, 8)).
+    """
+    transit = bounded_delta * sensitivity_vectors
+    transit = np.where(np.abs(transit) < NOISE_FLOOR, _NOISE_FLOOR_SIGNED, transit)
+    params_final = np.clip(base_vectors + transit + 0.0, 0.0, 1.0)
+    return (params_final, aggregate_axis_batch(params_final))
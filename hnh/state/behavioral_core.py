@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Any, Protocol
 
-from hnh.identity.schema import NUM_PARAMETERS
+from hnh.identity.layout import NUM_PARAMETERS
 from hnh.state.assembler import assemble_state
 
 # Avoid circular import: TransitState from astrology
@@ -61,6 +61,12 @@ class BehavioralCore:
         """Current 32D state (updated by apply_transits)."""
         return self._current_vector
 
+    def restore_current_vector(self, current_vector: tuple[float, ...]) -> None:
+        """Set current_vector from a checkpoint (Agent.restore). base_vector untouched."""
+        if len(current_vector) != NUM_PARAMETERS:
+            raise ValueError(f"current_vector must have length {NUM_PARAMETERS}, got {len(current_vector)}")
+        self._current_vector = tuple(current_vector)
+
     def apply_transits(self, transit_state: TransitState) -> None:
         """
         Update current_vector from transit_state.bounded_delta and sensitivity from identity_config.
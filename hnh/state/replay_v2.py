@@ -6,6 +6,8 @@ Same inputs → identical params_final and axis_final (tolerance 1e-9). No syste
 
 from __future__ import annotations
 
+import threading
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -22,8 +24,7 @@ from hnh.modulation.delta import (
     compute_raw_delta_32_by_category,
 )
 from hnh.state.assembler import assemble_state
-
-REPLAY_TOLERANCE: float = 1e-9
+from hnh.state.tolerance import REPLAY_TOLERANCE as REPLAY_TOLERANCE
 
 # Phase smoothing: final = base + (PHASE_DAILY_WEIGHT * daily + PHASE_SMOOTH_WEIGHT * phase) + memory
 # Exponential accumulation: phase[t] = clamp(phase[t-1]*decay + daily[t]*phase_gain, -phase_limit, +phase_limit)
@@ -70,45 +71,97 @@ def _transit_signature_hash(transit_data: dict[str, Any] | None) -> str:
     return xxhash.xxh3_128(blob, seed=0).hexdigest()
 
 
-def _run_step_v2_via_agent(
+class StepContext:
+    """
+    Reusable stepping context for run_step_v2's simple path (no phase, no history, no memory delta).
+    Keyed by (identity, natal_positions, config); built once and reused across dates.
+    step(): one transit evaluation feeds params_final, effective_max_delta, transit_signature and
+    daily_transit_effect. Same output as Agent(birth_data, identity_config=identity).step(dt) (Spec 006).
+    natal_positions is held by reference (not copied), as in the per-step path. The identity itself is
+    not kept (only its vectors and hash), so a cached context does not pin it in a weak registry scope.
+    """
+
+    __slots__ = (
+        "base_vector", "sensitivity_vector", "config", "natal_positions", "identity_hash", "configuration_hash",
+    )
+
+    def __init__(self, identity: IdentityCore, config: ReplayConfig, natal_positions: dict[str, Any]) -> None:
+        self.base_vector = identity.base_vector
+        self.sensitivity_vector = identity.sensitivity_vector
+        self.config = config
+        self.natal_positions = natal_positions
+        self.identity_hash = identity.identity_hash
+        self.configuration_hash = compute_configuration_hash(config)
+
+    def step(self, dt_utc: datetime, injected_iso: str, memory_signature: str = "") -> ReplayResult:
+        """One step at dt_utc (UTC-aware); injected_iso = dt_utc.isoformat()."""
+        config = self.config
+        transit_data = tr.compute_transit_signature(dt_utc, self.natal_positions) if tr is not None else None
+        if transit_data is not None:
+            raw_delta = compute_raw_delta_32(transit_data.get("aspects_to_natal", []))
+        else:
+            raw_delta = (0.0,) * NUM_PARAMETERS
+        shock_active = max(abs(r) for r in raw_delta) > config.shock_threshold
+        bounded_delta, effective_max_delta = apply_bounds(raw_delta, config, shock_active)
+        sensitivity = self.sensitivity_vector
+        params_final, axis_final = assemble_state(self.base_vector, sensitivity, bounded_delta)
+        daily_transit_effect = tuple(bounded_delta[p] * sensitivity[p] for p in range(NUM_PARAMETERS))
+        return ReplayResult(
+            params_final=params_final,
+            axis_final=axis_final,
+            identity_hash=self.identity_hash,
+            configuration_hash=self.configuration_hash,
+            injected_time_utc=injected_iso,
+            transit_signature=_transit_signature_hash(transit_data),
+            shock_flag=shock_active,
+            effective_max_delta=effective_max_delta,
+            memory_signature=memory_signature,
+            daily_transit_effect=daily_transit_effect,
+            daily_transit_effect_by_category=None,
+            phase_by_category_after=None,
+        )
+
+
+_STEP_CONTEXTS_MAX = 64
+# key → (weak reference to the identity, context); entries drop out when their identity is collected
+_step_contexts: dict[tuple[int, int, ReplayConfig], tuple[weakref.ref[IdentityCore], StepContext]] = {}
+# Re-entrant: a weakref callback may run (GC) while the same thread holds the lock
+_step_contexts_lock = threading.RLock()
+
+
+def get_step_context(
     identity: IdentityCore,
     config: ReplayConfig,
-    dt_utc: datetime,
-    injected_iso: str,
-    config_hash: str,
-    memory_signature: str,
     natal_positions: dict[str, Any],
-) -> ReplayResult:
-    """Delegate to Agent.step() (Spec 006); build ReplayResult from agent state."""
-    from hnh.agent import Agent
-    from hnh.lifecycle.engine import aggregate_axis
-
-    birth_data = {"positions": natal_positions.get("positions", []), "aspects": natal_positions.get("aspects", [])}
-    agent = Agent(birth_data, config=config, lifecycle=False, identity_config=identity)
-    agent.step(dt_utc)
-    params_final = agent.behavior.current_vector
-    axis_final = aggregate_axis(params_final)
-    transit_state = agent.transits.state(dt_utc, config)
-    shock_active = max(abs(r) for r in transit_state.raw_delta) > config.shock_threshold
-    _, effective_max_delta = apply_bounds(transit_state.raw_delta, config, shock_active)
-    transit_data = tr.compute_transit_signature(dt_utc, natal_positions) if tr is not None else None
-    daily_transit_effect = tuple(
-        transit_state.bounded_delta[p] * identity.sensitivity_vector[p] for p in range(NUM_PARAMETERS)
-    )
-    return ReplayResult(
-        params_final=params_final,
-        axis_final=axis_final,
-        identity_hash=identity.identity_hash,
-        configuration_hash=config_hash,
-        injected_time_utc=injected_iso,
-        transit_signature=_transit_signature_hash(transit_data),
-        shock_flag=shock_active,
-        effective_max_delta=effective_max_delta,
-        memory_signature=memory_signature,
-        daily_transit_effect=daily_transit_effect,
-        daily_transit_effect_by_category=None,
-        phase_by_category_after=None,
-    )
+) -> StepContext:
+    """
+    StepContext for (identity, natal_positions, config); cached by object identity of identity and
+    natal_positions and by value of the frozen config (oldest entry evicted beyond _STEP_CONTEXTS_MAX).
+    The identity is referenced weakly: the cache does not keep identities alive. Thread-safe.
+    """
+    key = (id(identity), id(natal_positions), config)
+    with _step_contexts_lock:
+        entry = _step_contexts.get(key)
+        if entry is not None and entry[0]() is identity and entry[1].natal_positions is natal_positions:
+            return entry[1]
+    ctx = StepContext(identity, config, natal_positions)
+    with _step_contexts_lock:
+        while len(_step_contexts) >= _STEP_CONTEXTS_MAX:
+            _step_contexts.pop(next(iter(_step_contexts)))
+        _step_contexts[key] = (weakref.ref(identity, _step_context_cleanup(key)), ctx)
+    return ctx
+
+
+def _step_context_cleanup(key: tuple[int, int, ReplayConfig]) -> Any:
+    """weakref callback: drop the entry of a collected identity (unless the key was reused)."""
+
+    def _cleanup(ref: weakref.ref[IdentityCore]) -> None:
+        with _step_contexts_lock:
+            entry = _step_contexts.get(key)
+            if entry is not None and entry[0] is ref:
+                del _step_contexts[key]
+
+    return _cleanup
 
 
 def run_step_v2(
@@ -123,7 +176,8 @@ def run_step_v2(
 ) -> ReplayResult:
     """
     Run one deterministic state step (v0.2 pipeline).
-    Delegates to Agent.step() when no phase/history and no memory_delta (Spec 006).
+    Simple path (no phase/history, no memory_delta) runs through a cached StepContext, equivalent to
+    Agent.step() (Spec 006) without rebuilding the Agent per step.
     Optional transit_effect_history: single buffer, window PHASE_WINDOW_DAYS (backward compat, mean).
     Optional transit_effect_phase_prev_by_category: previous phase state per category for exponential
     accumulation: phase[t] = clamp(phase[t-1]*decay + daily[t]*phase_gain, -phase_limit, +phase_limit),
@@ -142,17 +196,14 @@ def run_step_v2(
     if len(memory_delta) != NUM_PARAMETERS:
         raise ValueError(f"memory_delta must have length {NUM_PARAMETERS}, got {len(memory_delta)}")
 
-    # Delegate to Agent.step() when simple path (no phase, no history, no memory delta)
-    use_agent = (
+    # Simple path (no phase, no history, no memory delta): reusable StepContext
+    use_context = (
         transit_effect_phase_prev_by_category is None
         and (not transit_effect_history or len(transit_effect_history) == 0)
         and all(x == 0.0 for x in memory_delta)
-        and natal_positions is not None
     )
-    if use_agent:
-        return _run_step_v2_via_agent(
-            identity, config, dt_utc, injected_iso, config_hash, memory_signature, natal_positions
-        )
+    if use_context and natal_positions is not None:
+        return get_step_context(identity, config, natal_positions).step(dt_utc, injected_iso, memory_signature)
 
     transit_data: dict[str, Any] | None = None
     raw_delta_list = [0.0] * NUM_PARAMETERS
@@ -0,0 +1,195 @@
+"""
+Replay verification: re-derive every record of a v2 state log and compare (Spec 002 determinism audit).
+Records are grouped by (identity_hash, configuration_hash); each group is recomputed through a
+StepContext (shared transit cache per process) and compared with replay_match tolerance, plus exact
+transit_signature / shock_flag and effective_max_delta_summary within tolerance.
+Groups run in parallel on a process pool; the first divergence per group is reported.
+Scope: the product path of run_step_v2 (no memory_delta, no phase state), i.e. Agent.step() logs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from hnh.astrology import ephemeris as eph
+from hnh.config.replay_config import ReplayConfig, compute_configuration_hash
+from hnh.identity.schema import IdentityCore
+from hnh.logging.state_logger_v2 import effective_max_delta_summary
+from hnh.state.replay_v2 import REPLAY_TOLERANCE, StepContext, replay_match
+
+# Ошибки шага, которые становятся Divergence группы (а не падением всей проверки)
+_STEP_ERRORS: tuple[type[Exception], ...] = (ValueError, RuntimeError) + (
+    (eph.swe.Error,) if eph.swe is not None else ()
+)
+
+# (line, injected_time_utc, transit_signature, shock_flag, summary_8, params_final, axis_final, memory_signature)
+_Entry = tuple[int, str, str, bool, tuple[float, ...], tuple[float, ...], tuple[float, ...], str]
+
+
+@dataclass(frozen=True)
+class Divergence:
+    """First mismatch in a group: 1-based record number in the log, its time, field and detail."""
+
+    line: int
+    injected_time_utc: str
+    field: str
+    detail: str
+
+
+@dataclass(frozen=True)
+class GroupVerifyResult:
+    """One (identity_hash, configuration_hash) group. resolved=False: identity or config not supplied."""
+
+    identity_hash: str
+    configuration_hash: str
+    records: int
+    checked: int
+    resolved: bool
+    divergence: Divergence | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.resolved and self.divergence is None
+
+
+@dataclass(frozen=True)
+class ReplayVerifyReport:
+    """All groups in (identity_hash, configuration_hash) order."""
+
+    groups: tuple[GroupVerifyResult, ...]
+
+    @property
+    def records(self) -> int:
+        return sum(g.records for g in self.groups)
+
+    @property
+    def divergent(self) -> tuple[GroupVerifyResult, ...]:
+        return tuple(g for g in self.groups if g.divergence is not None)
+
+    @property
+    def unresolved(self) -> tuple[GroupVerifyResult, ...]:
+        return tuple(g for g in self.groups if not g.resolved)
+
+    @property
+    def ok(self) -> bool:
+        return all(g.ok for g in self.groups)
+
+
+def _verify_group(
+    identity: IdentityCore,
+    natal_positions: dict[str, Any],
+    config: ReplayConfig,
+    entries: Sequence[_Entry],
+    tolerance: float,
+) -> tuple[int, Divergence | None]:
+    """Recompute entries in order; (checked count, first divergence or None)."""
+    ctx = StepContext(identity, config, natal_positions)
+    checked = 0
+    for line, iso, transit_sig, shock, summary, params, axis, memory_sig in entries:
+        checked += 1
+        try:
+            result = ctx.step(datetime.fromisoformat(iso), iso, memory_sig)
+        except _STEP_ERRORS as e:
+            return checked, Divergence(line, iso, "step", str(e))
+        if not replay_match(result.params_final, result.axis_final, params, axis, tolerance):
+            return checked, Divergence(line, iso, "params_final/axis_final", _max_diff(result, params, axis))
+        if result.transit_signature != transit_sig:
+            return checked, Divergence(
+                line, iso, "transit_signature", f"logged {transit_sig}, recomputed {result.transit_signature}"
+            )
+        if result.shock_flag != shock:
+            return checked, Divergence(line, iso, "shock_flag", f"logged {shock}, recomputed {result.shock_flag}")
+        expected = effective_max_delta_summary(result.effective_max_delta)
+        if len(summary) != len(expected) or any(abs(a - b) > tolerance for a, b in zip(summary, expected)):
+            return checked, Divergence(
+                line, iso, "effective_max_delta_summary", f"logged {list(summary)}, recomputed {list(expected)}"
+            )
+    return checked, None
+
+
+def _max_diff(result: Any, params: tuple[float, ...], axis: tuple[float, ...]) -> str:
+    if len(params) != len(result.params_final) or len(axis) != len(result.axis_final):
+        return "length mismatch"
+    diffs = [abs(a - b) for a, b in zip(result.params_final, params)]
+    diffs += [abs(a - b) for a, b in zip(result.axis_final, axis)]
+    return f"max |diff| = {max(diffs):.3e}"
+
+
+def verify_records(
+    records: Iterable[dict[str, Any]],
+    identities: Iterable[tuple[IdentityCore, dict[str, Any]]],
+    configs: Iterable[ReplayConfig],
+    *,
+    workers: int = 1,
+    tolerance: float = REPLAY_TOLERANCE,
+) -> ReplayVerifyReport:
+    """
+    Verify log records (build_record_v2 dicts, in log order) against recomputed steps.
+    identities: (IdentityCore, natal_positions) pairs, matched to records by identity_hash;
+    configs: matched by configuration_hash. Same report for any worker count.
+    Memory: the log is grouped before verification, so one compact tuple per record is held
+    (about 1 KB with the 32 + 8 + 8 floats); split multi-GB logs by identity or time range and verify
+    the parts separately.
+    """
+    by_identity = {identity.identity_hash: (identity, natal) for identity, natal in identities}
+    by_config = {compute_configuration_hash(config): config for config in configs}
+    groups: dict[tuple[str, str], list[_Entry]] = {}
+    for line, record in enumerate(records, start=1):
+        key = (record["identity_hash"], record["configuration_hash"])
+        groups.setdefault(key, []).append((
+            line,
+            record["injected_time_utc"],
+            record["transit_signature"],
+            record["shock_flag"],
+            tuple(record["effective_max_delta_summary"]),
+            tuple(record["params_final"]),
+            tuple(record["axis_final"]),
+            record["memory_signature"],
+        ))
+    keys = sorted(groups)
+    resolved = [k for k in keys if k[0] in by_identity and k[1] in by_config]
+    tasks = [(*by_identity[ih], by_config[ch], groups[(ih, ch)], tolerance) for ih, ch in resolved]
+    if workers <= 1 or len(tasks) <= 1:
+        outcomes = [_verify_group(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=eph.reopen_ephemeris) as pool:
+            outcomes = list(pool.map(_verify_group, *zip(*tasks)))
+    outcome_by_key = dict(zip(resolved, outcomes))
+    results = []
+    for key in keys:
+        outcome = outcome_by_key.get(key)
+        checked, divergence = outcome if outcome is not None else (0, None)
+        results.append(GroupVerifyResult(
+            identity_hash=key[0],
+            configuration_hash=key[1],
+            records=len(groups[key]),
+            checked=checked,
+            resolved=outcome is not None,
+            divergence=divergence,
+        ))
+    return ReplayVerifyReport(groups=tuple(results))
+
+
+def verify_log(
+    path: str | Path,
+    identities: Iterable[tuple[IdentityCore, dict[str, Any]]],
+    configs: Iterable[ReplayConfig],
+    **kwargs: Any,
+) -> ReplayVerifyReport:
+    """verify_records over a v2 log file: JSON Lines or binary columnar (detected by magic)."""
+    from hnh.logging import state_log_binary
+
+    with open(path, "rb") as f:
+        binary = f.read(len(state_log_binary.MAGIC)) == state_log_binary.MAGIC
+    if binary:
+        records: Iterable[dict[str, Any]] = state_log_binary.iter_records(path)
+    else:
+        from hnh.logging.state_log_reader import iter_log_records
+
+        records = iter_log_records(path, validate=True)
+    return verify_records(records, identities, configs, **kwargs)
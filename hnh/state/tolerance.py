@@ -0,0 +1,8 @@
+"""
+Replay tolerance (Spec 002): max abs difference for params_final / axis_final to count as identical.
+Dependency-free so the CLI parser can use it without loading the replay engine.
+"""
+
+from __future__ import annotations
+
+REPLAY_TOLERANCE: float = 1e-9
@@ -19,6 +19,7 @@
   python scripts/009/life_simulation_102y.py --lives 50 --seed 42
   python scripts/009/life_simulation_102y.py --no-scale-delta   # как 008: дельты по полу совпадают
   python scripts/009/life_simulation_102y.py --lives 5 --days 365
+  python scripts/009/life_simulation_102y.py --ephemeris-table /tmp/transits.eph  # транзиты из предрасчитанной таблицы
 """
 
 from __future__ import annotations
@@ -258,6 +259,13 @@ def run() -> None:
     parser.add_argument("--no-astrology", action="store_true", help="Не использовать астрологию (минимальный натал)")
     parser.add_argument("--no-scale-delta", action="store_true", help="Выключить 009 (как 008): sex_transit_mode=off, дельты по полу совпадают")
     parser.add_argument("--days", type=int, default=None, metavar="N", help="Макс. дней на жизнь (быстрый тест)")
+    parser.add_argument(
+        "--ephemeris-table",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Таблица транзитов (hnh.astrology.ephemeris_table); если файла нет — строится на весь диапазон жизней",
+    )
     args = parser.parse_args()
 
     if args.seed is not None:
@@ -283,6 +291,21 @@ def run() -> None:
         sex_transit_config = SexTransitConfig(sex_transit_mode="scale_delta")
         print("009: sex_transit_mode=scale_delta — транзитный отклик по шагам зависит от пола, d_* male ≠ d_* female.", file=sys.stderr)
 
+    if use_astrology and args.ephemeris_table is not None:
+        from hnh.astrology import ephemeris_table as et
+
+        if not args.ephemeris_table.exists():
+            first = min(birth_dates)
+            last = _end_date_for_lifespan(max(birth_dates), LIFESPAN_MAX)
+            hour0, minute0 = TIME_SLOTS[0]
+            print(f"Строим таблицу транзитов {first}..{last} → {args.ephemeris_table}", file=sys.stderr)
+            et.build_ephemeris_table(
+                args.ephemeris_table,
+                datetime(first.year, first.month, first.day, hour0, minute0, tzinfo=timezone.utc),
+                datetime(last.year, last.month, last.day, 23, 59, tzinfo=timezone.utc),
+            )
+        et.load_ephemeris_table(args.ephemeris_table)
+
     config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
 
     header_parts = [
@@ -0,0 +1,67 @@
+"""Tests for simulate_lifecycle: whole-series scan equals day-by-day LifecycleEngine stepping."""
+
+import numpy as np
+import pytest
+
+from hnh.lifecycle.constants import W_TRANSCEND, LifecycleConstants
+from hnh.lifecycle.engine import LifecycleEngine, LifecycleState
+from hnh.lifecycle.trajectory import simulate_lifecycle
+
+
+def _step_engine(stress, R, s_g, c, initial_f=0.0):
+    engine = LifecycleEngine(initial_f=initial_f, constants=c)
+    if engine.state != LifecycleState.ALIVE:
+        return engine, [], 0
+    F = []
+    for t, s in enumerate(stress):
+        r = R[t] if isinstance(R, (list, np.ndarray)) else R
+        engine.update_lifecycle(s, r, s_g=s_g)
+        if engine.state != LifecycleState.ALIVE:
+            return engine, F, t
+        F.append(engine.F)
+    return engine, F, None
+
+
+@pytest.mark.parametrize("l0", [14.0, 2.0])
+def test_simulate_lifecycle_matches_engine(l0: float) -> None:
+    """F bit-identical; death day, W and running sums as in update_lifecycle."""
+    rng = np.random.default_rng(3)
+    stress = rng.uniform(0.0, 1.0, 3000)
+    R = rng.uniform(0.3, 0.6, 3000)
+    c = LifecycleConstants(l0=l0)
+    engine, F, terminal = _step_engine(stress.tolist(), R, 0.6, c)
+    traj = simulate_lifecycle(stress, R, 0.6, c)
+    assert traj.F.tolist() == F
+    assert traj.terminal_day == terminal
+    assert traj.state == engine.state
+    st = engine.step_state()
+    assert traj.count_days == st.count_days
+    assert abs(traj.sum_v - st.sum_v) < 1e-9
+    assert abs(traj.sum_burn - st.sum_burn) < 1e-9
+    assert abs(traj.W - st.W) < 1e-9
+    assert traj.q.shape == traj.A_g.shape == traj.F.shape
+
+
+def test_simulate_lifecycle_alive_and_transcended() -> None:
+    """Low stress: alive over the series; initial W at threshold: transcended on day 0."""
+    stress = np.full(100, 0.05)
+    traj = simulate_lifecycle(stress, 0.5, 0.5)
+    assert traj.state == LifecycleState.ALIVE and traj.terminal_day is None
+    assert traj.count_days == 100
+    assert np.all((traj.A_g >= 0.0) & (traj.A_g <= 1.0))
+    done = simulate_lifecycle(stress, 0.5, 0.5, initial_w=W_TRANSCEND)
+    assert done.state == LifecycleState.TRANSCENDED and done.terminal_day == 0 and done.count_days == 0
+
+
+def test_simulate_lifecycle_initial_f_at_limit() -> None:
+    """
+    L(0.5, 0.5) <= initial_f < L(R, S_g): DISABLED before any step, W not updated
+    (as LifecycleEngine.__init__), although day 0 alone would not reach the limit.
+    """
+    c = LifecycleConstants(l0=2.0)
+    stress = np.full(50, 0.5)
+    engine, _, terminal = _step_engine(stress.tolist(), 0.9, 0.1, c, initial_f=2.5)
+    traj = simulate_lifecycle(stress, 0.9, 0.1, c, initial_f=2.5, initial_w=0.3)
+    assert engine.state == traj.state == LifecycleState.DISABLED
+    assert traj.terminal_day == terminal == 0 and traj.count_days == 0
+    assert traj.W == 0.3 and traj.sum_v == 0.0
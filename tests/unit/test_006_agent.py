@@ -4,7 +4,7 @@ T011: Unit tests for Agent (Spec 006). Creation with/without lifecycle; step(dat
 
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
@@ -64,3 +64,45 @@ def test_agent_zodiac_expression_lazy():
     assert hasattr(zod, "dominant_sign")
     assert hasattr(zod, "dominant_element")
     assert agent.zodiac_expression() is zod  # same instance
+
+
+def test_agent_checkpoint_restore_bit_identical_continuation():
+    """checkpoint() → restore() on a fresh agent continues bit-identically (behavior + lifecycle)."""
+    pytest.importorskip("swisseph")
+    birth_data = {"positions": [{"planet": "Sun", "longitude": 45.0}, {"planet": "Moon", "longitude": 200.0}]}
+    config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+    days = [date(2020, 1, 1) + timedelta(days=k) for k in range(8)]
+    reference = Agent(birth_data, config=config, lifecycle=True)
+    for d in days:
+        reference.step(d)
+    first = Agent(birth_data, config=config, lifecycle=True)
+    for d in days[:4]:
+        first.step(d)
+    blob = first.checkpoint()
+    resumed = Agent(birth_data, config=config, lifecycle=True)
+    resumed.restore(blob)
+    assert resumed.checkpoint() == blob
+    for d in days[4:]:
+        resumed.step(d)
+    assert resumed.behavior.current_vector == reference.behavior.current_vector
+    assert (resumed.lifecycle.F, resumed.lifecycle.W, resumed.lifecycle.state) == (
+        reference.lifecycle.F, reference.lifecycle.W, reference.lifecycle.state
+    )
+    assert resumed.lifecycle.step_state() == reference.lifecycle.step_state()
+
+
+def test_agent_restore_rejects_corrupt_or_foreign_checkpoint():
+    birth_data = {"positions": [{"planet": "Sun", "longitude": 90.0}]}
+    agent = Agent(birth_data)
+    blob = agent.checkpoint()
+    corrupt = bytearray(blob)
+    corrupt[40] ^= 0x01
+    with pytest.raises(ValueError, match="integrity"):
+        agent.restore(bytes(corrupt))
+    other = Agent(birth_data, config=ReplayConfig(global_max_delta=0.1, shock_threshold=0.5, shock_multiplier=1.0))
+    with pytest.raises(ValueError, match="different identity or configuration"):
+        other.restore(blob)
+    with pytest.raises(ValueError, match="lifecycle mode"):
+        Agent(birth_data, lifecycle=True).restore(blob)
+    with pytest.raises(ValueError, match="truncated"):
+        agent.restore(blob[:10])
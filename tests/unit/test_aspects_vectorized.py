@@ -0,0 +1,92 @@
+"""
+Vectorized aspect detection: structured hits + dict adapter reproduce the reference nested loop exactly.
+"""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from hnh.astrology import aspects as asp
+
+
+def _reference_between(positions_a, positions_b, orb_config=None):
+    """Former 10×10×5 nested loop (reference semantics)."""
+    orbs = (orb_config or asp.OrbConfig()).orbs_tuple()
+    out = []
+    for p1 in positions_a:
+        for p2 in positions_b:
+            sep = asp.angular_separation(p1["longitude"], p2["longitude"])
+            for idx, (name, angle) in enumerate(asp.MAJOR_ASPECTS):
+                if angle == 0:
+                    within = sep <= orbs[idx] or (360.0 - sep) <= orbs[idx]
+                else:
+                    within = abs(sep - angle) <= orbs[idx]
+                if within:
+                    out.append({
+                        "planet1": p1["planet"],
+                        "planet2": p2["planet"],
+                        "aspect": name,
+                        "angle": angle,
+                        "separation": round(sep, 6),
+                        "within_orb": True,
+                    })
+    return out
+
+
+def _positions(rng, prefix, n=10):
+    return [{"planet": f"{prefix}{i}", "longitude": rng.uniform(-30.0, 400.0)} for i in range(n)]
+
+
+def test_aspects_between_matches_reference():
+    rng = random.Random(7)
+    for _ in range(50):
+        a = _positions(rng, "a")
+        b = _positions(rng, "b")
+        assert asp.aspects_between(a, b) == _reference_between(a, b)
+
+
+def test_detect_aspects_matches_reference_unique_pairs():
+    rng = random.Random(11)
+    for _ in range(50):
+        pos = _positions(rng, "p")
+        expected = []
+        for i, p1 in enumerate(pos):
+            expected.extend(_reference_between([p1], pos[i + 1 :]))
+        assert asp.detect_aspects(pos) == expected
+
+
+def test_orb_boundary_and_custom_orbs():
+    """Exact orb edge is inclusive; custom OrbConfig honoured."""
+    orb = asp.OrbConfig(square=2.0)
+    a = [{"planet": "Sun", "longitude": 0.0}]
+    b = [{"planet": "Moon", "longitude": 92.0}, {"planet": "Mars", "longitude": 92.5}]
+    assert asp.aspects_between(a, b, orb) == _reference_between(a, b, orb)
+    assert [x["planet2"] for x in asp.aspects_between(a, b, orb)] == ["Moon"]
+
+
+def test_structured_hits_and_adapter():
+    hits = asp.aspects_between_array(np.array([0.0, 100.0]), np.array([181.0, 220.0]))
+    assert hits.dtype == asp.ASPECT_HIT_DTYPE
+    assert hits["aspect"].tolist() == [asp.ASPECT_CODES["Opposition"], asp.ASPECT_CODES["Trine"]]
+    dicts = asp.aspect_hits_to_dicts(hits, ["Sun", "Moon"], ["Mars", "Venus"])
+    assert dicts[0]["planet1"] == "Sun" and dicts[0]["planet2"] == "Mars"
+    assert dicts[1]["aspect"] == "Trine" and dicts[1]["separation"] == 120.0
+
+
+def test_empty_inputs():
+    assert asp.aspects_between([], [{"planet": "Sun", "longitude": 0.0}]) == []
+    assert asp.detect_aspects([]) == []
+
+
+def test_non_numeric_longitude_raises():
+    """None or numeric strings raise TypeError (as the scalar loop did), not NaN / silent conversion."""
+    good = {"planet": "Sun", "longitude": 0.0}
+    for bad in (None, "10.0"):
+        with pytest.raises(TypeError):
+            asp.detect_aspects([good, {"planet": "Moon", "longitude": bad}])
+        with pytest.raises(TypeError):
+            asp.aspects_between([good], [{"planet": "Moon", "longitude": bad}])
+    assert asp.detect_aspects([good, {"planet": "Moon", "longitude": 180}])[0]["aspect"] == "Opposition"
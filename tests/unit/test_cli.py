@@ -96,3 +96,87 @@ def test_cli_agent_step_json_with_lifecycle(capsys: pytest.CaptureFixture[str])
     assert "lifecycle_state" in data
     assert len(data["params_final"]) == 32
     assert len(data["axis_final"]) == 8
+
+
+def test_cli_replay_verify(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    """replay verify: a run-v2 default log reproduces; a tampered one exits 1 with the divergent line."""
+    pytest.importorskip("swisseph")
+    from datetime import datetime, timezone
+
+    from hnh.cli import _default_natal_positions_for_transits
+    from hnh.config.replay_config import ReplayConfig
+    from hnh.identity import IdentityCore as IdentityV2
+    from hnh.identity import registry_scope
+    from hnh.logging.state_logger_v2 import StateLogWriter, record_from_result_v2
+    from hnh.state.replay_v2 import run_step_v2
+
+    with registry_scope():
+        identity = IdentityV2(identity_id="cli-default-v2", base_vector=(0.5,) * 32, sensitivity_vector=(0.5,) * 32)
+        config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+        natal = _default_natal_positions_for_transits()
+        records = [
+            record_from_result_v2(run_step_v2(identity, config, datetime(2024, 1, d, 12, tzinfo=timezone.utc),
+                                              natal_positions=natal))
+            for d in (1, 2, 3)
+        ]
+    log = tmp_path / "ok.jsonl"
+    with StateLogWriter(log) as writer:
+        writer.write_many(records)
+    with patch("sys.argv", ["hnh", "replay", "verify", str(log)]):
+        main()
+    assert "Replay OK" in capsys.readouterr().out
+
+    records[2]["axis_final"][0] += 0.01
+    bad = tmp_path / "bad.jsonl"
+    with StateLogWriter(bad) as writer:
+        writer.write_many(records)
+    with patch("sys.argv", ["hnh", "replay", "verify", str(bad), "--json"]):
+        with pytest.raises(SystemExit) as exc:
+            main()
+    assert exc.value.code == 1
+    data = json.loads(capsys.readouterr().out)
+    assert data["ok"] is False
+    assert data["groups"][0]["divergence"]["line"] == 3
+
+
+def test_cli_import_is_lazy() -> None:
+    """Importing hnh.cli does not load the subcommand stacks (pydantic models, numpy, ephemeris)."""
+    import subprocess
+    import sys
+
+    code = "import sys, hnh.cli; print(sorted(m for m in ('pydantic', 'numpy', 'swisseph') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_cli_profile_import(capsys: pytest.CaptureFixture[str]) -> None:
+    """hnh --profile-import prints per-module import cost to stderr, command output stays on stdout."""
+    from hnh.cli import _parse_importtime
+
+    rows, other = _parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |   orjson.orjson\n"
+        "import time:        50 |        150 | orjson\n"
+        "warning\n"
+    )
+    assert rows == [("orjson.orjson", 100, 100, 1), ("orjson", 50, 150, 0)]
+    assert other == ["warning"]
+
+    with patch("sys.argv", ["hnh", "--profile-import"]):
+        main()
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "hnh.cli" in captured.err
+    assert "total:" in captured.err
+
+
+def test_cli_profile_import_only_as_first_argument(capsys: pytest.CaptureFixture[str]) -> None:
+    """--profile-import is not a parser option: after a command it is rejected; --help documents the form."""
+    with patch("sys.argv", ["hnh", "run", "--date", "2025-02-18", "--profile-import"]):
+        with pytest.raises(SystemExit) as exc:
+            main()
+    assert exc.value.code == 2
+    assert "unrecognized arguments: --profile-import" in capsys.readouterr().err
+    with patch("sys.argv", ["hnh", "--help"]), pytest.raises(SystemExit):
+        main()
+    assert "import [COMMAND ...] (только первым аргументом)" in " ".join(capsys.readouterr().out.split())
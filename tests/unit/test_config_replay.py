@@ -73,3 +73,58 @@ def test_apply_bounds_rejects_wrong_length() -> None:
     config = ReplayConfig(global_max_delta=0.1, shock_threshold=0.8, shock_multiplier=1.5)
     with pytest.raises(ValueError, match="raw_delta length must be 32"):
         apply_bounds((0.1,) * 31, config)
+
+
+def test_compiled_bounds_cached_and_match_hierarchy() -> None:
+    """compiled_bounds resolved once per config; equals resolve_max_delta per param (normal and shock)."""
+    from hnh.identity.schema import NUM_PARAMETERS, get_parameter_axis_index
+
+    c = ReplayConfig(
+        global_max_delta=0.2,
+        shock_threshold=0.8,
+        shock_multiplier=1.5,
+        axis_max_delta=(("emotional_tone", 0.15),),
+        parameter_max_delta=(("warmth", 0.1),),
+    )
+    compiled = c.compiled_bounds
+    assert c.compiled_bounds is compiled
+    for p_ix in range(NUM_PARAMETERS):
+        max_d = resolve_max_delta(p_ix, c, AXES[get_parameter_axis_index(p_ix)])
+        assert compiled.normal[p_ix] == max_d
+        assert compiled.shock[p_ix] == max_d * 1.5
+    assert compiled.effective(True) is compiled.shock
+    assert not compiled.normal_array.flags.writeable
+
+
+def test_apply_bounds_batch_matches_apply_bounds() -> None:
+    """Batch clip (T, 32) equals per-row apply_bounds bit for bit, mixed shock rows."""
+    import numpy as np
+
+    from hnh.identity.schema import NUM_PARAMETERS
+    from hnh.modulation.boundaries import apply_bounds, apply_bounds_batch
+
+    config = ReplayConfig(
+        global_max_delta=0.1,
+        shock_threshold=0.8,
+        shock_multiplier=2.0,
+        axis_max_delta=(("stability_regulation", 0.05),),
+    )
+    raw = np.random.default_rng(3).uniform(-0.3, 0.3, size=(8, NUM_PARAMETERS))
+    shock = np.array([False, True] * 4)
+    bounded, effective = apply_bounds_batch(raw, config, shock)
+    for t in range(8):
+        b, e = apply_bounds(tuple(raw[t].tolist()), config, shock_active=bool(shock[t]))
+        assert bounded[t].tolist() == list(b)
+        assert effective[t].tolist() == list(e)
+
+
+def test_configuration_hash_memoized() -> None:
+    """compute_configuration_hash is cached on the frozen config; equal configs share the digest."""
+    from hnh.config.replay_config import _configuration_hash
+
+    a = ReplayConfig(global_max_delta=0.1, shock_threshold=0.8, shock_multiplier=1.5)
+    b = ReplayConfig(global_max_delta=0.1, shock_threshold=0.8, shock_multiplier=1.5)
+    h = compute_configuration_hash(a)
+    assert compute_configuration_hash(a) is h
+    assert a.configuration_hash is h
+    assert compute_configuration_hash(b) == h == _configuration_hash(a)
@@ -0,0 +1,66 @@
+"""
+Precomputed ephemeris tables: build, memory-mapped lookup, transparent use by compute_transit_signature.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from hnh.astrology import ephemeris as eph
+from hnh.astrology import ephemeris_table as et
+from hnh.astrology import transits as tr
+
+pytest.importorskip("swisseph")
+
+START = datetime(2020, 1, 1, 6, 0, 0, tzinfo=timezone.utc)
+END = datetime(2020, 1, 5, 18, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def table(tmp_path):
+    t = et.build_ephemeris_table(tmp_path / "transits.eph", START, END)
+    yield t
+    et.uninstall_table(t)
+    eph.get_transit_cache().clear()
+
+
+def test_build_covers_grid(table):
+    """06:00/18:00 cadence over 5 days → 10 rows; grid instants covered, off-grid not."""
+    assert table.n_rows == 10
+    assert table.covers(eph.datetime_to_julian_utc(datetime(2020, 1, 3, 18, 0, tzinfo=timezone.utc)))
+    assert not table.covers(eph.datetime_to_julian_utc(datetime(2020, 1, 3, 12, 0, tzinfo=timezone.utc)))
+    assert not table.covers(eph.datetime_to_julian_utc(datetime(2020, 1, 6, 6, 0, tzinfo=timezone.utc)))
+    assert table.verify()
+
+
+def test_lookup_matches_live_ephemeris(table):
+    """Table longitudes are bit-identical to the live cached path."""
+    jd = eph.datetime_to_julian_utc(datetime(2020, 1, 2, 6, 0, tzinfo=timezone.utc))
+    live = tuple(p["longitude"] for p in eph.compute_positions(eph.TransitPositionCache.key(jd)))
+    assert table.lookup(jd) == live
+    assert table.longitudes_block().shape == (10, 10)
+
+
+def test_installed_table_serves_transit_signature(table):
+    """compute_transit_signature uses the table when the instant is covered; output unchanged."""
+    natal = {"positions": [{"planet": "Sun", "longitude": 280.0}, {"planet": "Moon", "longitude": 95.0}]}
+    dt = datetime(2020, 1, 4, 18, 0, tzinfo=timezone.utc)
+    cache = eph.get_transit_cache()
+    cache.clear()
+    without_table = tr.compute_transit_signature(dt, natal)
+    cache.clear()
+    et.install_table(table)
+    with_table = tr.compute_transit_signature(dt, natal)
+    assert with_table == without_table
+    info = cache.info()
+    assert info.table_hits == 1
+    assert info.misses == 0
+
+
+def test_open_rejects_foreign_file(tmp_path):
+    bad = tmp_path / "bad.eph"
+    bad.write_bytes(b"x" * et.HEADER_SIZE)
+    with pytest.raises(ValueError):
+        et.EphemerisTable.open(bad)
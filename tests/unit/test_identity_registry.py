@@ -0,0 +1,90 @@
+"""
+Identity registries: process default keeps ids until evicted; scoped registries are weak and isolated.
+"""
+
+from __future__ import annotations
+
+import gc
+import threading
+
+import pytest
+
+from hnh.core.identity import IdentityCore as CoreIdentity
+from hnh.core.parameters import BehavioralVector
+from hnh.identity import IdentityCore, RegistryScope, evict_identity, registry_scope
+from hnh.identity.schema import NUM_PARAMETERS, _registry
+
+
+def _make(uid: str) -> IdentityCore:
+    return IdentityCore(
+        identity_id=uid,
+        base_vector=(0.5,) * NUM_PARAMETERS,
+        sensitivity_vector=(0.5,) * NUM_PARAMETERS,
+    )
+
+
+def test_default_registry_evict() -> None:
+    _registry.discard("reg-1")
+    _make("reg-1")
+    assert "reg-1" in _registry
+    with pytest.raises(ValueError, match="already exists"):
+        _make("reg-1")
+    assert evict_identity("reg-1")
+    assert "reg-1" not in _registry
+    _make("reg-1")
+    _registry.discard("reg-1")
+
+
+def test_scope_is_weak_and_isolated() -> None:
+    _registry.discard("reg-2")
+    with registry_scope() as scope:
+        core = _make("reg-2")
+        assert "reg-2" in scope.registry("identity")
+        assert "reg-2" not in _registry
+        with pytest.raises(ValueError, match="already exists"):
+            _make("reg-2")
+        del core
+        gc.collect()
+        assert len(scope.registry("identity")) == 0
+        _make("reg-2")  # id free again once the identity was dropped
+    assert "reg-2" not in _registry
+
+
+def test_scope_churn_does_not_grow() -> None:
+    with registry_scope() as scope:
+        for i in range(2000):
+            _make(f"churn-{i}")
+        assert len(scope.registry("identity")._entries) == 0
+
+
+def test_scope_covers_core_identity_and_explicit_evict() -> None:
+    base = BehavioralVector(
+        warmth=0.5, strictness=0.5, verbosity=0.5, correction_rate=0.5,
+        humor_level=0.5, challenge_intensity=0.5, pacing=0.5,
+    )
+    scope = RegistryScope()
+    with scope.activate():
+        kept = CoreIdentity(identity_id="reg-3", base_traits=base)
+        with pytest.raises(ValueError, match="already exists"):
+            CoreIdentity(identity_id="reg-3", base_traits=base)
+        assert evict_identity("reg-3")
+        CoreIdentity(identity_id="reg-3", base_traits=base)
+    assert kept.identity_id == "reg-3"
+
+
+def test_scopes_are_context_local() -> None:
+    seen: list[bool] = []
+
+    def worker() -> None:
+        with registry_scope():
+            keep = _make("reg-4")
+            seen.append("reg-4" in _registry)
+            del keep
+
+    with registry_scope():
+        keep = _make("reg-4")
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        del keep
+    assert seen == [False]
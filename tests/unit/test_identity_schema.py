@@ -228,3 +228,83 @@ def test_personality_axis_model() -> None:
         PersonalityAxis(index=8, name="emotional_tone")
     with pytest.raises(ValueError, match="Unknown axis"):
         PersonalityAxis(index=0, name="invalid_axis")
+
+
+def test_identity_core_hash_memoized() -> None:
+    """identity_hash computed once; not part of model_dump/equality; model_copy(update=...) recomputes."""
+    _registry.clear()
+    core = IdentityCore(
+        identity_id="memo-1",
+        base_vector=_make_base_vector(0.3),
+        sensitivity_vector=_make_sensitivity_vector(0.7),
+    )
+    h = core.identity_hash
+    assert core.identity_hash is h
+    assert "_identity_hash" not in core.model_dump()
+    copied = core.model_copy(update={"base_vector": _make_base_vector(0.9)})
+    assert copied.identity_hash != h
+    plain = core.model_copy()
+    assert plain == core
+    assert plain.identity_hash == h
+    _registry.clear()
+
+
+def test_from_trusted_equivalent_and_frozen() -> None:
+    """from_trusted skips per-element validation; same hash/dump as validated construction; still frozen."""
+    from hnh.identity.schema import IdentityCore as Core
+
+    _registry.clear()
+    base = _make_base_vector(0.25)
+    sens = _make_sensitivity_vector(0.75)
+    trusted = Core.from_trusted("trusted-1", base, sens)
+    validated = Core(identity_id="trusted-2", base_vector=base, sensitivity_vector=sens)
+    assert trusted.model_dump() == {**validated.model_dump(), "identity_id": "trusted-1"}
+    with pytest.raises(ValueError, match="already exists"):
+        Core.from_trusted("trusted-1", base, sens)
+    with pytest.raises(Exception):
+        trusted.base_vector = base  # type: ignore[misc]
+    _registry.clear()
+
+
+def test_from_trusted_coerces_to_float() -> None:
+    """ndarray rows and int vectors are stored as floats; identity_hash equals the validated path."""
+    import numpy as np
+
+    from hnh.identity.schema import IdentityCore as Core
+
+    arr = np.stack([np.full(NUM_PARAMETERS, 0.25), np.full(NUM_PARAMETERS, 0.75)])
+    ints = (1,) * NUM_PARAMETERS
+    zeros = (0,) * NUM_PARAMETERS
+    for base, sens in ((arr[0], arr[1]), (ints, zeros)):
+        _registry.clear()
+        validated = Core(
+            identity_id="coerce", base_vector=tuple(base), sensitivity_vector=tuple(sens)
+        )
+        _registry.clear()
+        trusted = Core.from_trusted("coerce", base, sens)
+        assert all(type(x) is float for x in trusted.base_vector + trusted.sensitivity_vector)
+        assert trusted.base_vector == validated.base_vector
+        assert trusted.identity_hash == validated.identity_hash
+    _registry.clear()
+
+
+def test_load_identities_from_array() -> None:
+    """Bulk load from N×32 arrays; bad shape or out-of-range value rejected."""
+    import numpy as np
+
+    from hnh.identity import load_identities
+
+    _registry.clear()
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0.0, 1.0, size=(3, NUM_PARAMETERS))
+    sens = rng.uniform(0.0, 1.0, size=(3, NUM_PARAMETERS))
+    cores = load_identities(["b0", "b1", "b2"], base, sens)
+    assert [c.identity_id for c in cores] == ["b0", "b1", "b2"]
+    assert cores[1].base_vector == tuple(base[1].tolist())
+    assert all(isinstance(x, float) for x in cores[2].sensitivity_vector)
+    with pytest.raises(ValueError, match="shape"):
+        load_identities(["x"], base, sens)
+    base[0, 5] = 1.5
+    with pytest.raises(ValueError, match=r"base_vectors\[0\]\[5\]"):
+        load_identities(["c0", "c1", "c2"], base, sens)
+    _registry.clear()
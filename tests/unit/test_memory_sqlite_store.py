@@ -0,0 +1,64 @@
+"""
+SQLiteRelationalMemoryStore: batched persistence, materialized counters/signature, lazy history load.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hnh.memory.relational import RelationalMemory
+from hnh.memory.sqlite_store import SQLiteRelationalMemoryStore
+
+
+def _events(n: int):
+    return [(i, "error" if i % 4 == 0 else "interaction", {"i": i} if i % 3 == 0 else None) for i in range(n)]
+
+
+def test_store_matches_in_memory(tmp_path) -> None:
+    reference = RelationalMemory("u1")
+    with SQLiteRelationalMemoryStore(tmp_path / "mem.db", batch_size=7) as store:
+        for seq, t, payload in _events(30):
+            reference.add_event(seq, t, payload)
+            store.add_event("u1", seq, t, payload)
+            assert store.memory_signature("u1") == reference.memory_signature()
+        assert store.get_memory_delta_32("u1", 0.15) == reference.get_memory_delta_32(0.15)
+        assert store.get_behavioral_modifier("u1") == reference.get_behavioral_modifier()
+        assert store.get("u1").events == reference.events
+
+
+def test_reopen_without_history_load(tmp_path) -> None:
+    path = tmp_path / "mem.db"
+    reference = RelationalMemory("u2")
+    with SQLiteRelationalMemoryStore(path) as store:
+        for seq, t, payload in _events(12):
+            reference.add_event(seq, t, payload)
+            store.add_event("u2", seq, t, payload)
+        store.add_event("u3", 1, "interaction")
+    with SQLiteRelationalMemoryStore(path, hot_users=1) as store:
+        assert store.derived_metrics("u2") == reference.derived_metrics()
+        assert store.memory_signature("u2") == reference.memory_signature()
+        # counters only: history not loaded until get()
+        assert store._hot["u2"].memory is None
+        store.add_event("u2", 99, "interaction")
+        reference.add_event(99, "interaction")
+        store.add_event("u3", 2, "error")  # evicts dirty u2 → flushed
+        assert store.get("u2").events == reference.events
+        assert store.user_ids() == ["u2", "u3"]
+
+
+def test_corrupt_history_detected(tmp_path) -> None:
+    path = tmp_path / "mem.db"
+    with SQLiteRelationalMemoryStore(path) as store:
+        store.add_event("u4", 1, "interaction")
+        store.add_event("u4", 2, "interaction")
+        store.flush()
+        store._conn.execute("UPDATE memory_events SET type = 'error' WHERE user_id = 'u4' AND idx = 1")
+        store._conn.commit()
+    with SQLiteRelationalMemoryStore(path) as store:
+        with pytest.raises(ValueError, match="memory_signature"):
+            store.get("u4")
+
+
+def test_rejects_bad_batch_size(tmp_path) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        SQLiteRelationalMemoryStore(tmp_path / "x.db", batch_size=0)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from hnh.identity.schema import AXES, NUM_PARAMETERS, PARAMETERS, get_parameter_axis_index
 from hnh.modulation.delta import (
     PHASE_WINDOW_DAYS_BY_CATEGORY,
+    aspect_param_tensor,
+    compile_aspect_weights,
     compute_raw_delta_32,
     compute_raw_delta_32_by_category,
 )
@@ -167,3 +169,35 @@ def test_planet_does_not_move_unrelated_axes_unless_mapped() -> None:
     for i, v in enumerate(vec):
         if i not in allowed:
             assert v == 0.0
+
+
+def test_compiled_weights_cached_by_identity() -> None:
+    """Same weights object compiles once; an equal but distinct dict compiles separately."""
+    custom = {"Trine": {"warmth": 0.1}}
+    assert compile_aspect_weights(custom) is compile_aspect_weights(custom)
+    assert compile_aspect_weights(None) is compile_aspect_weights(None)
+    assert compile_aspect_weights({"Trine": {"warmth": 0.1}}) is not compile_aspect_weights(custom)
+
+
+def test_compiled_tensor_matches_dict_path() -> None:
+    """Tensor row × intensity equals compute_raw_delta_32 for a single aspect."""
+    aspect = {"planet1": "Saturn", "planet2": "Moon", "aspect": "Square", "angle": 90.0, "separation": 92.0}
+    vec = compute_raw_delta_32([aspect])
+    row = aspect_param_tensor(["Saturn"], ["Moon"])[0, 0, 3]  # Square is MAJOR_ASPECTS[3]
+    intensity = 1.0 - 2.0 / 8.0
+    for i in range(NUM_PARAMETERS):
+        assert abs(vec[i] - row[i] * intensity) < 1e-12
+
+
+def test_unmapped_and_missing_planets() -> None:
+    """Unmapped planet names fall back to the other planet's axes; no planet info → all weights apply."""
+    unmapped = compute_raw_delta_32(
+        [{"planet1": "Chiron", "planet2": "Moon", "aspect": "Trine", "angle": 120.0, "separation": 120.0}]
+    )
+    assert {i for i, v in enumerate(unmapped) if v} <= _axis_indices("emotional_tone")
+    both_unmapped = compute_raw_delta_32(
+        [{"planet1": "Chiron", "planet2": "", "aspect": "Trine", "angle": 120.0, "separation": 120.0}]
+    )
+    assert all(v == 0.0 for v in both_unmapped)
+    no_planets = compute_raw_delta_32([{"aspect": "Trine", "angle": 120.0, "separation": 120.0}])
+    assert no_planets[PARAMETERS.index("planning_bias")] > 0.0
@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import hashlib
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from hnh.astrology import aspects as asp
@@ -167,3 +168,65 @@ def test_natal_positions_structure():
         assert "sign" in p and 0 <= p["sign"] <= 11
         assert "house" in p and 1 <= p["house"] <= 12
         assert "angular_strength" in p and 0 <= p["angular_strength"] <= 1
+
+
+# --- Batch natal builder (cohorts) ---
+
+
+def _cohort(n: int) -> tuple[list[datetime], list[float], list[float]]:
+    base = datetime(1950, 1, 1, tzinfo=timezone.utc)
+    dts = [base + timedelta(days=397 * i, seconds=7919 * i, microseconds=131 * i) for i in range(n)]
+    lats = [-60.0 + (i * 17.3) % 120.0 for i in range(n)]
+    lons = [-180.0 + (i * 41.7) % 360.0 for i in range(n)]
+    return dts, lats, lons
+
+
+def test_julian_days_utc_matches_swe_julday():
+    """Vectorized JD is bit-identical to datetime_to_julian_utc."""
+    pytest.importorskip("swisseph")
+    dts, _, _ = _cohort(50)
+    dts.append(datetime(2000, 2, 29, 23, 59, 59, 999999))  # naive = UTC
+    jd = natal.julian_days_utc(dts)
+    expected = [eph.datetime_to_julian_utc(d if d.tzinfo else d.replace(tzinfo=timezone.utc)) for d in dts]
+    assert jd.tolist() == expected
+
+
+def test_build_natal_positions_many_matches_single():
+    """Each row of the natal table equals build_natal_positions for the same birth."""
+    pytest.importorskip("swisseph")
+    dts, lats, lons = _cohort(40)
+    table = natal.build_natal_positions_many(dts, lats, lons, chunk_size=16)
+    assert len(table) == 40
+    assert table.longitudes.shape == (40, 10) and table.houses.shape == (40, 10)
+    for i in range(40):
+        assert table.natal_positions(i) == natal.build_natal_positions(dts[i], lats[i], lons[i])
+    assert table.aspect_offsets[-1] == len(table.aspects)
+    assert (table.aspects["row"][:-1] <= table.aspects["row"][1:]).all()
+    whole = natal.build_natal_positions_many(dts, lats, lons, chunk_size=40)
+    assert np.array_equal(whole.aspects, table.aspects)
+    assert np.array_equal(whole.aspect_offsets, table.aspect_offsets)
+    assert np.array_equal(whole.houses, table.houses)
+
+
+def test_build_natal_positions_many_workers_identical():
+    """Same table for any worker count."""
+    pytest.importorskip("swisseph")
+    dts, lats, lons = _cohort(30)
+    one = natal.build_natal_positions_many(dts, lats, lons, chunk_size=8)
+    many = natal.build_natal_positions_many(dts, lats, lons, workers=2, chunk_size=8)
+    assert np.array_equal(one.longitudes, many.longitudes)
+    assert np.array_equal(one.cusps, many.cusps)
+    assert np.array_equal(one.aspects, many.aspects)
+
+
+def test_build_natal_positions_many_validation():
+    """Invalid location reports the row; length mismatch raises ValueError."""
+    pytest.importorskip("swisseph")
+    dts, lats, lons = _cohort(3)
+    lats[2] = 91.0
+    with pytest.raises(ValueError, match="row 2: Latitude"):
+        natal.build_natal_positions_many(dts, lats, lons)
+    with pytest.raises(ValueError, match="Length mismatch"):
+        natal.build_natal_positions_many(dts, lats[:2], lons)
+    empty = natal.build_natal_positions_many([], [], [])
+    assert len(empty) == 0 and empty.aspect_offsets.tolist() == [0]
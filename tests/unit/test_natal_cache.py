@@ -0,0 +1,82 @@
+"""
+Natal chart cache: canonical birth-data digest, LRU in memory, optional disk persistence.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hnh.astrology.natal_cache import NatalChartCache, birth_data_digest, get_natal_cache
+from hnh.astrology.natal_chart import NatalChart
+
+BIRTH_A = {"datetime_utc": "1990-06-15T12:30:00Z", "lat": 55.75, "lon": 37.62}
+BIRTH_B = {"positions": [{"planet": "Sun", "longitude": 10.0, "house": 1}, {"planet": "Moon", "longitude": 100.0}]}
+
+
+def _build(birth_data: dict) -> NatalChart:
+    return NatalChart.from_birth_data(birth_data, use_cache=False)
+
+
+def test_digest_ignores_non_chart_fields_and_datetime_form():
+    """sex / sex_mode do not change the key; same instant in any form gives the same key."""
+    d = birth_data_digest(BIRTH_A)
+    assert d is not None and len(d) == 16
+    assert birth_data_digest({**BIRTH_A, "sex": "female", "sex_mode": "explicit"}) == d
+    aware = datetime(1990, 6, 15, 15, 30, tzinfo=timezone(timedelta(hours=3)))
+    assert birth_data_digest({**BIRTH_A, "datetime_utc": aware}) == d
+    assert birth_data_digest({**BIRTH_A, "lat": 55.76}) != d
+    assert birth_data_digest({"lat": 1.0, "lon": 2.0}) is None
+
+
+def test_cache_hit_returns_same_chart_and_evicts_lru():
+    cache = NatalChartCache(maxsize=1)
+    first = cache.get_or_build(BIRTH_B, _build)
+    assert cache.get_or_build({**BIRTH_B, "sex": "male"}, _build) is first
+    cache.get_or_build({"positions": [{"planet": "Sun", "longitude": 20.0}]}, _build)
+    assert cache.get_or_build(BIRTH_B, _build) is not first
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 1)
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    """A fresh cache over the same directory loads an equal chart without rebuilding."""
+    pytest.importorskip("swisseph")
+    NatalChartCache(directory=tmp_path).get_or_build(BIRTH_A, _build)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def fail(_: dict) -> NatalChart:
+        raise AssertionError("chart rebuilt despite disk cache")
+
+    cache = NatalChartCache(directory=tmp_path)
+    loaded = cache.get_or_build(BIRTH_A, fail)
+    fresh = _build(BIRTH_A)
+    assert loaded.planets == fresh.planets
+    assert loaded.aspects == fresh.aspects
+    assert loaded.to_natal_data() == fresh.to_natal_data()
+    assert cache.info().disk_hits == 1
+
+
+def test_corrupt_disk_entry_is_rebuilt(tmp_path):
+    cache = NatalChartCache(directory=tmp_path)
+    cache.get_or_build(BIRTH_B, _build)
+    (path,) = tmp_path.glob("*.json")
+    path.write_bytes(b"{not json")
+    fresh = NatalChartCache(directory=tmp_path)
+    chart = fresh.get_or_build(BIRTH_B, _build)
+    assert chart.planets == _build(BIRTH_B).planets
+    assert fresh.info().misses == 1
+    assert NatalChartCache(directory=tmp_path).get_or_build(BIRTH_B, _build).planets == chart.planets
+
+
+def test_agent_construction_uses_natal_cache():
+    """Agents for the same birth data (male / female) share one cached NatalChart."""
+    from hnh.agent import Agent
+
+    get_natal_cache().clear()
+    male = Agent({**BIRTH_B, "sex": "male"})
+    female = Agent({**BIRTH_B, "sex": "female"})
+    assert male.natal is female.natal
+    assert get_natal_cache().info().hits >= 1
+    assert male.natal == NatalChart.from_birth_data(BIRTH_B, use_cache=False)
@@ -0,0 +1,73 @@
+"""
+AgentPopulation: vectorized step over N agents matches per-agent Agent.step() within replay tolerance.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from hnh.agent import Agent
+from hnh.config.replay_config import ReplayConfig
+from hnh.config.sex_transit_config import SexTransitConfig
+from hnh.identity.schema import NUM_AXES, NUM_PARAMETERS
+from hnh.lifecycle.engine import aggregate_axis
+from hnh.population import AgentPopulation
+from hnh.state.replay_v2 import REPLAY_TOLERANCE
+
+pytest.importorskip("swisseph")
+
+_BIRTH_DATA = [
+    {"positions": [{"planet": "Sun", "longitude": 90.0}, {"planet": "Moon", "longitude": 120.0}], "sex": "male"},
+    {"positions": [{"planet": "Sun", "longitude": 90.0}, {"planet": "Moon", "longitude": 120.0}], "sex": "female"},
+    {
+        "positions": [
+            {"planet": "Sun", "longitude": 281.5},
+            {"planet": "Venus", "longitude": 12.0},
+            {"planet": "Mars", "longitude": 200.25},
+            {"planet": "Pluto", "longitude": 227.0},
+        ],
+    },
+    {"positions": [{"planet": "Moon", "longitude": 359.5}]},
+]
+
+
+@pytest.mark.parametrize("sex_transit_config", [None, SexTransitConfig(sex_transit_mode="scale_delta")])
+def test_population_matches_agents(sex_transit_config) -> None:
+    config = ReplayConfig(global_max_delta=0.05, shock_threshold=0.1, shock_multiplier=1.5)
+    population = AgentPopulation(_BIRTH_DATA, config=config, sex_transit_config=sex_transit_config)
+    agents = [
+        Agent(bd, config=config, lifecycle=False, sex_transit_config=sex_transit_config) for bd in _BIRTH_DATA
+    ]
+    assert np.array_equal(population.base_vectors, np.array([a.behavior.base_vector for a in agents]))
+    for day in range(10):
+        d = date(2021, 3, 1) + timedelta(days=3 * day)
+        result = population.step(d)
+        for i, agent in enumerate(agents):
+            expected = agent.step(d)
+            assert result[i].sex == expected.sex
+            assert result[i].sex_polarity_E == expected.sex_polarity_E
+            assert np.allclose(
+                population.current_vectors[i], agent.behavior.current_vector, rtol=0, atol=REPLAY_TOLERANCE
+            )
+            assert np.allclose(
+                population.axis_vectors()[i], aggregate_axis(agent.behavior.current_vector),
+                rtol=0, atol=REPLAY_TOLERANCE,
+            )
+    assert population.current_vectors.shape == (len(_BIRTH_DATA), NUM_PARAMETERS)
+    assert population.axis_vectors().shape == (len(_BIRTH_DATA), NUM_AXES)
+    assert len(result) == len(_BIRTH_DATA)
+
+
+def test_population_rejects_mismatched_identity_configs() -> None:
+    with pytest.raises(ValueError, match="identity_configs length"):
+        AgentPopulation(_BIRTH_DATA, identity_configs=[])
+
+
+def test_population_state_read_only() -> None:
+    population = AgentPopulation(_BIRTH_DATA[:1])
+    with pytest.raises(ValueError):
+        population.current_vectors[0, 0] = 1.0
+    assert population.current_vector(0) == tuple(population.base_vectors[0].tolist())
@@ -7,7 +7,7 @@ from __future__ import annotations
 import pytest
 
 from hnh.memory.relational import RelationalMemory
-from hnh.memory.update_rules import compute_derived, compute_behavioral_modifier
+from hnh.memory.update_rules import compute_behavioral_modifier, compute_derived
 
 
 def test_same_history_same_derived():
@@ -117,3 +117,83 @@ def test_memory_signature_different_events_different_hash():
     mem1.add_event(1, "interaction")
     mem2.add_event(1, "error")
     assert mem1.memory_signature() != mem2.memory_signature()
+
+
+def test_running_counters_match_full_scan():
+    """Incremental derived/modifier/memory_delta equal the full-history update rules."""
+    from hnh.memory.update_rules import (
+        compute_behavioral_modifier,
+        compute_derived,
+        compute_memory_delta_32,
+    )
+
+    mem = RelationalMemory("user-inc")
+    for i in range(50):
+        mem.add_event(i, "error" if i % 7 == 0 else "interaction", {"i": i})
+        events = mem.events
+        assert mem.derived_metrics() == compute_derived(events)
+        assert mem.get_behavioral_modifier() == compute_behavioral_modifier(events)
+        assert mem.get_memory_delta_32(0.15) == compute_memory_delta_32(events, 0.15)
+
+
+def test_memory_signature_is_chained():
+    """Signature depends on user_id, order and payload; equals the chain over events."""
+    from hnh.memory.relational import chain_signature, signature_seed
+
+    a = RelationalMemory("u")
+    b = RelationalMemory("u")
+    a.add_event(1, "interaction", {"k": 1})
+    a.add_event(2, "error")
+    b.add_event(2, "error")
+    b.add_event(1, "interaction", {"k": 1})
+    assert a.memory_signature() != b.memory_signature()
+    digest = signature_seed("u")
+    for event in a.events:
+        digest = chain_signature(digest, event)
+    assert a.memory_signature() == digest.hex()
+    assert RelationalMemory("v").memory_signature() != RelationalMemory("u").memory_signature()
+
+
+def test_snapshot_columns_round_trip():
+    """snapshot_columns: compact columns, local type dictionary; from_columns restores events and signature."""
+    from array import array
+
+    mem = RelationalMemory("user-cols")
+    mem.add_event(5, "interaction")
+    mem.add_event(6, "error", {"code": 3})
+    mem.add_event(7, "interaction")
+    cols = mem.snapshot_columns()
+    assert cols["types"] == ("interaction", "error")
+    assert cols["sequence"] == array("q", [5, 6, 7])
+    assert list(cols["type_code"]) == [0, 1, 0]
+    assert list(cols["payload_index"]) == [1]
+    assert cols["payloads"] == [{"code": 3}]
+    restored = RelationalMemory.from_columns(cols)
+    assert restored.events == mem.events
+    assert restored.memory_signature() == mem.memory_signature()
+    assert restored.derived_metrics() == mem.derived_metrics()
+    cols["signature"] = "0" * 32
+    with pytest.raises(ValueError, match="signature"):
+        RelationalMemory.from_columns(cols)
+
+
+def test_events_built_on_read():
+    mem = RelationalMemory("user-read")
+    mem.add_event(1, "interaction")
+    first = mem.events
+    first[0]["payload"]["x"] = 1
+    assert mem.events[0]["payload"] == {}
+    assert len(mem) == 1
+
+
+def test_payload_copied_at_add_event():
+    """Mutating the caller's payload after add_event changes neither events nor signature."""
+    mem = RelationalMemory("user-copy")
+    payload = {"code": 3, "tags": ["a"]}
+    mem.add_event(1, "error", payload)
+    signature = mem.memory_signature()
+    payload["code"] = 4
+    payload["tags"].append("b")
+    assert mem.events[0]["payload"] == {"code": 3, "tags": ["a"]}
+    restored = RelationalMemory.from_columns(mem.snapshot_columns())
+    assert restored.memory_signature() == mem.memory_signature() == signature
@@ -177,3 +177,99 @@ def test_run_step_v2_phase_blending_and_daily_transit_effect() -> None:
     # So r_with_history has more influence from fake → different from r_no_history unless daily was already ~fake
     assert r_with_history.params_final is not None
     _registry.discard("r7")
+
+
+def test_step_context_reused_and_matches_agent() -> None:
+    """Simple path: one cached StepContext per (identity, natal, config); output equals Agent.step() bit for bit."""
+    pytest.importorskip("swisseph")
+    from datetime import timedelta
+
+    from hnh.agent import Agent
+    from hnh.lifecycle.engine import aggregate_axis
+    from hnh.state.replay_v2 import get_step_context
+
+    identity = _make_identity("ctx-1")
+    config = _make_config()
+    natal = {"positions": [
+        {"planet": "Sun", "longitude": 90.0},
+        {"planet": "Moon", "longitude": 200.5},
+        {"planet": "Mars", "longitude": 14.25},
+    ]}
+    ctx = get_step_context(identity, config, natal)
+    assert get_step_context(identity, config, natal) is ctx
+    for day in range(5):
+        dt = datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc) + timedelta(days=7 * day)
+        result = run_step_v2(identity, config, dt, natal_positions=natal)
+        agent = Agent(dict(natal), config=config, lifecycle=False, identity_config=identity)
+        agent.step(dt)
+        assert result.params_final == agent.behavior.current_vector
+        assert result.axis_final == aggregate_axis(agent.behavior.current_vector)
+        assert result == ctx.step(dt, dt.isoformat())
+    _registry.discard("ctx-1")
+
+
+def test_step_context_cache_does_not_pin_identity() -> None:
+    """A cached StepContext holds its identity weakly: in a weak registry scope the identity is released."""
+    import gc
+    import weakref
+
+    from hnh.identity import registry_scope
+    from hnh.state import replay_v2
+
+    natal = {"positions": [{"planet": "Sun", "longitude": 90.0}]}
+    with registry_scope():
+        identity = IdentityCore(
+            identity_id="ctx-weak", base_vector=(0.5,) * NUM_PARAMETERS, sensitivity_vector=(0.5,) * NUM_PARAMETERS
+        )
+        run_step_v2(identity, _make_config(), datetime(2024, 1, 1, 12, tzinfo=timezone.utc), natal_positions=natal)
+        key = (id(identity), id(natal), _make_config())
+        assert key in replay_v2._step_contexts
+        ref = weakref.ref(identity)
+        del identity
+        gc.collect()
+        assert ref() is None
+        assert key not in replay_v2._step_contexts
+
+
+def test_step_context_cache_thread_safe() -> None:
+    """Concurrent lookups past _STEP_CONTEXTS_MAX neither raise nor exceed the bound."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from hnh.identity import registry_scope
+    from hnh.state import replay_v2
+
+    config = _make_config()
+    natal = {"positions": [{"planet": "Sun", "longitude": 90.0}]}
+    with registry_scope():
+        identities = [
+            IdentityCore(
+                identity_id=f"ctx-thread-{i}",
+                base_vector=(0.5,) * NUM_PARAMETERS,
+                sensitivity_vector=(0.5,) * NUM_PARAMETERS,
+            )
+            for i in range(4 * replay_v2._STEP_CONTEXTS_MAX)
+        ]
+
+        def lookup(identity: IdentityCore) -> bool:
+            ctx = replay_v2.get_step_context(identity, config, natal)
+            return ctx.identity_hash == identity.identity_hash
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lookup, identities * 4))
+        assert len(replay_v2._step_contexts) <= replay_v2._STEP_CONTEXTS_MAX
+
+
+def test_step_context_natal_position_without_planet_matches_agent() -> None:
+    """A natal position without "planet" reads as "" (as NatalChart does) instead of raising KeyError."""
+    pytest.importorskip("swisseph")
+    from hnh.agent import Agent
+
+    identity = _make_identity("ctx-noname")
+    config = _make_config()
+    natal = {"positions": [{"planet": "Sun", "longitude": 90.0}, {"longitude": 200.5}]}
+    dt = datetime(2024, 3, 1, 6, 0, tzinfo=timezone.utc)
+    result = run_step_v2(identity, config, dt, natal_positions=natal)
+    agent = Agent(dict(natal), config=config, lifecycle=False, identity_config=identity)
+    agent.step(dt)
+    assert result.params_final == agent.behavior.current_vector
+    _registry.discard("ctx-noname")
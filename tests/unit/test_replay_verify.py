@@ -0,0 +1,123 @@
+"""
+Replay verify engine: recompute v2 log records per (identity, config) group; first divergence reported.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hnh.config.replay_config import ReplayConfig
+from hnh.identity import registry_scope
+from hnh.identity.schema import NUM_PARAMETERS, IdentityCore
+from hnh.logging.state_log_binary import write_records_binary
+from hnh.logging.state_logger_v2 import StateLogWriter, record_from_result_v2
+from hnh.state.replay_v2 import run_step_v2
+from hnh.state.replay_verify import verify_log, verify_records
+
+pytest.importorskip("swisseph")
+
+
+def _natal() -> dict:
+    from hnh.core.natal import build_natal_positions
+
+    return build_natal_positions(datetime(1990, 5, 1, 8, 0, tzinfo=timezone.utc), 55.75, 37.62)
+
+
+def _setup(n_identities: int = 2, steps: int = 6):
+    config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+    natal = _natal()
+    identities = [
+        (
+            IdentityCore(
+                identity_id=f"verify-{k}",
+                base_vector=(0.3 + 0.05 * k,) * NUM_PARAMETERS,
+                sensitivity_vector=(0.5,) * NUM_PARAMETERS,
+            ),
+            natal,
+        )
+        for k in range(n_identities)
+    ]
+    records = []
+    t0 = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+    for d in range(steps):
+        for identity, nat in identities:
+            result = run_step_v2(identity, config, t0 + timedelta(days=d), natal_positions=nat, memory_signature="m")
+            records.append(record_from_result_v2(result))
+    return config, identities, records
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_verify_records_clean_log(workers: int) -> None:
+    with registry_scope():
+        config, identities, records = _setup()
+        report = verify_records(records, identities, [config], workers=workers)
+    assert report.ok
+    assert report.records == len(records)
+    assert [g.checked for g in report.groups] == [6, 6]
+
+
+def test_verify_reports_first_divergence_and_unresolved() -> None:
+    """Tampered record → first divergence with its log line; unknown config → unresolved group."""
+    with registry_scope():
+        config, identities, records = _setup()
+        records[5]["params_final"][3] += 1e-6
+        records[9]["shock_flag"] = not records[9]["shock_flag"]
+        records.append({**records[0], "configuration_hash": "unknown"})
+        report = verify_records(records, identities, [config])
+    assert not report.ok
+    (diverged,) = report.divergent
+    assert diverged.identity_hash == identities[1][0].identity_hash
+    assert diverged.divergence.line == 6
+    assert diverged.divergence.field == "params_final/axis_final"
+    assert diverged.checked == 3
+    (unresolved,) = report.unresolved
+    assert unresolved.configuration_hash == "unknown" and unresolved.records == 1
+
+
+def test_verify_log_jsonl_and_binary(tmp_path) -> None:
+    with registry_scope():
+        config, identities, records = _setup(n_identities=1, steps=4)
+        jsonl = tmp_path / "log.jsonl"
+        with StateLogWriter(jsonl) as writer:
+            writer.write_many(records)
+        binary = tmp_path / "log.bin"
+        write_records_binary(binary, records)
+        assert verify_log(jsonl, identities, [config]).ok
+        assert verify_log(binary, identities, [config]).ok
+
+
+def test_verify_records_workers_after_parent_used_ephemeris() -> None:
+    """Workers forked after the parent read the ephemeris reopen the files (no 'damaged' .se1 errors)."""
+    from hnh.astrology.ephemeris import get_transit_cache
+
+    with registry_scope():
+        config, identities, records = _setup(n_identities=8, steps=0)
+        t0 = datetime(1920, 1, 1, 12, tzinfo=timezone.utc)
+        for d in range(300):  # decades apart: concurrent workers seek all over the .se1 files
+            for k, (identity, nat) in enumerate(identities):
+                when = t0 + timedelta(days=53 * d + 7 * k)
+                records.append(record_from_result_v2(run_step_v2(identity, config, when, natal_positions=nat)))
+        get_transit_cache().clear()  # workers must read the ephemeris, not the inherited cache
+        report = verify_records(records, identities, [config], workers=8)
+    assert report.ok, [g.divergence for g in report.divergent]
+
+
+def test_verify_step_ephemeris_error_is_group_divergence(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An ephemeris error in one group is reported as that group's divergence, not raised."""
+    import swisseph
+
+    from hnh.state import replay_v2
+
+    with registry_scope():
+        config, identities, records = _setup()
+
+        def broken(self, *args, **kwargs):
+            raise swisseph.Error("Ephemeris file semo_18.se1 is damaged (2)")
+
+        monkeypatch.setattr(replay_v2.StepContext, "step", broken)
+        report = verify_records(records, identities, [config])
+    assert not report.ok
+    assert [g.divergence.field for g in report.groups] == ["step", "step"]
+    assert "damaged" in report.groups[0].divergence.detail
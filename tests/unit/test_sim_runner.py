@@ -0,0 +1,101 @@
+"""
+hnh.sim runner: deterministic sharding, merged orjson output byte-identical for any worker count.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import orjson
+import pytest
+
+from hnh.config.replay_config import ReplayConfig
+from hnh.sim import LifeSpec, run_lives, simulate_life, write_lives
+
+pytest.importorskip("swisseph")
+
+CONFIG = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+
+
+def _specs(n: int = 5) -> list[LifeSpec]:
+    specs = []
+    for i in range(n):
+        start = date(1990, 1, 1) + timedelta(days=97 * i)
+        birth_data = {
+            "positions": [
+                {"planet": "Sun", "longitude": (37.0 * i) % 360.0},
+                {"planet": "Moon", "longitude": (211.0 + 13.0 * i) % 360.0},
+            ],
+            "sex": "male" if i % 2 == 0 else "female",
+        }
+        specs.append(LifeSpec(life_index=i, birth_data=birth_data, start=start, end=start + timedelta(days=2)))
+    return specs
+
+
+def test_merged_output_identical_across_worker_counts(tmp_path) -> None:
+    specs = _specs()
+    serial = b"".join(run_lives(specs, CONFIG, workers=1, shard_size=2))
+    parallel = b"".join(run_lives(specs, CONFIG, workers=3, shard_size=2))
+    assert parallel == serial
+    assert write_lives(tmp_path / "lives.jsonl", specs, CONFIG, workers=2) == len(specs)
+    assert (tmp_path / "lives.jsonl").read_bytes() == serial
+
+
+def test_lines_in_spec_order_and_match_simulate_life() -> None:
+    specs = _specs(3)
+    lines = list(run_lives(specs, CONFIG))
+    records = [orjson.loads(line) for line in lines]
+    assert [r["life_index"] for r in records] == [0, 1, 2]
+    assert records[0]["steps"] == 6
+    expected = simulate_life(specs[1], CONFIG)
+    assert records[1]["end_params"] == list(expected["end_params"])
+
+
+def test_rejects_bad_shard_size() -> None:
+    with pytest.raises(ValueError, match="shard_size"):
+        list(run_lives(_specs(1), CONFIG, shard_size=0))
+
+
+def test_life_resumes_from_checkpoint(tmp_path) -> None:
+    """A life interrupted after 2 days resumes from its checkpoint with an identical result."""
+    from dataclasses import replace
+
+    spec = replace(_specs(1)[0], checkpoint_dir=str(tmp_path), checkpoint_every_days=1)
+    interrupted = replace(spec, end=spec.start + timedelta(days=1))
+    simulate_life(interrupted, CONFIG)
+    assert orjson.loads(spec.checkpoint_path.read_bytes())["steps"] == 4
+    resumed = simulate_life(spec, CONFIG)
+    assert resumed == simulate_life(_specs(1)[0], CONFIG)
+    assert simulate_life(spec, CONFIG) == resumed  # fully resumed: no step left to run
+
+
+def _ephemeris_life(spec: LifeSpec, config: ReplayConfig, sex_transit_config: object) -> dict:
+    """life_fn reading the ephemeris directly: 3000 instants spread over three centuries."""
+    from hnh.astrology import ephemeris as eph
+
+    jd0 = 2415020.5 + 3.7 * spec.life_index
+    return {"life_index": spec.life_index, "lons": [eph._calc_longitudes(jd0 + 36.5 * k) for k in range(3000)]}
+
+
+def test_workers_reopen_ephemeris_after_parent_read() -> None:
+    """Workers forked after the parent opened the .se1 files must not share their file offsets."""
+    specs = _specs(8)
+    expected = [orjson.dumps(_ephemeris_life(s, CONFIG, None), option=orjson.OPT_SORT_KEYS) + b"\n" for s in specs]
+    lines = list(run_lives(specs, CONFIG, workers=8, shard_size=1, life_fn=_ephemeris_life))
+    assert lines == expected
+
+
+def test_serial_run_scopes_ephemeris_table(tmp_path) -> None:
+    """workers=1 attaches the table only while the lives run; the caller's transit cache is restored."""
+    from datetime import datetime, timezone
+
+    from hnh.astrology import ephemeris as eph
+    from hnh.astrology import ephemeris_table as et
+
+    path = tmp_path / "transits.eph"
+    et.build_ephemeris_table(path, datetime(1990, 1, 1, tzinfo=timezone.utc), datetime(1990, 1, 10, tzinfo=timezone.utc))
+    cache = eph.get_transit_cache()
+    before = cache._tables
+    lines = list(run_lives(_specs(2), CONFIG, ephemeris_table=path))
+    assert lines == list(run_lives(_specs(2), CONFIG))
+    assert cache._tables == before
@@ -0,0 +1,85 @@
+"""
+Parameter sweep engine: precomputed series reused across points; rows match Agent stepping.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from hnh.config.replay_config import ReplayConfig
+from hnh.config.sex_transit_config import SexTransitConfig
+from hnh.lifecycle.constants import LifecycleConstants
+from hnh.sim.sweep import (
+    SweepSettings,
+    evaluate_natal,
+    grid_design,
+    precompute_series,
+    random_design,
+    resolve_point,
+    run_sweep,
+)
+
+pytest.importorskip("swisseph")
+
+CONFIG = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+BIRTH = [
+    {"positions": [{"planet": "Sun", "longitude": 10.0}, {"planet": "Moon", "longitude": 100.0}], "sex": "male"},
+    {"positions": [{"planet": "Sun", "longitude": 200.0}, {"planet": "Mars", "longitude": 290.0}], "sex": "female"},
+]
+DATES = [date(2021, 3, 1) + timedelta(days=k) for k in range(20)]
+
+
+def test_evaluate_natal_matches_agent() -> None:
+    """Sweep metrics for one point equal an Agent(lifecycle=True) run over the same dates."""
+    from hnh.agent import Agent
+    from hnh.lifecycle.engine import aggregate_axis
+
+    stc = SexTransitConfig(sex_transit_mode="scale_delta")
+    constants = LifecycleConstants(l0=0.005, lambda_down=0.0)  # die within the range
+    series = precompute_series(BIRTH[:1], DATES, CONFIG)[0]
+    row = evaluate_natal(series, CONFIG, constants, stc)
+
+    agent = Agent(BIRTH[0], config=CONFIG, lifecycle=True, sex_transit_config=stc)
+    agent.lifecycle._constants = constants
+    axes = []
+    for d in DATES:
+        agent.step(d)
+        axes.append(aggregate_axis(agent.behavior.current_vector))
+    delta = np.array(axes[-1]) - np.array(axes[0])
+    assert [row[f"delta_axis_{a}"] for a in range(8)] == pytest.approx(delta.tolist(), abs=1e-9)
+    assert row["lifecycle_state"] == agent.lifecycle.state.value == "DISABLED"
+    assert row["final_F"] == pytest.approx(agent.lifecycle.F, abs=1e-9)
+    assert row["final_W"] == pytest.approx(agent.lifecycle.W, abs=1e-9)
+
+
+def test_designs_and_resolution() -> None:
+    grid = grid_design({"l0": [10.0, 14.0], "global_max_delta": [0.1, 0.15, 0.2]})
+    assert len(grid) == 6 and grid[1] == {"l0": 10.0, "global_max_delta": 0.15}
+    rand = random_design({"lambda_up": (0.005, 0.02)}, 4, seed=1)
+    assert rand == random_design({"lambda_up": (0.005, 0.02)}, 4, seed=1)
+    config, constants, stc = resolve_point(
+        {"l0": 9.0, "shock_threshold": 0.5, "sex_transit_beta": 0.1}, CONFIG, LifecycleConstants(), None
+    )
+    assert (constants.l0, config.shock_threshold, stc.sex_transit_beta) == (9.0, 0.5, 0.1)
+    with pytest.raises(ValueError, match="Unknown sweep field"):
+        grid_design({"no_such_field": [1]})
+
+
+def test_run_sweep_same_rows_any_workers(tmp_path) -> None:
+    series = precompute_series(BIRTH, DATES, CONFIG)
+    points = grid_design({"l0": [0.005, 14.0], "global_max_delta": [0.1, 0.2]})
+    settings = SweepSettings(config=CONFIG)
+    serial = run_sweep(series, points, settings, points_per_task=1)
+    parallel = run_sweep(series, points, settings, workers=2, points_per_task=1)
+    assert len(serial) == 8
+    for name in serial.column_names:
+        assert serial.columns[name].tolist() == parallel.columns[name].tolist()
+    assert serial.columns["l0"].tolist() == [0.005] * 4 + [14.0] * 4
+    serial.write_csv(tmp_path / "sweep.csv")
+    header = (tmp_path / "sweep.csv").read_text().splitlines()[0].split(",")
+    assert header[:4] == ["point_index", "natal_index", "l0", "global_max_delta"]
+    serial.write_npz(tmp_path / "sweep.npz")
+    assert np.load(tmp_path / "sweep.npz")["final_W"].shape == (8,)
@@ -0,0 +1,85 @@
+"""
+Binary columnar state log: exact float64 round trip, chunking, checksums, block API.
+"""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pytest
+
+from hnh.identity.schema import NUM_AXES, NUM_PARAMETERS
+from hnh.logging.state_log_binary import (
+    BinaryStateLogWriter,
+    iter_blocks,
+    iter_records,
+    write_records_binary,
+)
+from hnh.logging.state_logger_v2 import build_record_v2, emit_line_v2
+
+
+def _records(n: int, debug_from: int | None = None) -> list[dict]:
+    rng = np.random.default_rng(7)
+    out = []
+    for i in range(n):
+        debug = {}
+        if debug_from is not None and i >= debug_from:
+            debug = {"raw_delta": tuple(rng.uniform(-0.1, 0.1, NUM_PARAMETERS).tolist())}
+        out.append(build_record_v2(
+            identity_hash=f"ih{i % 3}",
+            configuration_hash="cfg",
+            injected_time_utc=f"2025-01-01T{i % 24:02d}:00:00+00:00",
+            transit_signature=f"ts{i}",
+            shock_flag=i % 5 == 0,
+            effective_max_delta_summary_8=tuple(rng.uniform(0, 0.2, NUM_AXES).tolist()),
+            axis_final=tuple(rng.uniform(0, 1, NUM_AXES).tolist()),
+            params_final=tuple(rng.uniform(0, 1, NUM_PARAMETERS).tolist()),
+            memory_signature="m",
+            **debug,
+        ))
+    return out
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_binary_log_roundtrip_exact(compress: bool) -> None:
+    """float64: records read back equal to the written ones (incl. optional fields, chunk boundaries)."""
+    records = _records(25, debug_from=12)
+    buf = io.BytesIO()
+    assert write_records_binary(buf, records, chunk_records=5, compress=compress) == 25
+    buf.seek(0)
+    assert list(iter_records(buf)) == records
+    buf.seek(0)
+    blocks = list(iter_blocks(buf))
+    assert sum(len(b) for b in blocks) == 25
+    assert all(len(b) <= 5 for b in blocks)
+    assert "raw_delta" in blocks[-1].optional and "raw_delta" not in blocks[0].optional
+    assert blocks[0].params_final.shape == (len(blocks[0]), NUM_PARAMETERS)
+
+
+def test_binary_log_smaller_than_jsonl() -> None:
+    """Columnar float32 is several times smaller than JSON Lines."""
+    records = _records(200)
+    jsonl = sum(len(emit_line_v2(r)) + 1 for r in records)
+    buf = io.BytesIO()
+    write_records_binary(buf, records, float_dtype="float32")
+    assert buf.tell() * 4 < jsonl
+    buf.seek(0)
+    got = next(iter_blocks(buf))
+    assert got.params_final.dtype == np.float32
+    np.testing.assert_allclose(got.params_final, [r["params_final"] for r in records], atol=1e-6)
+
+
+def test_binary_log_checksum_and_schema_errors(tmp_path) -> None:
+    """Corrupted payload → checksum error; unknown fields and bad magic rejected."""
+    path = tmp_path / "log.bin"
+    write_records_binary(path, _records(4))
+    data = bytearray(path.read_bytes())
+    data[-3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        list(iter_records(path))
+    with pytest.raises(ValueError, match="bad magic"):
+        list(iter_records(io.BytesIO(b"x" * 32)))
+    with BinaryStateLogWriter(io.BytesIO()) as writer, pytest.raises(ValueError, match="Unsupported fields"):
+        writer.write({**_records(1)[0], "extra": 1})
@@ -0,0 +1,81 @@
+"""
+Streaming/parallel v2 log reader: newline-aligned ranges, stats independent of chunking and workers.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hnh.identity.schema import NUM_AXES, NUM_PARAMETERS
+from hnh.logging.state_log_reader import iter_log_records, split_ranges, validate_log
+from hnh.logging.state_logger_v2 import StateLogWriter, build_record_v2
+
+
+def _write_log(path, n: int) -> list[dict]:
+    records = [
+        build_record_v2(
+            identity_hash=f"id{i % 3}",
+            configuration_hash="cfg",
+            injected_time_utc=f"2025-02-18T{i % 24:02d}:00:00+00:00",
+            transit_signature=f"ts{i}",
+            shock_flag=False,
+            effective_max_delta_summary_8=(0.1,) * NUM_AXES,
+            axis_final=(0.5,) * NUM_AXES,
+            params_final=(0.5,) * NUM_PARAMETERS,
+            memory_signature="m",
+        )
+        for i in range(n)
+    ]
+    with StateLogWriter(path) as writer:
+        writer.write_many(records)
+    return records
+
+
+def test_split_ranges_newline_aligned(tmp_path) -> None:
+    """Ranges cover the file exactly and end on newlines."""
+    path = tmp_path / "log.jsonl"
+    _write_log(path, 40)
+    data = path.read_bytes()
+    ranges = split_ranges(path, chunk_bytes=1000)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(data[end - 1 : end] == b"\n" for _, end in ranges)
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert split_ranges(empty) == []
+
+
+def test_iter_log_records_streams_in_order(tmp_path) -> None:
+    path = tmp_path / "log.jsonl"
+    records = _write_log(path, 30)
+    assert list(iter_log_records(path, validate=True, chunk_bytes=700)) == records
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_log_stats(tmp_path, workers: int) -> None:
+    """Invalid lines counted with file line numbers; per-identity counts over valid records."""
+    path = tmp_path / "log.jsonl"
+    _write_log(path, 30)
+    with open(path, "ab") as f:
+        f.write(b'{"identity_hash": "id0"}\n')
+        f.write(b"not json\n")
+    stats = validate_log(path, workers=workers, chunk_bytes=1500)
+    assert stats.records == 30 and stats.invalid == 2 and stats.lines == 32
+    assert not stats.ok
+    assert stats.per_identity == {"id0": 10, "id1": 10, "id2": 10}
+    assert [line for line, _ in stats.errors] == [31, 32]
+    assert "Missing required field" in stats.errors[0][1]
+    with pytest.raises(ValueError, match="line 31"):
+        list(iter_log_records(path, validate=True))
+
+
+def test_validate_log_counts_non_string_identity_hash(tmp_path) -> None:
+    """A schema-valid record with a non-string identity_hash is invalid, not a crash."""
+    import orjson
+
+    path = tmp_path / "log.jsonl"
+    (record,) = _write_log(path, 1)
+    path.write_bytes(orjson.dumps({**record, "identity_hash": ["x"]}) + b"\n")
+    stats = validate_log(path)
+    assert stats.invalid == 1 and stats.records == 0
+    assert "identity_hash" in stats.errors[0][1]
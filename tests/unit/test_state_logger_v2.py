@@ -197,3 +197,78 @@ def test_write_record_v2_roundtrip() -> None:
     assert parsed["identity_hash"] == "id1"
     assert parsed["configuration_hash"] == "cfg1"
     assert parsed["memory_signature"] == "mem1"
+
+
+def _demo_records(n: int) -> list[dict]:
+    return [
+        build_record_v2(
+            identity_hash=f"id{i % 2}",
+            configuration_hash="cfg",
+            injected_time_utc=f"2025-02-18T{i % 24:02d}:00:00+00:00",
+            transit_signature=f"ts{i}",
+            shock_flag=i % 3 == 0,
+            effective_max_delta_summary_8=(0.1 + i * 1e-3,) * NUM_AXES,
+            axis_final=(0.5,) * NUM_AXES,
+            params_final=(0.25 + i * 1e-4,) * NUM_PARAMETERS,
+            memory_signature="m",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_state_log_writer_matches_per_line_writer(background: bool) -> None:
+    """Buffered (and background) writer output is byte-identical to write_record_v2 per record."""
+    from hnh.logging.state_logger_v2 import StateLogWriter
+
+    records = _demo_records(50)
+    expected = io.StringIO()
+    for r in records:
+        write_record_v2(r, expected)
+    buf = io.BytesIO()
+    with StateLogWriter(buf, flush_bytes=1024, background=background) as writer:
+        writer.write_many(records)
+    assert buf.getvalue() == expected.getvalue().encode("utf-8")
+
+
+def test_state_log_writer_accepts_replay_result() -> None:
+    """ReplayResult is logged as build_record_v2 with effective_max_delta summarized per axis."""
+    from hnh.logging.state_logger_v2 import StateLogWriter, record_from_result_v2
+    from hnh.state.replay_v2 import ReplayResult
+
+    result = ReplayResult(
+        params_final=(0.5,) * NUM_PARAMETERS,
+        axis_final=(0.5,) * NUM_AXES,
+        identity_hash="ih",
+        configuration_hash="ch",
+        injected_time_utc="2025-02-18T12:00:00+00:00",
+        transit_signature="ts",
+        shock_flag=False,
+        effective_max_delta=(0.15,) * NUM_PARAMETERS,
+        memory_signature="ms",
+        daily_transit_effect=(0.0,) * NUM_PARAMETERS,
+    )
+    buf = io.BytesIO()
+    with StateLogWriter(buf) as writer:
+        writer.write(result)
+    parsed = parse_line_v2(buf.getvalue())
+    validate_record_v2(parsed)
+    assert parsed == record_from_result_v2(result)
+    assert parsed["effective_max_delta_summary"] == [0.15] * NUM_AXES
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_state_log_writer_rejects_use_after_close(background: bool) -> None:
+    """write()/flush() after close() raise instead of losing records (or blocking on a dead thread)."""
+    from hnh.logging.state_logger_v2 import StateLogWriter
+
+    buf = io.BytesIO()
+    writer = StateLogWriter(buf, flush_bytes=1, background=background)
+    writer.write_many(_demo_records(2))
+    writer.close()
+    writer.close()  # idempotent
+    with pytest.raises(ValueError, match="closed StateLogWriter"):
+        writer.write(_demo_records(1)[0])
+    with pytest.raises(ValueError, match="closed StateLogWriter"):
+        writer.flush()
+    assert buf.getvalue().count(b"\n") == 2
@@ -0,0 +1,65 @@
+"""
+TransitEngine.states(dates): batch transit arrays match per-date state() within replay tolerance.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from hnh.astrology.natal_chart import NatalChart
+from hnh.astrology.transit_state import TransitState
+from hnh.astrology.transits import TransitEngine
+from hnh.config.replay_config import ReplayConfig
+from hnh.identity.schema import NUM_PARAMETERS
+from hnh.state.replay_v2 import REPLAY_TOLERANCE
+
+pytest.importorskip("swisseph")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    natal = NatalChart.from_birth_data({
+        "datetime_utc": datetime(1990, 6, 15, 12, 0, 0, tzinfo=timezone.utc),
+        "lat": 55.75,
+        "lon": 37.62,
+    })
+    return TransitEngine(natal)
+
+
+def test_states_shapes(engine):
+    config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+    dates = [date(2020, 1, 1) + timedelta(days=i) for i in range(30)]
+    batch = engine.states(dates, config)
+    assert len(batch) == 30
+    assert batch.stress.shape == (30,)
+    assert batch.raw_delta.shape == (30, NUM_PARAMETERS)
+    assert batch.bounded_delta.shape == (30, NUM_PARAMETERS)
+    assert isinstance(batch[0], TransitState)
+
+
+def test_states_match_state(engine):
+    """Each row equals state(date) within REPLAY_TOLERANCE, including shock-scaled bounds."""
+    config = ReplayConfig(
+        global_max_delta=0.02,
+        shock_threshold=0.03,
+        shock_multiplier=1.5,
+        axis_max_delta=(("emotional_tone", 0.01),),
+        parameter_max_delta=(("warmth", 0.005),),
+    )
+    dates = [datetime(2021, 3, 1, 6, 0, tzinfo=timezone.utc) + timedelta(hours=12 * i) for i in range(60)]
+    batch = engine.states(dates, config)
+    for t, d in enumerate(dates):
+        single = engine.state(d, config)
+        assert abs(batch.stress[t] - single.stress) <= REPLAY_TOLERANCE
+        assert np.allclose(batch.raw_delta[t], single.raw_delta, rtol=0, atol=REPLAY_TOLERANCE)
+        assert np.allclose(batch.bounded_delta[t], single.bounded_delta, rtol=0, atol=REPLAY_TOLERANCE)
+
+
+def test_states_empty(engine):
+    config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+    batch = engine.states([], config)
+    assert len(batch) == 0
+    assert batch.raw_delta.shape == (0, NUM_PARAMETERS)
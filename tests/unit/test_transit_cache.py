@@ -0,0 +1,81 @@
+"""
+Shared transit ephemeris cache: LRU by rounded JD, hit/miss counters, shared by TransitEngine instances.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from hnh.astrology import ephemeris as eph
+
+pytest.importorskip("swisseph")
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    cache = eph.get_transit_cache()
+    cache.clear()
+    yield
+    cache.resize(eph.TRANSIT_CACHE_MAXSIZE)
+    cache.clear()
+
+
+def test_cached_positions_match_direct_computation():
+    """Cached positions equal compute_positions at the same JD."""
+    jd = eph.datetime_to_julian_utc(datetime(2020, 1, 10, 18, 0, 0, tzinfo=timezone.utc))
+    assert eph.compute_transit_positions(jd) == eph.compute_positions(jd)
+
+
+def test_hit_miss_counters():
+    """First call is a miss, repeated JD is a hit."""
+    cache = eph.get_transit_cache()
+    jd = 2451545.0
+    eph.compute_transit_positions(jd)
+    eph.compute_transit_positions(jd)
+    eph.compute_transit_positions(jd + 1e-12)  # same rounded key
+    info = cache.info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_returned_positions_are_fresh_objects():
+    """Mutating a returned position does not corrupt the cache."""
+    jd = 2451545.0
+    first = eph.compute_transit_positions(jd)
+    first[0]["longitude"] = -1.0
+    assert eph.compute_transit_positions(jd)[0]["longitude"] != -1.0
+
+
+def test_lru_eviction_respects_maxsize():
+    """Oldest entry is evicted when the cache is full."""
+    cache = eph.get_transit_cache()
+    cache.resize(2)
+    for jd in (2451545.0, 2451546.0, 2451547.0):
+        eph.compute_transit_positions(jd)
+    assert cache.info().currsize == 2
+    eph.compute_transit_positions(2451545.0)
+    assert cache.info().misses == 4
+
+
+def test_transit_engines_share_cache():
+    """Two TransitEngine instances on the same date pay for one ephemeris evaluation."""
+    from hnh.astrology.natal_chart import NatalChart
+    from hnh.astrology.transits import TransitEngine
+    from hnh.config.replay_config import ReplayConfig
+
+    config = ReplayConfig(global_max_delta=0.15, shock_threshold=0.8, shock_multiplier=1.5)
+    a = TransitEngine(NatalChart.from_birth_data({"positions": [{"planet": "Sun", "longitude": 10.0}]}))
+    b = TransitEngine(NatalChart.from_birth_data({"positions": [{"planet": "Moon", "longitude": 200.0}]}))
+    a.state(date(2024, 3, 1), config)
+    b.state(date(2024, 3, 1), config)
+    info = eph.get_transit_cache().info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_negative_maxsize_rejected():
+    with pytest.raises(ValueError):
+        eph.TransitPositionCache(maxsize=-1)